@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Benchmarks de desempenho do projeto.
+
+Uso:
+    python benchmark.py imports [--budget-ms 300]
+    python benchmark.py synthetic [--races 200] [--laps 66]
+    python benchmark.py steady-state [--runs 10] [--target-gap 0.001]
+"""
+
+import sys
+import os
+import argparse
+import contextlib
+import io
+import subprocess
+import time
+
+# Módulos do caminho de simulação/otimização (devem depender apenas do NumPy)
+CORE_MODULES = [
+    'src.race_model',
+    'src.race_simulator',
+    'src.genetic_algorithm',
+    'src.ant_colony',
+    'src.dynamic_programming',
+    'src.monte_carlo'
+]
+
+# Dependências pesadas que só podem ser carregadas sob demanda
+HEAVY_MODULES = ['pandas', 'fastf1', 'scipy', 'sklearn', 'matplotlib', 'seaborn']
+
+# Orçamento padrão de tempo de importação do núcleo (milissegundos)
+IMPORT_BUDGET_MS = 300.0
+
+
+def measure_import_time(modules, repeats: int = 5):
+    """
+    Mede o tempo de importação de módulos com `python -X importtime`.
+    
+    Cada repetição roda em um processo novo; o menor tempo é reportado.
+    
+    Args:
+        modules: Lista de módulos importados
+        repeats: Número de repetições
+    
+    Returns:
+        Tupla (tempo total em ms, dicionário {módulo: tempo acumulado em ms})
+    """
+    project_dir = os.path.dirname(os.path.abspath(__file__))
+    command = [sys.executable, '-X', 'importtime', '-c', f"import {', '.join(modules)}"]
+    
+    best_total = float('inf')
+    best_modules = {}
+    
+    for _ in range(repeats):
+        result = subprocess.run(command, cwd=project_dir, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"Falha ao importar módulos: {result.stderr.strip().splitlines()[-1]}")
+        
+        imported = {}
+        total_us = 0
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            _, cumulative, name = line[len('import time:'):].split('|')
+            imported[name.strip()] = int(cumulative) / 1000.0
+            
+            # Apenas importações de nível superior entram no total
+            if not name.startswith('  '):
+                total_us += int(cumulative)
+        
+        if total_us / 1000.0 < best_total:
+            best_total = total_us / 1000.0
+            best_modules = imported
+    
+    return best_total, best_modules
+
+
+def benchmark_imports(budget_ms: float = IMPORT_BUDGET_MS) -> bool:
+    """
+    Verifica o tempo de importação do núcleo e a ausência de dependências pesadas.
+    
+    Args:
+        budget_ms: Orçamento de tempo de importação em milissegundos
+    
+    Returns:
+        True se o núcleo respeita o orçamento
+    """
+    print("⏱️ Tempo de importação do núcleo (src)")
+    print("=" * 50)
+    
+    total_ms, imported = measure_import_time(CORE_MODULES)
+    numpy_ms = imported.get('numpy', 0.0)
+    
+    for module in CORE_MODULES:
+        print(f"   {module}: {imported.get(module, 0.0):.1f}ms")
+    print(f"   numpy: {numpy_ms:.1f}ms")
+    print(f"   Total: {total_ms:.1f}ms (orçamento: {budget_ms:.0f}ms)")
+    
+    heavy = [m for m in HEAVY_MODULES if m in imported]
+    passed = True
+    
+    if heavy:
+        print(f"❌ Dependências pesadas importadas pelo núcleo: {heavy}")
+        passed = False
+    
+    if total_ms > budget_ms:
+        print(f"❌ Tempo de importação acima do orçamento: {total_ms:.1f}ms > {budget_ms:.0f}ms")
+        passed = False
+    
+    if passed:
+        print("✅ Núcleo dentro do orçamento de importação")
+    
+    return passed
+
+
+def benchmark_synthetic(n_races: int = 200, total_laps: int = 66) -> bool:
+    """
+    Mede geração, pré-processamento e ajuste do grid em corridas sintéticas
+    (sem acesso à rede).
+    
+    Args:
+        n_races: Número de corridas geradas
+        total_laps: Número de voltas de cada corrida
+    
+    Returns:
+        True se todas as corridas produziram simuladores
+    """
+    from src.data_handler import DataHandler
+    from src.synthetic_data import SyntheticRaceSource
+    
+    print(f"🧪 Corridas sintéticas ({n_races} corridas, {total_laps} voltas)")
+    print("=" * 50)
+    
+    source = SyntheticRaceSource(total_laps=total_laps)
+    data_handler = DataHandler(source=source)
+    
+    start = time.perf_counter()
+    n_laps = 0
+    n_simulators = 0
+    failed = 0
+    for race_name in source.race_names(n_races):
+        # Avisos de validação e tempos de carga de cada corrida são omitidos
+        with contextlib.redirect_stdout(io.StringIO()):
+            n_laps += len(data_handler.get_session_laps(2024, race_name))
+            simulators = data_handler.get_grid_simulators(2024, race_name)
+        n_simulators += len(simulators)
+        failed += not simulators
+        
+        # Liberar a corrida da memória
+        data_handler._session_laps.pop((2024, race_name), None)
+    elapsed = time.perf_counter() - start
+    
+    print(f"   Voltas precisas: {n_laps}")
+    print(f"   Simuladores: {n_simulators}")
+    print(f"   Tempo total: {elapsed:.2f}s ({n_races / elapsed:.0f} corridas/s)")
+    
+    if failed:
+        print(f"❌ {failed} corridas sem simuladores")
+        return False
+    
+    print("✅ Corridas sintéticas processadas")
+    return True
+
+
+def evaluations_to_target(fitness_history, evaluation_history, target_time: float):
+    """
+    Avaliações consumidas até o melhor tempo atingir target_time.
+    
+    Returns:
+        Número de avaliações ou None se o alvo não foi atingido
+    """
+    for best_fitness, evaluations in zip(fitness_history, evaluation_history):
+        if best_fitness > 0 and 1.0 / best_fitness <= target_time:
+            return evaluations
+    return None
+
+
+def benchmark_steady_state(n_runs: int = 10, target_gap: float = 0.001,
+                           population_size: int = 50, generations: int = 100) -> bool:
+    """
+    Compara o GA geracional e o steady-state em avaliações até a qualidade
+    alvo (gap até o ótimo do DP) em uma corrida sintética.
+    
+    Args:
+        n_runs: Execuções (sementes) por motor
+        target_gap: Gap alvo até o ótimo (%)
+        population_size: Tamanho da população
+        generations: Número de gerações (mesmo orçamento para os dois motores)
+    
+    Returns:
+        True se os dois motores atingiram o alvo em pelo menos uma execução
+    """
+    import numpy as np
+    from src.data_handler import DataHandler
+    from src.synthetic_data import SyntheticRaceSource
+    from src.race_simulator import RaceSimulator
+    from src.dynamic_programming import DynamicProgrammingSolver
+    from src.genetic_algorithm import create_genetic_algorithm
+    
+    print(f"🧬 GA geracional vs steady-state ({n_runs} execuções, alvo: gap ≤ {target_gap}%)")
+    print("=" * 50)
+    
+    source = SyntheticRaceSource()
+    with contextlib.redirect_stdout(io.StringIO()):
+        race_data = DataHandler(source=source).get_race_data(2024, source.race_names(1)[0], 'VER')
+        simulator = RaceSimulator(race_data)
+        min_pit_lap, max_pit_lap = simulator.compile().pit_window()
+        optimal_time = DynamicProgrammingSolver(simulator, min_pit_lap=min_pit_lap,
+                                                max_pit_lap=max_pit_lap).run().total_time
+    target_time = optimal_time * (1 + target_gap / 100)
+    print(f"   Ótimo (DP): {optimal_time:.2f}s, alvo: {target_time:.2f}s")
+    
+    passed = True
+    for engine in ('object', 'steady_state'):
+        reached = []
+        gaps = []
+        run_times = []
+        for seed in range(n_runs):
+            ga = create_genetic_algorithm(simulator, engine, population_size=population_size,
+                                          generations=generations, seed=seed)
+            
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                best = ga.run()
+            run_times.append(time.perf_counter() - start)
+            
+            gaps.append((1.0 / best.fitness - optimal_time) / optimal_time * 100)
+            evaluations = evaluations_to_target(ga.get_fitness_history(), ga.evaluation_history, target_time)
+            if evaluations is not None:
+                reached.append(evaluations)
+        
+        median = f"{np.median(reached):.0f}" if reached else "-"
+        print(f"   {engine}: alvo em {len(reached)}/{n_runs} execuções, "
+              f"avaliações até o alvo (mediana): {median}, "
+              f"gap médio: {np.mean(gaps):.3f}%, tempo médio: {np.mean(run_times):.2f}s")
+        passed = passed and bool(reached)
+    
+    if passed:
+        print("✅ Os dois motores atingiram a qualidade alvo")
+    else:
+        print("❌ Algum motor não atingiu a qualidade alvo")
+    return passed
+
+
+def main():
+    """
+    Função principal.
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks de desempenho")
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+    
+    imports_parser = subparsers.add_parser('imports', help="Tempo de importação do núcleo")
+    imports_parser.add_argument('--budget-ms', type=float, default=IMPORT_BUDGET_MS,
+                                help="Orçamento de tempo de importação (ms)")
+    
+    synthetic_parser = subparsers.add_parser('synthetic', help="Carga e ajuste de corridas sintéticas")
+    synthetic_parser.add_argument('--races', type=int, default=200, help="Número de corridas")
+    synthetic_parser.add_argument('--laps', type=int, default=66, help="Voltas por corrida")
+    
+    steady_state_parser = subparsers.add_parser('steady-state', help="GA geracional vs steady-state")
+    steady_state_parser.add_argument('--runs', type=int, default=10, help="Execuções por motor")
+    steady_state_parser.add_argument('--target-gap', type=float, default=0.001, help="Gap alvo até o ótimo (%%)")
+    steady_state_parser.add_argument('--population', type=int, default=50, help="Tamanho da população")
+    steady_state_parser.add_argument('--generations', type=int, default=100, help="Número de gerações")
+    
+    args = parser.parse_args()
+    
+    if args.benchmark == 'imports':
+        passed = benchmark_imports(args.budget_ms)
+        sys.exit(0 if passed else 1)
+    
+    if args.benchmark == 'synthetic':
+        passed = benchmark_synthetic(args.races, args.laps)
+        sys.exit(0 if passed else 1)
+    
+    if args.benchmark == 'steady-state':
+        passed = benchmark_steady_state(args.runs, args.target_gap, args.population, args.generations)
+        sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
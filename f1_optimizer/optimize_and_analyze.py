@@ -13,6 +13,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.parameter_optimizer import optimize_ga_parameters, optimize_aco_parameters
 from src.statistical_analyzer import run_statistical_study
+from src.stopping_criteria import StoppingCriteria
 
 
 def create_results_directory():
@@ -24,12 +25,14 @@ def create_results_directory():
         print("📁 Diretório 'results' criado")
 
 
-def load_optimized_params(scenario):
+def load_optimized_params(scenario, engine='object', seed=None):
     """
     Carrega parâmetros otimizados se existirem, senão otimiza.
     
     Args:
         scenario: Dicionário com cenário
+        engine: Motor do GA ('object', 'array', 'island' ou 'steady_state')
+        seed: Semente do ajuste de parâmetros
         
     Returns:
         Tupla com parâmetros otimizados (ga_params, aco_params)
@@ -63,18 +66,24 @@ def load_optimized_params(scenario):
     # Otimizar se necessário
     if ga_params is None:
         print("\n🔧 Otimizando parâmetros do Algoritmo Genético...")
-        ga_params = optimize_ga_parameters(scenario)
+        ga_params = optimize_ga_parameters(scenario, engine, seed=seed)
     
     if aco_params is None:
         print("\n🔧 Otimizando parâmetros do Algoritmo ACO...")
-        aco_params = optimize_aco_parameters(scenario)
+        aco_params = optimize_aco_parameters(scenario, seed=seed)
     
     return ga_params, aco_params
 
 
-def main():
+def main(engine='object', n_workers=1, stopping_criteria=None, seed=None):
     """
     Função principal para executar otimização e análise estatística.
+    
+    Args:
+        engine: Motor do GA ('object', 'array', 'island' ou 'steady_state')
+        n_workers: Processos para avaliação paralela
+        stopping_criteria: Critérios de parada antecipada (StoppingCriteria)
+        seed: Semente (execuções reproduzíveis com qualquer número de processos)
     """
     print("🎯 Iniciando Otimização de Parâmetros e Análise Estatística")
     print("=" * 60)
@@ -93,7 +102,7 @@ def main():
     print()
     
     # Carregar ou otimizar parâmetros
-    ga_params, aco_params = load_optimized_params(scenario)
+    ga_params, aco_params = load_optimized_params(scenario, engine, seed)
     
     if not ga_params or not aco_params:
         print("❌ Erro: Não foi possível obter parâmetros otimizados")
@@ -112,7 +121,8 @@ def main():
         # Executar com 30 execuções por algoritmo (pode ser reduzido para testes)
         n_executions = 30  # Reduzir para 10-15 se demorar muito
         
-        report = run_statistical_study(scenario, ga_params, aco_params, n_executions)
+        report = run_statistical_study(scenario, ga_params, aco_params, n_executions, engine, n_workers,
+                                       stopping_criteria, seed)
         
         # Exibir resumo dos resultados
         if 'summary' in report:
@@ -126,11 +136,13 @@ def main():
             print(f"   Tempo médio: {summary['ga_performance']['mean_time']:.2f}s")
             print(f"   Desvio padrão: {summary['ga_performance']['std_time']:.2f}s")
             print(f"   CV: {summary['ga_performance']['cv_time']:.2f}%")
+            print(f"   Avaliações até convergir: {summary['ga_performance']['mean_evaluations_to_convergence']:.0f}")
             print()
             print("📊 Performance ACO:")
             print(f"   Tempo médio: {summary['aco_performance']['mean_time']:.2f}s")
             print(f"   Desvio padrão: {summary['aco_performance']['std_time']:.2f}s")
             print(f"   CV: {summary['aco_performance']['cv_time']:.2f}%")
+            print(f"   Avaliações até convergir: {summary['aco_performance']['mean_evaluations_to_convergence']:.0f}")
         
         if 'recommendations' in report:
             print("\n💡 RECOMENDAÇÕES")
@@ -158,9 +170,15 @@ def main():
         traceback.print_exc()
 
 
-def run_quick_test():
+def run_quick_test(engine='object', n_workers=1, stopping_criteria=None, seed=None):
     """
     Executa teste rápido com menos execuções para verificação.
+    
+    Args:
+        engine: Motor do GA ('object', 'array', 'island' ou 'steady_state')
+        n_workers: Processos para avaliação paralela
+        stopping_criteria: Critérios de parada antecipada (StoppingCriteria)
+        seed: Semente (execuções reproduzíveis com qualquer número de processos)
     """
     print("🧪 Executando Teste Rápido...")
     
@@ -188,7 +206,9 @@ def run_quick_test():
     }
     
     # Executar com apenas 5 execuções por algoritmo
-    report = run_statistical_study(scenario, ga_params, aco_params, n_executions=5)
+    report = run_statistical_study(scenario, ga_params, aco_params, n_executions=5,
+                                   engine=engine, n_workers=n_workers,
+                                   stopping_criteria=stopping_criteria, seed=seed)
     
     print("✅ Teste rápido concluído!")
 
@@ -198,10 +218,29 @@ if __name__ == "__main__":
     
     parser = argparse.ArgumentParser(description='Otimização de Parâmetros e Análise Estatística')
     parser.add_argument('--quick', action='store_true', help='Executar teste rápido')
+    parser.add_argument('--engine', choices=['object', 'array', 'island', 'steady_state'], default='object',
+                        help='Motor do GA (array para populações grandes, island para subpopulações em processos)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Processos para avaliação paralela das gerações/iterações')
+    parser.add_argument('--stagnation', type=int, default=None,
+                        help='Encerrar após N gerações/iterações sem melhora')
+    parser.add_argument('--min-improvement', type=float, default=0.0,
+                        help='Melhora relativa mínima na janela de estagnação')
+    parser.add_argument('--time-limit', type=float, default=None,
+                        help='Tempo máximo por execução (segundos)')
+    parser.add_argument('--max-evaluations', type=int, default=None,
+                        help='Número máximo de avaliações por execução')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Semente do estudo (cada execução usa um fluxo aleatório independente)')
     
     args = parser.parse_args()
     
+    stopping_criteria = None
+    if args.stagnation or args.time_limit or args.max_evaluations:
+        stopping_criteria = StoppingCriteria(args.stagnation, args.min_improvement,
+                                             args.time_limit, args.max_evaluations)
+    
     if args.quick:
-        run_quick_test()
+        run_quick_test(args.engine, args.workers, stopping_criteria, args.seed)
     else:
-        main() 
\ No newline at end of file
+        main(args.engine, args.workers, stopping_criteria, args.seed) 
\ No newline at end of file
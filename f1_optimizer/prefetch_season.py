@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Script para pré-carregar as corridas de uma temporada (cache do FastF1 e
+armazenamento de voltas) em paralelo.
+
+Uso:
+    python prefetch_season.py 2024 [--races "Spain Grand Prix" ...] [--workers 4] [--solve]
+"""
+
+import sys
+import os
+import argparse
+
+# Adicionar src ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.prefetch import SeasonPrefetcher
+
+
+def main():
+    """
+    Função principal do pré-carregamento.
+    """
+    parser = argparse.ArgumentParser(description="Pré-carrega as corridas de uma temporada")
+    parser.add_argument('year', type=int, help="Ano da temporada")
+    parser.add_argument('--races', nargs='*', help="Corridas específicas (padrão: calendário completo)")
+    parser.add_argument('--workers', type=int, default=2, help="Processos em paralelo")
+    parser.add_argument('--profile', default='laps', help="Perfil de carga ('laps', 'laps+weather', 'full')")
+    parser.add_argument('--solve', action='store_true',
+                        help="Calcula a estratégia ótima (DP) de cada piloto assim que a corrida fica pronta")
+    args = parser.parse_args()
+    
+    print(f"🏎️ PRÉ-CARREGAMENTO DA TEMPORADA {args.year}")
+    print("=" * 60)
+    
+    prefetcher = SeasonPrefetcher(args.year, races=args.races, max_workers=args.workers,
+                                  load_profile=args.profile)
+    
+    if not args.solve:
+        summary = prefetcher.run()
+    else:
+        # Produtor/consumidor: otimizar a corrida N enquanto as seguintes carregam
+        from src.race_simulator import RaceSimulator
+        from src.dynamic_programming import DynamicProgrammingSolver
+        
+        skipped = [race for race in prefetcher.races if prefetcher.is_done(race)]
+        summary = {'completed': [], 'skipped': skipped, 'failed': []}
+        for race_name, session_laps in prefetcher.iter_races():
+            simulators = RaceSimulator.from_session_laps(session_laps)
+            print(f"\n🎯 {race_name}: estratégias ótimas")
+            for driver, simulator in simulators.items():
+                solution = DynamicProgrammingSolver(simulator).run()
+                print(f"   {driver}: {solution}")
+            if race_name not in skipped:
+                summary['completed'].append(race_name)
+        summary['failed'] = [
+            race for race in prefetcher.races
+            if race not in summary['completed'] and race not in skipped
+        ]
+    
+    print(f"\n✅ Concluídas: {len(summary['completed'])}")
+    print(f"⏭️ Já carregadas: {len(summary['skipped'])}")
+    if summary['failed']:
+        print(f"❌ Falhas: {summary['failed']}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,8 +1,11 @@
-import random
 import numpy as np
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, Optional, Union, TYPE_CHECKING
 from .race_simulator import RaceSimulator
-import pandas as pd
+from .stopping_criteria import StoppingCriteria
+from .checkpoint import Checkpointer
+
+if TYPE_CHECKING:
+    from .parallel_evaluation import ParallelEvaluator
 
 
 class Ant:
@@ -31,7 +34,11 @@ class AntColonyOptimizer:
                  iterations: int = 50,
                  evaporation_rate: float = 0.1,
                  alpha: float = 1.0,  # Peso do feromônio
-                 beta: float = 2.0):  # Peso da heurística
+                 beta: float = 2.0,  # Peso da heurística
+                 executor: Optional['ParallelEvaluator'] = None,
+                 stopping_criteria: Optional[StoppingCriteria] = None,
+                 checkpointer: Optional[Checkpointer] = None,
+                 seed: Union[None, int, np.random.SeedSequence, np.random.Generator] = None):
         """
         Inicializa o otimizador ACO.
         
@@ -42,6 +49,14 @@ class AntColonyOptimizer:
             evaporation_rate: Taxa de evaporação do feromônio
             alpha: Peso do feromônio na regra de transição
             beta: Peso da heurística na regra de transição
+            executor: Avaliador paralelo opcional (ParallelEvaluator) usado na
+                avaliação das formigas de cada iteração
+            stopping_criteria: Critérios de parada antecipada (None executa
+                todas as iterações)
+            checkpointer: Checkpoints periódicos da execução; run() retoma do
+                último checkpoint, se existir
+            seed: Semente, SeedSequence ou np.random.Generator do fluxo
+                aleatório próprio da execução (None usa entropia do sistema)
         """
         self.simulator = simulator
         self.num_ants = num_ants
@@ -49,10 +64,18 @@ class AntColonyOptimizer:
         self.evaporation_rate = evaporation_rate
         self.alpha = alpha
         self.beta = beta
+        self.executor = executor
+        self.stopping_criteria = stopping_criteria
+        self.checkpointer = checkpointer
+        
+        # Fluxo aleatório próprio (independente dos geradores globais)
+        self.rng = np.random.default_rng(seed)
+        
+        # Modelo compilado (sem pandas) usado em tempo de execução
+        self.model = simulator.compile()
         
         # Obter compostos disponíveis
-        self.available_compounds = list(simulator.race_data['Compound'].unique())
-        self.available_compounds = [c for c in self.available_compounds if pd.notna(c)]
+        self.available_compounds = list(self.model.race_compounds)
         
         # Se não há compostos, usar padrão
         if not self.available_compounds:
@@ -64,6 +87,21 @@ class AntColonyOptimizer:
         self.decisions = ['CONTINUE'] + self.available_compounds
         self.num_decisions = len(self.decisions)
         
+        # Feromônios, melhor solução e históricos (reiniciados a cada execução)
+        self._reset_run_state()
+        self.stop_reason = None
+        
+        # Estatísticas do avaliador paralelo na última execução
+        self.parallel_stats = None
+        
+        # Tabelas da heurística (construídas sob demanda para o modelo atual)
+        self._heuristic_model = None
+    
+    def _reset_run_state(self):
+        """
+        Reinicia o estado de uma execução: feromônios, melhor solução e
+        históricos de fitness e de avaliações (sempre juntos).
+        """
         # Inicializar matriz de feromônios com bias para estratégias realistas
         self.pheromone_matrix = np.ones((self.total_laps, self.num_decisions)) * 0.1
         
@@ -74,6 +112,10 @@ class AntColonyOptimizer:
         self.best_ant = None
         self.best_time = float('inf')
         self.fitness_history = []
+        
+        # Avaliações acumuladas em cada iteração do histórico
+        self.evaluations = 0
+        self.evaluation_history = []
     
     def build_solution(self) -> Ant:
         """
@@ -82,142 +124,164 @@ class AntColonyOptimizer:
         Returns:
             Formiga com estratégia construída
         """
-        ant = Ant()
-        current_lap = 1
-        current_compound = self.simulator.race_data['Compound'].iloc[0]
-        current_tyre_age = 0
-        pit_stops_count = 0
-        max_pit_stops = 3  # Limite realista de paradas
-        
-        while current_lap <= self.total_laps:
-            # Verificar se ainda pode parar
-            if pit_stops_count >= max_pit_stops:
-                decision = 'CONTINUE'
-            else:
-                # Calcular probabilidades para cada decisão
-                probabilities = self._calculate_transition_probabilities(
-                    current_lap, current_compound, current_tyre_age
-                )
-                
-                # REGRA F1: Se ainda não usou dois compostos, forçar pelo menos uma parada
-                compounds_used = set(compound for _, compound in ant.strategy)
-                initial_compound = self.simulator.race_data['Compound'].iloc[0]
-                all_compounds_used = compounds_used | {initial_compound}
-                
-                # Se falta pouco para o fim e ainda não usou dois compostos, forçar parada
-                if len(all_compounds_used) < 2 and current_lap >= self.total_laps - 10:
-                    # Forçar escolha de um composto diferente
-                    available_compounds = [d for d in self.decisions if d != 'CONTINUE' and d != current_compound]
-                    if available_compounds:
-                        compound = random.choice(available_compounds)
-                        decision = compound
-                    else:
-                        # Escolher decisão baseada em probabilidades
-                        decision_idx = self._choose_decision(probabilities)
-                        decision = self.decisions[decision_idx]
-                else:
-                    # Escolher decisão baseada em probabilidades
-                    decision_idx = self._choose_decision(probabilities)
-                    decision = self.decisions[decision_idx]
-            
-            if decision == 'CONTINUE':
-                # Continuar com o pneu atual
-                current_lap += 1
-                current_tyre_age += 1
-            else:
-                # Parar para trocar pneu
-                ant.strategy.append((current_lap, decision))
-                current_compound = decision
-                current_tyre_age = 0
-                current_lap += 1
-                pit_stops_count += 1
+        ant = self.construct_colony(1)[0]
         
         # Avaliar estratégia
         ant.total_time = self.simulator.evaluate_strategy(ant.strategy)
         
         return ant
     
-    def _calculate_transition_probabilities(self, lap: int, current_compound: str, tyre_age: int) -> np.ndarray:
+    def _build_heuristic_tables(self):
         """
-        Calcula as probabilidades de transição para cada decisão.
+        Pré-calcula heurística ** beta de todas as decisões para o modelo atual.
         
-        Args:
-            lap: Volta atual
-            current_compound: Composto atual
-            tyre_age: Idade do pneu atual
-            
-        Returns:
-            Array com probabilidades para cada decisão
+        A heurística de uma parada depende só da volta; a de CONTINUE depende
+        da volta, do composto atual e da idade do pneu. Os compostos de estado
+        são os das decisões mais o composto de largada (se não estiver entre
+        eles).
         """
-        probabilities = np.zeros(self.num_decisions)
+        laps = np.arange(1, self.total_laps + 1)
+        compounds = self.decisions[1:]
         
-        for i, decision in enumerate(self.decisions):
-            # Feromônio
-            pheromone = self.pheromone_matrix[lap - 1, i]
-            
-            # Heurística (inverso do tempo da próxima volta)
-            heuristic = self._calculate_heuristic(lap, decision, current_compound, tyre_age)
-            
-            # Regra de transição
-            probabilities[i] = (pheromone ** self.alpha) * (heuristic ** self.beta)
-        
-        # Normalizar probabilidades
-        total = np.sum(probabilities)
-        if total > 0:
-            probabilities = probabilities / total
-        else:
-            # Se todas as probabilidades são zero, usar distribuição uniforme
-            probabilities = np.ones(self.num_decisions) / self.num_decisions
-        
-        return probabilities
+        self._state_compounds = list(compounds)
+        if self.model.initial_compound not in self._state_compounds:
+            self._state_compounds.append(self.model.initial_compound)
+        
+        # Parada na volta l para o composto d: próxima volta com pneu novo + pit stop
+        pit_eta = np.empty((self.total_laps, self.num_decisions))
+        pit_eta[:, 0] = 0.0
+        for k, compound in enumerate(compounds, start=1):
+            total_cost = self.model.lap_times(laps + 1, compound, 0) + self.simulator.pit_stop_time
+            pit_eta[:, k] = (1.0 / np.maximum(total_cost, 60.0)) ** self.beta
+        
+        # CONTINUE na volta l com pneu de idade a (a < l): próxima volta com idade a + 1
+        tyre_ages = np.arange(self.total_laps)
+        continue_eta = np.empty((len(self._state_compounds), self.total_laps, self.total_laps))
+        for c, compound in enumerate(self._state_compounds):
+            next_lap_times = self.model.lap_times(laps[:, None] + 1, compound, tyre_ages[None, :] + 1)
+            continue_eta[c] = (1.0 / np.maximum(next_lap_times, 60.0)) ** self.beta
+        
+        # Decisões de parada forçada (compostos diferentes do atual) por composto de estado
+        forced = [[k for k, compound in enumerate(compounds, start=1) if compound != current]
+                  for current in self._state_compounds]
+        self._forced_counts = np.array([len(options) for options in forced])
+        self._forced_decisions = np.zeros((len(forced), max(1, len(compounds))), dtype=np.int64)
+        for c, options in enumerate(forced):
+            self._forced_decisions[c, :len(options)] = options
+        
+        # Composto de estado de cada decisão (CONTINUE mantém o atual)
+        self._decision_state = np.array([-1] + list(range(len(compounds))))
+        
+        self._pit_eta = pit_eta
+        self._continue_eta = continue_eta
+        self._heuristic_model = self.model
     
-    def _calculate_heuristic(self, lap: int, decision: str, current_compound: str, tyre_age: int) -> float:
+    def construct_colony(self, num_ants: int) -> List[Ant]:
         """
-        Calcula a heurística para uma decisão.
+        Constrói as estratégias de várias formigas sem avaliá-las.
+        
+        Todas as formigas percorrem o grafo de decisão juntas, volta a volta,
+        com o estado (composto atual, idade do pneu, paradas e uso de um
+        segundo composto) em arrays: as probabilidades de transição e o sorteio
+        de cada volta são calculados para a colônia inteira de uma vez. As
+        regras são as mesmas da construção formiga a formiga: no máximo 3
+        paradas, apenas dentro da janela de paradas do modelo e, a partir das
+        10 últimas voltas, parada forçada para um composto diferente enquanto
+        apenas o composto de largada foi usado.
         
         Args:
-            lap: Volta atual
-            decision: Decisão a ser avaliada
-            current_compound: Composto atual
-            tyre_age: Idade do pneu atual
-            
+            num_ants: Número de formigas
+        
         Returns:
-            Valor heurístico (inverso do tempo da próxima volta)
+            Formigas com estratégias construídas (total_time ainda não calculado)
         """
-        try:
-            if decision == 'CONTINUE':
-                # Continuar com pneu atual
-                next_lap_time = self.simulator._calculate_lap_time(
-                    lap + 1, current_compound, tyre_age + 1
-                )
-                heuristic = 1.0 / max(next_lap_time, 60.0)
-            else:
-                # Trocar para novo composto - considerar custo do pit stop
-                next_lap_time = self.simulator._calculate_lap_time(
-                    lap + 1, decision, 0
-                )
-                pit_stop_cost = self.simulator.pit_stop_time
-                
-                # Heurística considera custo total (pit stop + tempo)
-                total_cost = next_lap_time + pit_stop_cost
-                heuristic = 1.0 / max(total_cost, 60.0)
+        if self._heuristic_model is not self.model:
+            self._build_heuristic_tables()
+        
+        max_pit_stops = 3  # Limite realista de paradas
+        min_pit_lap, max_pit_lap = self.model.pit_window()
+        initial_state = self._state_compounds.index(self.model.initial_compound)
+        laps_stride = self.total_laps
+        compound_stride = self.total_laps * self.total_laps
+        rows = np.arange(num_ants)
+        
+        # Pesos de CONTINUE por (composto, volta, idade do pneu), achatados, e
+        # pesos acumulados das paradas por volta (iguais para todas as formigas)
+        pheromone = self.pheromone_matrix ** self.alpha
+        continue_weights = (pheromone[None, :, 0, None] * self._continue_eta).ravel()
+        pit_cumulative = np.cumsum(pheromone[:, 1:] * self._pit_eta[:, 1:], axis=1)
+        may_be_empty = pit_cumulative[:, -1].min() <= 0
+        
+        # Estado de cada formiga: posição em continue_weights (composto atual,
+        # volta e idade do pneu), paradas e uso de um segundo composto
+        current_compound = np.full(num_ants, initial_state)
+        weight_index = np.full(num_ants, initial_state * compound_stride)
+        pit_stops_count = np.zeros(num_ants, dtype=np.int64)
+        exhausted = np.zeros(num_ants, dtype=bool)
+        second_compound_used = np.zeros(num_ants, dtype=bool)
+        stop_laps = np.zeros((num_ants, max_pit_stops), dtype=np.int64)
+        stop_decisions = np.zeros((num_ants, max_pit_stops), dtype=np.int64)
+        
+        # Um número uniforme por formiga e volta, sorteados de uma vez
+        draws = self.rng.random((num_ants, self.total_laps))
+        
+        for lap in range(1, self.total_laps + 1):
+            # Fora da janela de paradas todas as formigas continuam
+            if lap < min_pit_lap or lap > max_pit_lap:
+                weight_index += laps_stride + 1
+                continue
             
-            return heuristic
+            u = draws[:, lap - 1]
             
-        except Exception:
-            return 0.1  # Valor padrão em caso de erro
-    
-    def _choose_decision(self, probabilities: np.ndarray) -> int:
-        """
-        Escolhe uma decisão baseada nas probabilidades.
-        
-        Args:
-            probabilities: Array com probabilidades
+            # Inversão da distribuição acumulada [CONTINUE, paradas...]: CONTINUE
+            # se o sorteio cai no seu peso, senão a parada em que cai o restante
+            continue_weight = continue_weights[weight_index]
+            target = u * (continue_weight + pit_cumulative[lap - 1, -1])
+            decisions = np.searchsorted(pit_cumulative[lap - 1], target - continue_weight, side='right')
+            decisions += target >= continue_weight
+            np.minimum(decisions, self.num_decisions - 1, out=decisions)
             
-        Returns:
-            Índice da decisão escolhida
-        """
-        return np.random.choice(len(probabilities), p=probabilities)
+            # Sem peso algum, a distribuição é uniforme
+            if may_be_empty:
+                empty = continue_weight + pit_cumulative[lap - 1, -1] <= 0
+                decisions[empty] = np.minimum((u[empty] * self.num_decisions).astype(np.int64),
+                                              self.num_decisions - 1)
+            
+            # REGRA F1: nas últimas voltas, forçar parada para um composto diferente
+            if lap >= self.total_laps - 10:
+                n_options = self._forced_counts[current_compound]
+                forced = ~second_compound_used & (n_options > 0)
+                choice = np.minimum((u * n_options).astype(np.int64), self._forced_decisions.shape[1] - 1)
+                decisions = np.where(forced, self._forced_decisions[current_compound, choice], decisions)
+            
+            # Paradas além do limite não são permitidas
+            decisions[exhausted] = 0
+            
+            # Atualizar o estado das formigas (CONTINUE: próxima volta, pneu uma volta mais velho)
+            weight_index += laps_stride + 1
+            stopping = decisions > 0
+            if not stopping.any():
+                continue
+            
+            stop_rows = rows[stopping]
+            stop_index = pit_stops_count[stopping]
+            stop_laps[stop_rows, stop_index] = lap
+            stop_decisions[stop_rows, stop_index] = decisions[stopping]
+            
+            new_compound = self._decision_state[decisions[stopping]]
+            second_compound_used[stop_rows] |= new_compound != initial_state
+            current_compound[stop_rows] = new_compound
+            weight_index[stop_rows] = new_compound * compound_stride + lap * laps_stride
+            pit_stops_count[stop_rows] += 1
+            exhausted[stop_rows] = pit_stops_count[stop_rows] >= max_pit_stops
+        
+        ants = []
+        for laps, decisions, n_stops in zip(stop_laps.tolist(), stop_decisions.tolist(), pit_stops_count.tolist()):
+            ant = Ant()
+            ant.strategy = [(lap, self.decisions[decision]) for lap, decision in zip(laps[:n_stops], decisions[:n_stops])]
+            ants.append(ant)
+        
+        return ants
     
     def update_pheromones(self, ants: List[Ant]):
         """
@@ -248,12 +312,29 @@ class AntColonyOptimizer:
         Returns:
             Melhor formiga encontrada
         """
-        for iteration in range(self.iterations):
+        # Garantir que o modelo (e as tabelas da heurística) está atualizado
+        self.model = self.simulator.compile()
+        parallel_stats_start = self.executor.get_stats() if self.executor is not None else None
+        if self.stopping_criteria is not None:
+            self.stopping_criteria.start()
+        self._reset_run_state()
+        self.stop_reason = 'iterations'
+        
+        state = self.checkpointer.load() if self.checkpointer is not None else None
+        start_iteration = 0
+        if state is not None:
+            start_iteration = self.restore_state(state)
+            print(f"♻️ Retomando o ACO do checkpoint na iteração {start_iteration}")
+        
+        for iteration in range(start_iteration, self.iterations):
             # Construir soluções com todas as formigas
-            ants = []
-            for _ in range(self.num_ants):
-                ant = self.build_solution()
-                ants.append(ant)
+            ants = self.construct_colony(self.num_ants)
+            
+            # Avaliar todas as formigas da iteração em uma única chamada
+            total_times = (self.executor or self.simulator).evaluate_strategies([ant.strategy for ant in ants])
+            for ant, total_time in zip(ants, total_times.tolist()):
+                ant.total_time = total_time
+            self.evaluations += len(ants)
             
             # Atualizar melhor solução
             for ant in ants:
@@ -269,12 +350,73 @@ class AntColonyOptimizer:
             # Registrar melhor fitness da iteração
             best_fitness = 1.0 / self.best_time if self.best_time < float('inf') else 0.0
             self.fitness_history.append(best_fitness)
+            self.evaluation_history.append(self.evaluations)
             
             if iteration % 10 == 0:
                 print(f"Iteração {iteration}: Melhor tempo = {self.best_time:.2f}s")
+            
+            if self.stopping_criteria is not None:
+                reason = self.stopping_criteria.check(self.fitness_history, self.evaluations)
+                if reason is not None:
+                    self.stop_reason = reason
+                    print(f"⏹️ Parada antecipada na iteração {iteration} ({reason}): "
+                          f"{self.evaluations} avaliações")
+                    break
+            
+            if self.checkpointer is not None:
+                self.checkpointer.save_if_due(lambda: self.get_state(iteration + 1))
+        
+        if self.executor is not None:
+            self.parallel_stats = self.executor.stats_delta(parallel_stats_start, self.executor.get_stats())
+            print(self.executor.format_stats(self.parallel_stats))
+        
+        if self.checkpointer is not None:
+            self.checkpointer.clear()
         
         return self.best_ant
     
+    def get_state(self, next_iteration: int) -> Dict:
+        """
+        Estado completo da execução entre duas iterações (para checkpoints).
+        
+        Args:
+            next_iteration: Próxima iteração a ser executada
+            
+        Returns:
+            Dicionário serializável com pickle (feromônios, melhor formiga,
+            históricos e estado do fluxo aleatório)
+        """
+        return {
+            'next_iteration': next_iteration,
+            'pheromone_matrix': self.pheromone_matrix,
+            'best_ant': self.best_ant,
+            'best_time': self.best_time,
+            'fitness_history': self.fitness_history,
+            'evaluation_history': self.evaluation_history,
+            'evaluations': self.evaluations,
+            'rng_state': self.rng.bit_generator.state
+        }
+    
+    def restore_state(self, state: Dict) -> int:
+        """
+        Restaura uma execução a partir de get_state.
+        
+        Args:
+            state: Estado gravado
+            
+        Returns:
+            Próxima iteração a ser executada
+        """
+        self.pheromone_matrix = state['pheromone_matrix'].copy()
+        self.best_ant = state['best_ant']
+        self.best_time = state['best_time']
+        self.fitness_history = list(state['fitness_history'])
+        self.evaluation_history = list(state['evaluation_history'])
+        self.evaluations = state['evaluations']
+        self.rng.bit_generator.state = state['rng_state']
+        
+        return state['next_iteration']
+    
     def get_fitness_history(self) -> List[float]:
         """
         Retorna o histórico de fitness para análise.
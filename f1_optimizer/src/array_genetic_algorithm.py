@@ -0,0 +1,333 @@
+import numpy as np
+from typing import Optional, Tuple, Union, TYPE_CHECKING
+from .race_simulator import RaceSimulator
+from .genetic_algorithm import GeneticAlgorithm, Individual
+from .stopping_criteria import StoppingCriteria
+
+if TYPE_CHECKING:
+    from .parallel_evaluation import ParallelEvaluator
+
+
+class ArrayGeneticAlgorithm(GeneticAlgorithm):
+    """
+    Algoritmo Genético com a população codificada em arrays NumPy.
+    
+    A população é um conjunto de arrays de forma fixa (voltas de parada, ids
+    de composto, máscara de paradas ativas e fitness), e seleção por torneio,
+    crossover de um ponto, os quatro tipos de mutação e elitismo são operações
+    em lote sobre a população inteira. Cada geração é avaliada com uma única
+    chamada a CompiledRaceModel.evaluate_strategies, o que permite populações
+    de dezenas de milhares de indivíduos.
+    
+    Mantém o contrato de GeneticAlgorithm: run() retorna o melhor Individual e
+    get_fitness_history() o melhor fitness de cada geração.
+    """
+    
+    def __init__(self, simulator: RaceSimulator,
+                 population_size: int = 50,
+                 generations: int = 100,
+                 mutation_rate: float = 0.1,
+                 crossover_rate: float = 0.8,
+                 elitism_size: int = 5,
+                 tournament_size: int = 3,
+                 max_stops: int = 5,
+                 seed: Union[None, int, np.random.SeedSequence, np.random.Generator] = None,
+                 executor: Optional['ParallelEvaluator'] = None,
+                 stopping_criteria: Optional[StoppingCriteria] = None):
+        """
+        Inicializa o algoritmo genético em arrays.
+        
+        Args:
+            simulator: Instância do simulador de corrida
+            population_size: Tamanho da população
+            generations: Número de gerações
+            mutation_rate: Taxa de mutação
+            crossover_rate: Taxa de crossover
+            elitism_size: Número de melhores indivíduos para elitismo
+            tournament_size: Tamanho do torneio de seleção
+            max_stops: Capacidade de paradas de cada cromossomo (paradas além
+                de 3 são penalizadas pelo simulador)
+            seed: Semente, SeedSequence ou np.random.Generator do fluxo
+                aleatório próprio da execução
+            executor: Avaliador paralelo opcional (ParallelEvaluator)
+            stopping_criteria: Critérios de parada antecipada (None executa
+                todas as gerações)
+        """
+        super().__init__(simulator, population_size, generations, mutation_rate,
+                         crossover_rate, elitism_size, executor, stopping_criteria, seed=seed)
+        self.tournament_size = tournament_size
+        self.max_stops = max(4, max_stops)
+        self._encode_compounds()
+    
+    def _encode_compounds(self):
+        """
+        Associa os compostos disponíveis aos ids do modelo compilado (compostos
+        sem coeficientes recebem ids após os do modelo, como em encode_strategies).
+        """
+        compound_ids = []
+        n_known = len(self.model.compound_names)
+        for compound in self.available_compounds:
+            compound_id = self.model.compound_ids.get(compound)
+            if compound_id is None:
+                compound_id = n_known + sum(1 for c in compound_ids if c >= n_known)
+            compound_ids.append(compound_id)
+        
+        self.compound_id_array = np.array(compound_ids, dtype=np.int64)
+    
+    def _random_laps(self, size) -> np.ndarray:
+        """
+        Voltas de parada aleatórias na janela de paradas (mesmo intervalo do GA original).
+        """
+        return self.rng.integers(self.min_pit_lap, self.max_pit_lap + 1, size=size)
+    
+    def _random_compounds(self, size) -> np.ndarray:
+        """
+        Índices aleatórios em available_compounds.
+        """
+        return self.rng.integers(0, len(self.available_compounds), size=size)
+    
+    def _compact(self, pit_laps: np.ndarray, compounds: np.ndarray,
+                 active: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Ordena as paradas de cada cromossomo por volta, com as posições vazias no fim.
+        """
+        sort_key = np.where(active, pit_laps, np.iinfo(np.int64).max)
+        order = np.argsort(sort_key, axis=1, kind='stable')
+        return (
+            np.take_along_axis(pit_laps, order, axis=1),
+            np.take_along_axis(compounds, order, axis=1),
+            np.take_along_axis(active, order, axis=1)
+        )
+    
+    def create_initial_population(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Cria a população inicial com estratégias aleatórias (mesmas regras de
+        _generate_random_strategy, em lote).
+        
+        Returns:
+            Tupla (voltas de parada, índices de composto, paradas ativas), cada
+            uma com forma (population_size, max_stops)
+        """
+        n, slots = self.population_size, self.max_stops
+        n_compounds = len(self.available_compounds)
+        
+        # Número de paradas (0 a 3)
+        num_pits = self.rng.integers(0, 4, size=n)
+        active = np.arange(slots)[None, :] < num_pits[:, None]
+        pit_laps = np.where(active, self._random_laps((n, slots)), 0)
+        compounds = self._random_compounds((n, slots))
+        
+        # Garantir que pelo menos dois compostos diferentes são usados
+        first = compounds[:, 0]
+        single = (num_pits > 0) & np.all((compounds == first[:, None]) | ~active, axis=1)
+        if n_compounds > 1:
+            rows = np.flatnonzero(single)
+            extra = num_pits[rows]
+            pit_laps[rows, extra] = self.rng.integers(10, max(11, self.max_pit_lap + 1), size=len(rows))
+            compounds[rows, extra] = (first[rows] + self.rng.integers(1, n_compounds, size=len(rows))) % n_compounds
+            active[rows, extra] = True
+        
+        return self._compact(pit_laps, compounds, active)
+    
+    def evaluate_population(self, pit_laps: np.ndarray, compounds: np.ndarray,
+                            active: np.ndarray) -> np.ndarray:
+        """
+        Calcula o fitness de uma população com uma única chamada ao modelo compilado.
+        
+        Aplica as mesmas penalidades de _fitness_from_time.
+        
+        Returns:
+            Array com o fitness de cada indivíduo
+        """
+        compound_ids = self.compound_id_array[compounds]
+        batch = np.stack([
+            np.where(active, pit_laps, -1),
+            np.where(active, compound_ids, -1)
+        ], axis=2)
+        total_times = (self.executor or self.model).evaluate_strategies(batch)
+        
+        # REGRA F1: Deve usar pelo menos dois compostos diferentes (contando o inicial)
+        uses_two_compounds = (active & (compound_ids != self.model.initial_compound_id)).any(axis=1)
+        penalties = np.where(uses_two_compounds, 0.0, 10000.0)
+        
+        # Voltas duplicadas (paradas ativas ordenadas e adjacentes na mesma volta)
+        duplicated = (active[:, 1:] & active[:, :-1] & (pit_laps[:, 1:] == pit_laps[:, :-1])).any(axis=1)
+        penalties = np.where(duplicated, 500.0, penalties)
+        
+        self.evaluations += len(batch)
+        
+        with np.errstate(divide='ignore'):
+            return 1.0 / (total_times + penalties)
+    
+    def _select(self, fitness: np.ndarray, n_selected: int) -> np.ndarray:
+        """
+        Seleção por torneio em lote (sem repetição dentro de cada torneio, como
+        no motor de objetos).
+        
+        Returns:
+            Índices dos indivíduos selecionados
+        """
+        candidates = self._tournament_indices(len(fitness), n_selected, self.tournament_size)
+        winners = np.argmax(fitness[candidates], axis=1)
+        return candidates[np.arange(n_selected), winners]
+    
+    def _crossover(self, pit_laps: np.ndarray, compounds: np.ndarray, active: np.ndarray,
+                   parents1: np.ndarray, parents2: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Crossover de um ponto em lote: o filho 1 recebe as paradas do pai 1 antes
+        do ponto de corte e as do pai 2 a partir dele (e o filho 2 o inverso).
+        Sem crossover (ou com um pai sem paradas), os filhos são cópias dos pais.
+        
+        Returns:
+            Tupla (voltas, compostos, ativas) dos filhos, na ordem filho 1, filho 2 de cada par
+        """
+        n_pairs = len(parents1)
+        lengths1 = active[parents1].sum(axis=1)
+        lengths2 = active[parents2].sum(axis=1)
+        
+        crossing = (
+            (self.rng.random(n_pairs) <= self.crossover_rate) &
+            (lengths1 > 0) & (lengths2 > 0)
+        )
+        max_lengths = np.maximum(lengths1, lengths2)
+        points = np.floor(self.rng.random(n_pairs) * (max_lengths + 1)).astype(np.int64)
+        points = np.where(crossing, points, self.max_stops)
+        
+        # Posições antes do ponto de corte vêm do próprio pai
+        from_own = np.arange(self.max_stops)[None, :] < points[:, None]
+        
+        def combine(values):
+            child1 = np.where(from_own, values[parents1], values[parents2])
+            child2 = np.where(from_own, values[parents2], values[parents1])
+            return np.stack([child1, child2], axis=1).reshape(2 * n_pairs, self.max_stops)
+        
+        return combine(pit_laps), combine(compounds), combine(active)
+    
+    def _mutate(self, pit_laps: np.ndarray, compounds: np.ndarray, active: np.ndarray):
+        """
+        Aplica as mutações em lote (in-place nos arrays dos filhos, já compactados).
+        """
+        n = len(pit_laps)
+        lengths = active.sum(axis=1)
+        mutating = self.rng.random(n) <= self.mutation_rate
+        mutation_types = self.rng.integers(0, len(self.MUTATION_TYPES), size=n)
+        
+        # Parada sorteada entre as ativas (os cromossomos estão compactados)
+        stop_index = np.floor(self.rng.random(n) * np.maximum(lengths, 1)).astype(np.int64)
+        new_laps = self._random_laps(n)
+        new_compounds = self._random_compounds(n)
+        has_stops = lengths > 0
+        
+        # Alterar volta de uma parada
+        rows = np.flatnonzero(mutating & (mutation_types == 0) & has_stops)
+        pit_laps[rows, stop_index[rows]] = new_laps[rows]
+        
+        # Alterar composto de uma parada
+        rows = np.flatnonzero(mutating & (mutation_types == 1) & has_stops)
+        compounds[rows, stop_index[rows]] = new_compounds[rows]
+        
+        # Adicionar uma parada (na primeira posição vazia, se houver)
+        rows = np.flatnonzero(mutating & (mutation_types == 2) & (lengths < self.max_stops))
+        pit_laps[rows, lengths[rows]] = new_laps[rows]
+        compounds[rows, lengths[rows]] = new_compounds[rows]
+        active[rows, lengths[rows]] = True
+        
+        # Remover uma parada
+        rows = np.flatnonzero(mutating & (mutation_types == 3) & has_stops)
+        active[rows, stop_index[rows]] = False
+    
+    def to_individual(self, pit_laps: np.ndarray, compounds: np.ndarray,
+                      active: np.ndarray, fitness: float) -> Individual:
+        """
+        Converte uma linha da população em Individual.
+        """
+        chromosome = [
+            (int(lap), self.available_compounds[compound])
+            for lap, compound, is_active in zip(pit_laps.tolist(), compounds.tolist(), active.tolist())
+            if is_active
+        ]
+        return Individual(chromosome, float(fitness))
+    
+    def run(self) -> Individual:
+        """
+        Executa o algoritmo genético.
+        
+        Returns:
+            Melhor indivíduo encontrado
+        """
+        # Garantir que o modelo compilado está atualizado
+        self.model = self.simulator.compile()
+        self._encode_compounds()
+        self._start_parallel_stats()
+        if self.stopping_criteria is not None:
+            self.stopping_criteria.start()
+        
+        # Históricos e melhor indivíduo são da execução atual (reiniciados juntos)
+        self.best_individual = None
+        self.fitness_history = []
+        self.evaluations = 0
+        self.evaluation_history = []
+        self.stop_reason = 'generations'
+        
+        n = self.population_size
+        elitism_size = min(self.elitism_size, n)
+        n_children = n - elitism_size
+        n_pairs = (n_children + 1) // 2
+        
+        # Criar população inicial e calcular fitness (uma única chamada ao modelo)
+        pit_laps, compounds, active = self.create_initial_population()
+        fitness = self.evaluate_population(pit_laps, compounds, active)
+        self.fitness_history.append(float(fitness.max()))
+        self.evaluation_history.append(self.evaluations)
+        
+        for generation in range(self.generations + 1):
+            # Atualizar melhor indivíduo
+            best = int(np.argmax(fitness))
+            if self.best_individual is None or fitness[best] > self.best_individual.fitness:
+                self.best_individual = self.to_individual(
+                    pit_laps[best], compounds[best], active[best], fitness[best]
+                )
+            
+            if generation == self.generations or self.stop_reason != 'generations':
+                break
+            
+            # Elitismo (os melhores passam sem reavaliação)
+            elite = np.argsort(-fitness, kind='stable')[:elitism_size]
+            
+            # Seleção, crossover e mutação em lote
+            parents = self._select(fitness, 2 * n_pairs)
+            child_laps, child_compounds, child_active = self._crossover(
+                pit_laps, compounds, active, parents[0::2], parents[1::2]
+            )
+            child_laps = child_laps[:n_children]
+            child_compounds = child_compounds[:n_children]
+            child_active = child_active[:n_children]
+            
+            child_laps, child_compounds, child_active = self._compact(child_laps, child_compounds, child_active)
+            self._mutate(child_laps, child_compounds, child_active)
+            child_laps, child_compounds, child_active = self._compact(child_laps, child_compounds, child_active)
+            
+            # Calcular fitness dos filhos em lote
+            child_fitness = self.evaluate_population(child_laps, child_compounds, child_active)
+            
+            pit_laps = np.concatenate([pit_laps[elite], child_laps])
+            compounds = np.concatenate([compounds[elite], child_compounds])
+            active = np.concatenate([active[elite], child_active])
+            fitness = np.concatenate([fitness[elite], child_fitness])
+            
+            # Registrar melhor fitness da geração
+            best_fitness = float(fitness.max())
+            self.fitness_history.append(best_fitness)
+            self.evaluation_history.append(self.evaluations)
+            
+            if generation % 10 == 0:
+                print(f"Geração {generation}: Melhor fitness = {best_fitness:.6f}")
+            
+            reason = self.check_stopping_criteria()
+            if reason is not None:
+                self.stop_reason = reason
+                print(f"⏹️ Parada antecipada na geração {generation} ({reason}): "
+                      f"{self.evaluations} avaliações")
+        
+        self._finish_parallel_stats()
+        return self.best_individual
\ No newline at end of file
@@ -0,0 +1,110 @@
+import os
+import pickle
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class Checkpointer:
+    """
+    Checkpoints periódicos e atômicos de execuções longas.
+    
+    O estado é serializado com pickle em um arquivo temporário e movido com
+    os.replace, de modo que o arquivo de checkpoint é sempre o anterior ou o
+    novo, nunca um arquivo parcial. save_if_due só constrói e grava o estado
+    quando o intervalo mínimo passou, o que permite chamá-lo a cada geração.
+    
+    A etiqueta (tag) identifica a execução a que o checkpoint pertence
+    (ex.: configuração e repetição do ajuste de parâmetros); load ignora
+    checkpoints com outra etiqueta.
+    """
+    
+    def __init__(self, path: str, interval: float = 5.0, tag: Any = None):
+        """
+        Inicializa o checkpointer.
+        
+        Args:
+            path: Arquivo de checkpoint
+            interval: Intervalo mínimo entre gravações (segundos)
+            tag: Etiqueta da execução atual
+        """
+        self.path = path
+        self.interval = interval
+        self.tag = tag
+        
+        self._last_save = time.perf_counter()
+        self.n_saves = 0
+        self.save_time = 0.0
+    
+    def due(self) -> bool:
+        """
+        Indica se o intervalo mínimo desde a última gravação já passou.
+        """
+        return time.perf_counter() - self._last_save >= self.interval
+    
+    def save(self, state: Dict):
+        """
+        Grava o estado de forma atômica.
+        
+        Args:
+            state: Estado serializável com pickle
+        """
+        start = time.perf_counter()
+        
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'tag': self.tag, 'state': state}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        
+        self._last_save = time.perf_counter()
+        self.n_saves += 1
+        self.save_time += self._last_save - start
+    
+    def save_if_due(self, build_state: Callable[[], Dict]) -> bool:
+        """
+        Grava o estado se o intervalo mínimo passou.
+        
+        Args:
+            build_state: Função que constrói o estado (chamada só se necessário)
+        
+        Returns:
+            True se o checkpoint foi gravado
+        """
+        if not self.due():
+            return False
+        self.save(build_state())
+        return True
+    
+    def load(self) -> Optional[Dict]:
+        """
+        Carrega o último checkpoint da execução atual.
+        
+        Returns:
+            Estado gravado ou None (sem checkpoint, etiqueta diferente ou
+            arquivo ilegível)
+        """
+        if not os.path.exists(self.path):
+            return None
+        
+        try:
+            with open(self.path, 'rb') as f:
+                checkpoint = pickle.load(f)
+        except Exception as e:
+            print(f"Aviso: checkpoint ilegível ignorado ({self.path}): {e}")
+            return None
+        
+        if checkpoint.get('tag') != self.tag:
+            return None
+        return checkpoint['state']
+    
+    def clear(self):
+        """
+        Remove o checkpoint (execução concluída).
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
\ No newline at end of file
@@ -1,7 +1,10 @@
-import fastf1
+import os
+import time
 import pandas as pd
 import numpy as np
-from typing import Optional
+from typing import Dict, List, Optional
+from .lap_store import LapStore
+from .synthetic_data import SyntheticRaceSource
 
 
 class DataHandler:
@@ -9,52 +12,336 @@ class DataHandler:
     Classe responsável por buscar e preparar os dados de uma corrida de F1.
     """
     
-    def __init__(self, cache_dir: str = "data/cache"):
+    # Incrementar sempre que _preprocess_data mudar (invalida o armazenamento de voltas)
+    PREPROCESSING_VERSION = 1
+    
+    # Perfis de carga da sessão (argumentos de Session.load do FastF1)
+    LOAD_PROFILES = {
+        'laps': {'laps': True, 'telemetry': False, 'weather': False, 'messages': False},
+        'laps+weather': {'laps': True, 'telemetry': False, 'weather': True, 'messages': False},
+        'full': {'laps': True, 'telemetry': True, 'weather': True, 'messages': True}
+    }
+    
+    # Fontes de dados suportadas (a variável de ambiente F1_DATA_SOURCE define o padrão)
+    DATA_SOURCES = ['fastf1', 'synthetic']
+    
+    def __init__(self, cache_dir: str = "data/cache", lap_store_dir: Optional[str] = "data/lap_store",
+                 load_profile: str = 'laps', source=None):
         """
         Inicializa o DataHandler com configuração de cache.
         
         Args:
             cache_dir: Diretório para armazenar o cache dos dados
+            lap_store_dir: Diretório do armazenamento colunar de voltas pré-processadas
+                (None desativa o armazenamento)
+            load_profile: Perfil padrão de carga da sessão ('laps', 'laps+weather' ou 'full');
+                telemetria e clima são carregados sob demanda quando pedidos
+            source: Fonte dos dados: 'fastf1', 'synthetic' ou uma instância de
+                SyntheticRaceSource (padrão: F1_DATA_SOURCE ou 'fastf1')
         """
-        # Configurar o cache do FastF1
-        fastf1.Cache.enable_cache(cache_dir)
+        if load_profile not in self.LOAD_PROFILES:
+            raise ValueError(f"Perfil de carga não suportado: {load_profile}")
+        
+        self.load_profile = load_profile
+        
+        # Fonte sintética (None para o FastF1)
+        source = source or os.environ.get('F1_DATA_SOURCE', 'fastf1')
+        if isinstance(source, str):
+            if source not in self.DATA_SOURCES:
+                raise ValueError(f"Fonte de dados não suportada: {source}")
+            source = SyntheticRaceSource() if source == 'synthetic' else None
+        self.source = source
+        
+        # Corridas sintéticas são geradas sob demanda e não vão para o armazenamento
+        if self.source is not None:
+            lap_store_dir = None
+        
+        # O FastF1 (e seu cache) é configurado apenas na primeira carga de sessão
         self.cache_dir = cache_dir
+        self._fastf1 = None
+        
+        # Armazenamento em disco consultado antes do FastF1
+        self.lap_store = LapStore(lap_store_dir, self.PREPROCESSING_VERSION) if lap_store_dir else None
+        
+        # Voltas pré-processadas de cada sessão já carregada: {(ano, corrida): DataFrame}
+        self._session_laps = {}
+        
+        # Sessões do FastF1 carregadas e o que foi carregado: {(ano, corrida): (sessão, flags)}
+        self._sessions = {}
+        
+        # Tempo de cada fase de carga: {(ano, corrida): {fase: segundos}}
+        self.load_timings = {}
     
-    def get_race_data(self, year: int, race_name: str, driver_code: str) -> pd.DataFrame:
+    def _get_fastf1(self):
         """
-        Obtém e processa os dados de uma corrida específica para um piloto.
+        Importa o FastF1 e configura o cache na primeira utilização.
+        
+        Returns:
+            Módulo fastf1
+        """
+        if self._fastf1 is None:
+            import fastf1
+            fastf1.Cache.enable_cache(self.cache_dir)
+            self._fastf1 = fastf1
+        return self._fastf1
+    
+    def load_session(self, year: int, race_name: str, profile: Optional[str] = None,
+                     telemetry: bool = False, weather: bool = False):
+        """
+        Carrega (ou reutiliza) a sessão da corrida no FastF1.
+        
+        Uma sessão já carregada é reutilizada se contém o que foi pedido; caso
+        contrário é recarregada incluindo também o que já estava carregado.
+        
+        Args:
+            year: Ano da corrida
+            race_name: Nome da corrida
+            profile: Perfil de carga (padrão: self.load_profile)
+            telemetry: Incluir telemetria, independentemente do perfil
+            weather: Incluir dados de clima, independentemente do perfil
+            
+        Returns:
+            Sessão do FastF1 carregada
+        """
+        profile = profile or self.load_profile
+        if profile not in self.LOAD_PROFILES:
+            raise ValueError(f"Perfil de carga não suportado: {profile}")
+        
+        if self.source is not None:
+            raise ValueError("Sessão do FastF1 indisponível com a fonte de dados sintética")
+        
+        flags = dict(self.LOAD_PROFILES[profile])
+        flags['telemetry'] = flags['telemetry'] or telemetry
+        flags['weather'] = flags['weather'] or weather
+        
+        key = (year, race_name)
+        if key in self._sessions:
+            session, loaded = self._sessions[key]
+            if all(loaded[name] or not enabled for name, enabled in flags.items()):
+                return session
+            flags = {name: enabled or loaded[name] for name, enabled in flags.items()}
+        
+        timings = self.load_timings.setdefault(key, {})
+        
+        start = time.perf_counter()
+        session = self._get_fastf1().get_session(year, race_name, 'R')
+        timings['get_session'] = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        session.load(**flags)
+        timings['load'] = time.perf_counter() - start
+        
+        self._sessions[key] = (session, flags)
+        return session
+    
+    def get_session_laps(self, year: int, race_name: str, profile: Optional[str] = None) -> pd.DataFrame:
+        """
+        Obtém as voltas pré-processadas de todos os pilotos de uma corrida.
+        
+        A sessão é carregada uma única vez; chamadas seguintes (inclusive via
+        get_race_data) reutilizam as voltas em memória. O armazenamento de
+        voltas é consultado antes do FastF1 e preenchido após cada carga.
         
         Args:
             year: Ano da corrida
             race_name: Nome da corrida (ex: 'Monaco Grand Prix')
-            driver_code: Código do piloto (ex: 'HAM', 'VER')
+            profile: Perfil de carga da sessão (padrão: self.load_profile)
             
         Returns:
-            DataFrame processado com os dados da corrida
+            DataFrame processado com as voltas de todos os pilotos (coluna Driver)
         """
+        key = (year, race_name)
+        if key in self._session_laps:
+            return self._session_laps[key]
+        
+        timings = self.load_timings.setdefault(key, {})
+        
+        # Consultar o armazenamento de voltas (sem acessar o FastF1)
+        if self.lap_store is not None:
+            start = time.perf_counter()
+            stored_laps = self.lap_store.load(year, race_name)
+            timings['store_read'] = time.perf_counter() - start
+            if stored_laps is not None:
+                self._session_laps[key] = stored_laps
+                self._report_timings(year, race_name)
+                return stored_laps
+        
         try:
-            # Carregar a sessão da corrida
-            session = fastf1.get_session(year, race_name, 'R')
-            session.load()
+            if self.source is not None:
+                # Gerar a corrida sintética
+                start = time.perf_counter()
+                raw_laps = self.source.get_session_laps(year, race_name)
+                timings['generate'] = time.perf_counter() - start
+            else:
+                # Carregar a sessão da corrida
+                raw_laps = pd.DataFrame(self.load_session(year, race_name, profile).laps)
             
-            # Filtrar dados para o piloto específico
-            driver_data = session.laps.pick_driver(driver_code)
+            # Pré-processamento vetorizado de todos os pilotos de uma vez
+            start = time.perf_counter()
+            session_laps = self._preprocess_data(raw_laps)
+            timings['preprocess'] = time.perf_counter() - start
+            
+        except Exception as e:
+            print(f"Erro ao carregar dados: {e}")
+            return pd.DataFrame()
+        
+        if self.lap_store is not None:
+            start = time.perf_counter()
+            self.lap_store.save(year, race_name, session_laps)
+            timings['store_write'] = time.perf_counter() - start
+        
+        self._session_laps[key] = session_laps
+        self._report_timings(year, race_name)
+        return session_laps
+    
+    def _report_timings(self, year: int, race_name: str):
+        """
+        Exibe o tempo de cada fase de carga de uma sessão.
+        """
+        timings = self.load_timings.get((year, race_name), {})
+        if timings:
+            phases = ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in timings.items())
+            print(f"⏱️ Carga {year} {race_name}: {phases}")
+    
+    def get_weather_data(self, year: int, race_name: str) -> pd.DataFrame:
+        """
+        Obtém os dados de clima da corrida (carregados sob demanda).
+        
+        Args:
+            year: Ano da corrida
+            race_name: Nome da corrida
+            
+        Returns:
+            DataFrame com os dados de clima
+        """
+        try:
+            session = self.load_session(year, race_name, weather=True)
+            return session.weather_data
+        except Exception as e:
+            print(f"Erro ao carregar dados de clima: {e}")
+            return pd.DataFrame()
+    
+    def get_telemetry(self, year: int, race_name: str, driver_code: str,
+                      lap_number: Optional[int] = None) -> pd.DataFrame:
+        """
+        Obtém a telemetria de um piloto (carregada sob demanda).
+        
+        Args:
+            year: Ano da corrida
+            race_name: Nome da corrida
+            driver_code: Código do piloto
+            lap_number: Volta específica (padrão: todas as voltas do piloto)
             
-            # Pré-processamento dos dados
-            processed_data = self._preprocess_data(driver_data)
+        Returns:
+            DataFrame com a telemetria
+        """
+        try:
+            session = self.load_session(year, race_name, telemetry=True)
             
-            return processed_data
+            start = time.perf_counter()
+            laps = session.laps[session.laps['Driver'] == driver_code]
+            if lap_number is not None:
+                laps = laps[laps['LapNumber'] == lap_number]
+            if laps.empty:
+                return pd.DataFrame()
+            
+            telemetry = laps.get_telemetry()
+            self.load_timings[(year, race_name)]['telemetry'] = time.perf_counter() - start
+            return telemetry
             
         except Exception as e:
-            print(f"Erro ao carregar dados: {e}")
+            print(f"Erro ao carregar telemetria: {e}")
+            return pd.DataFrame()
+    
+    def get_drivers(self, year: int, race_name: str) -> List[str]:
+        """
+        Obtém os códigos dos pilotos com voltas válidas em uma corrida.
+        
+        Args:
+            year: Ano da corrida
+            race_name: Nome da corrida
+            
+        Returns:
+            Lista de códigos de pilotos na ordem da sessão
+        """
+        session_laps = self.get_session_laps(year, race_name)
+        if session_laps.empty:
+            return []
+        return session_laps['Driver'].unique().tolist()
+    
+    def get_grid_simulators(self, year: int, race_name: str,
+                            drivers: Optional[List[str]] = None,
+                            profile: Optional[str] = None, **kwargs) -> Dict:
+        """
+        Cria simuladores para vários pilotos (padrão: o grid inteiro) com uma
+        única carga da sessão e um único ajuste dos parâmetros.
+        
+        Args:
+            year: Ano da corrida
+            race_name: Nome da corrida
+            drivers: Códigos dos pilotos (padrão: todos)
+            profile: Perfil de carga da sessão (padrão: self.load_profile)
+            **kwargs: Argumentos repassados a cada RaceSimulator
+            
+        Returns:
+            Dicionário {piloto: RaceSimulator}
+        """
+        from .race_simulator import RaceSimulator
+        
+        session_laps = self.get_session_laps(year, race_name, profile)
+        if session_laps.empty:
+            return {}
+        
+        for driver, laps in session_laps.groupby('Driver', sort=False):
+            if (drivers is None or driver in drivers) and len(laps) < 10:
+                print(f"Aviso: Poucos dados precisos encontrados para análise ({driver})")
+        
+        return RaceSimulator.from_session_laps(session_laps, drivers=drivers, **kwargs)
+    
+    def get_race_data(self, year: int, race_name: str, driver_code: str,
+                      profile: Optional[str] = None) -> pd.DataFrame:
+        """
+        Obtém e processa os dados de uma corrida específica para um piloto.
+        
+        Args:
+            year: Ano da corrida
+            race_name: Nome da corrida (ex: 'Monaco Grand Prix')
+            driver_code: Código do piloto (ex: 'HAM', 'VER')
+            profile: Perfil de carga da sessão (padrão: self.load_profile)
+            
+        Returns:
+            DataFrame processado com os dados da corrida
+        """
+        processed_data = None
+        
+        # Apenas o piloto pedido, direto do armazenamento (se a sessão não está em memória)
+        if (year, race_name) not in self._session_laps and self.lap_store is not None:
+            processed_data = self.lap_store.load(year, race_name, driver_code)
+        
+        if processed_data is None:
+            # Voltas da sessão (carregada apenas na primeira chamada)
+            session_laps = self.get_session_laps(year, race_name, profile)
+            if session_laps.empty:
+                return pd.DataFrame()
+            
+            # Filtrar dados para o piloto específico
+            processed_data = session_laps[session_laps['Driver'] == driver_code].copy()
+        
+        if processed_data.empty:
             return pd.DataFrame()
+        
+        # Garantir que temos dados suficientes
+        if len(processed_data) < 10:
+            print("Aviso: Poucos dados precisos encontrados para análise")
+        
+        return processed_data
     
     def _preprocess_data(self, driver_data: pd.DataFrame) -> pd.DataFrame:
         """
-        Pré-processa os dados do piloto.
+        Pré-processa os dados de um ou mais pilotos (operações vetorizadas).
         
         Args:
-            driver_data: DataFrame com dados brutos do piloto
+            driver_data: DataFrame com dados brutos (de um piloto ou da sessão inteira)
             
         Returns:
             DataFrame processado
@@ -62,20 +349,15 @@ class DataHandler:
         if driver_data.empty:
             return pd.DataFrame()
         
-        # Converter LapTime para segundos
-        driver_data['LapTimeSeconds'] = driver_data['LapTime'].dt.total_seconds()
-        
         # Filtrar apenas voltas precisas (remover entrada/saída dos boxes e Safety Car)
         accurate_laps = driver_data[driver_data['IsAccurate'] == True].copy()
         
+        # Converter LapTime para segundos
+        accurate_laps['LapTimeSeconds'] = accurate_laps['LapTime'].dt.total_seconds()
+        
         # Remover voltas com valores nulos ou inválidos
         accurate_laps = accurate_laps.dropna(subset=['LapTimeSeconds', 'TyreLife', 'Compound'])
         
-        # Garantir que temos dados suficientes
-        if len(accurate_laps) < 10:
-            print("Aviso: Poucos dados precisos encontrados para análise")
-            return accurate_laps
-        
         return accurate_laps
     
     def get_available_compounds(self, race_data: pd.DataFrame) -> list:
@@ -0,0 +1,210 @@
+import time
+import numpy as np
+from typing import List, Tuple, Optional
+from .race_simulator import RaceSimulator
+
+
+class Solution:
+    """
+    Representa a estratégia ótima encontrada pela programação dinâmica.
+    """
+    
+    def __init__(self, strategy: List[Tuple[int, str]], total_time: float):
+        """
+        Inicializa a solução.
+        
+        Args:
+            strategy: Lista de tuplas (volta_parada, composto_novo)
+            total_time: Tempo total da corrida (avaliado pelo simulador)
+        """
+        self.strategy = strategy
+        self.total_time = total_time
+    
+    def __str__(self):
+        return f"Strategy: {self.strategy}, Time: {self.total_time:.2f}s"
+
+
+class DynamicProgrammingSolver:
+    """
+    Solver exato por programação dinâmica para estratégias de pit stop.
+    
+    Como o modelo de tempo de volta é determinístico, o ótimo global é obtido
+    por DP sobre (volta da parada, composto, paradas usadas, uso de um segundo
+    composto). A idade do pneu é tratada dentro de cada stint pela tabela de
+    custos de stint, vetorizada sobre todas as voltas finais possíveis.
+    """
+    
+    def __init__(self, simulator: RaceSimulator,
+                 max_stops: int = 3,
+                 min_pit_lap: int = 1,
+                 max_pit_lap: Optional[int] = None):
+        """
+        Inicializa o solver.
+        
+        Args:
+            simulator: Instância do simulador de corrida
+            max_stops: Número máximo de paradas (regra de até 3 paradas)
+            min_pit_lap: Primeira volta em que uma parada é permitida
+            max_pit_lap: Última volta em que uma parada é permitida (padrão: total de voltas)
+        """
+        self.simulator = simulator
+        self.model = simulator.compile()
+        self.total_laps = simulator.total_laps
+        self.max_stops = max_stops
+        self.min_pit_lap = max(1, min_pit_lap)
+        self.max_pit_lap = self.total_laps if max_pit_lap is None else min(max_pit_lap, self.total_laps)
+        
+        # Obter compostos disponíveis
+        self.available_compounds = list(self.model.race_compounds)
+        
+        # Se não há compostos, usar padrão
+        if not self.available_compounds:
+            self.available_compounds = ['SOFT', 'MEDIUM', 'HARD']
+        
+        self.best_solution = None
+        self.solve_time = 0.0
+    
+    def _stint_cost_matrix(self, compound_ids: np.ndarray) -> np.ndarray:
+        """
+        Custo de todos os stints possíveis para cada composto.
+        
+        Args:
+            compound_ids: Ids dos compostos (no modelo compilado)
+        
+        Returns:
+            Array (compostos, total_laps + 2, total_laps + 2) com o tempo do stint
+            da volta a até b - 1 em [c, a, b] (infinito se b < a)
+        """
+        size = self.total_laps + 2
+        start_laps = np.arange(size)[:, None]
+        end_laps = np.arange(size)[None, :]
+        valid = (start_laps >= 1) & (end_laps >= start_laps)
+        
+        shape = (len(compound_ids), size, size)
+        compounds = np.broadcast_to(compound_ids[:, None, None], shape)
+        starts = np.broadcast_to(np.where(valid, start_laps, 1), shape)
+        ends = np.broadcast_to(np.where(valid, end_laps, 1), shape)
+        
+        costs = np.array(self.model.stint_times(compounds, starts, ends), dtype=float)
+        costs[:, ~valid] = np.inf
+        
+        return costs
+    
+    def run(self) -> Solution:
+        """
+        Resolve o problema de forma exata.
+        
+        Returns:
+            Solução ótima (estratégia e tempo total)
+        """
+        start_time = time.time()
+        self.model = self.simulator.compile()
+        
+        size = self.total_laps + 2
+        end_lap = self.total_laps + 1
+        pit_stop_time = self.model.pit_stop_time
+        
+        # Ids dos compostos disponíveis e do composto inicial
+        encoded = self.model.encode_strategies([
+            [(1, compound) for compound in self.available_compounds] + [(1, self.model.initial_compound)]
+        ])[0, :, 1]
+        compound_ids, initial_id = encoded[:-1], encoded[-1]
+        differs = compound_ids != initial_id
+        n_compounds = len(compound_ids)
+        
+        costs = self._stint_cost_matrix(compound_ids)
+        initial_costs = self._stint_cost_matrix(np.array([initial_id]))[0]
+        
+        # Voltas em que uma parada é permitida
+        laps = np.arange(size)
+        pit_allowed = (laps >= self.min_pit_lap) & (laps <= self.max_pit_lap)
+        
+        # Stints entre paradas precisam ter pelo menos uma volta
+        transition_costs = np.where(laps[None, :] > laps[:, None], costs, np.inf)
+        transition_costs = np.where(pit_allowed[None, None, :], transition_costs, np.inf)
+        
+        # value[f, d, p]: menor tempo até uma parada na volta p trocando para o
+        # composto d, com f = 1 se algum composto diferente do inicial já foi usado
+        # (inclui os pit stops de todas as paradas anteriores, sem o desta)
+        first_stint = np.where(pit_allowed, initial_costs[1, :], np.inf)
+        value = np.full((2, n_compounds, size), np.inf)
+        value[1, differs, :] = first_stint
+        value[0, ~differs, :] = first_stint
+        
+        best_total = np.inf
+        best_end = None
+        back_pointers = []
+        
+        for stops in range(1, self.max_stops + 1):
+            # Encerrar a corrida após esta parada (a última parada não paga pit stop)
+            final_totals = value[1] + costs[:, :, end_lap]
+            index = np.unravel_index(np.argmin(final_totals), final_totals.shape)
+            if final_totals[index] < best_total:
+                best_total = final_totals[index]
+                best_end = (stops, 1, index[0], index[1])
+            
+            if stops == self.max_stops:
+                break
+            
+            # Próxima parada na volta q: minimizar sobre (composto atual, volta atual)
+            totals = value[:, :, :, None] + pit_stop_time + transition_costs[None, :, :, :]
+            totals = totals.reshape(2, n_compounds * size, size)
+            best_previous = np.argmin(totals, axis=1)
+            best_values = np.take_along_axis(totals, best_previous[:, None, :], axis=1)[:, 0, :]
+            
+            new_value = np.full((2, n_compounds, size), np.inf)
+            pointers = np.zeros((2, n_compounds, size, 2), dtype=np.int64)
+            
+            # Trocar para um composto diferente do inicial satisfaz a regra
+            use_flagged = best_values[1] <= best_values[0]
+            new_value[1, differs, :] = np.where(use_flagged, best_values[1], best_values[0])
+            pointers[1, differs, :, 0] = np.where(use_flagged, 1, 0)
+            pointers[1, differs, :, 1] = np.where(use_flagged, best_previous[1], best_previous[0])
+            
+            # Voltar ao composto inicial mantém o estado da regra
+            for flag in (0, 1):
+                new_value[flag, ~differs, :] = best_values[flag]
+                pointers[flag, ~differs, :, 0] = flag
+                pointers[flag, ~differs, :, 1] = best_previous[flag]
+            
+            back_pointers.append(pointers)
+            value = new_value
+        
+        if best_end is None or not np.isfinite(best_total):
+            # Nenhuma estratégia válida no intervalo de voltas permitido
+            self.best_solution = Solution([], float('inf'))
+            self.solve_time = time.time() - start_time
+            return self.best_solution
+        
+        # Reconstruir a estratégia a partir dos ponteiros
+        stops, flag, compound, lap = best_end
+        strategy = [(int(lap), self.available_compounds[compound])]
+        for layer in range(stops - 2, -1, -1):
+            flag, previous = back_pointers[layer][flag, compound, lap]
+            compound, lap = divmod(int(previous), size)
+            strategy.append((int(lap), self.available_compounds[compound]))
+        strategy.reverse()
+        
+        self.best_solution = Solution(strategy, self.simulator.evaluate_strategy(strategy))
+        self.solve_time = time.time() - start_time
+        
+        return self.best_solution
+    
+    def optimality_gap(self, total_time: float) -> float:
+        """
+        Calcula a distância percentual de um tempo até o ótimo.
+        
+        Args:
+            total_time: Tempo total obtido por outro algoritmo
+        
+        Returns:
+            Diferença percentual em relação ao tempo ótimo
+        """
+        if self.best_solution is None:
+            self.run()
+        
+        optimal_time = self.best_solution.total_time
+        if not np.isfinite(optimal_time) or optimal_time <= 0:
+            return float('inf')
+        
+        return ((total_time - optimal_time) / optimal_time) * 100
\ No newline at end of file
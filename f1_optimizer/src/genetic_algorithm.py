@@ -1,26 +1,43 @@
-import random
 import numpy as np
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union, TYPE_CHECKING
+from .race_model import CompiledRaceModel
 from .race_simulator import RaceSimulator
-import pandas as pd
+from .stopping_criteria import StoppingCriteria
+from .checkpoint import Checkpointer
+
+if TYPE_CHECKING:
+    from .parallel_evaluation import ParallelEvaluator
 
 
 class Individual:
     """
     Representa um indivíduo (estratégia) no algoritmo genético.
+    
+    O cromossomo é imutável: uma tupla canônica (paradas ordenadas por volta,
+    ordenação estável) que pode ser usada como chave do cache de fitness.
+    Crossover e mutação criam novos indivíduos em vez de alterar os existentes.
     """
     
-    def __init__(self, chromosome: List[Tuple[int, str]], fitness: float = 0.0):
+    __slots__ = ('_chromosome', 'fitness')
+    
+    def __init__(self, chromosome, fitness: float = 0.0):
         """
         Inicializa um indivíduo.
         
         Args:
-            chromosome: Lista de tuplas (volta_parada, composto_novo)
+            chromosome: Sequência de tuplas (volta_parada, composto_novo)
             fitness: Valor de fitness (inverso do tempo total)
         """
-        self.chromosome = chromosome
+        self._chromosome = RaceSimulator._canonical_strategy(chromosome)
         self.fitness = fitness
     
+    @property
+    def chromosome(self) -> Tuple[Tuple[int, str], ...]:
+        """
+        Cromossomo canônico (somente leitura).
+        """
+        return self._chromosome
+    
     def __str__(self):
         return f"Strategy: {self.chromosome}, Fitness: {self.fitness:.6f}"
 
@@ -30,22 +47,44 @@ class GeneticAlgorithm:
     Implementação do Algoritmo Genético para otimização de estratégias de pit stop.
     """
     
-    def __init__(self, simulator: RaceSimulator, 
+    MUTATION_TYPES = ('change_lap', 'change_compound', 'add_pit', 'remove_pit')
+    
+    def __init__(self, simulator: Union[RaceSimulator, CompiledRaceModel], 
                  population_size: int = 50,
                  generations: int = 100,
                  mutation_rate: float = 0.1,
                  crossover_rate: float = 0.8,
-                 elitism_size: int = 5):
+                 elitism_size: int = 5,
+                 executor: Optional['ParallelEvaluator'] = None,
+                 stopping_criteria: Optional[StoppingCriteria] = None,
+                 local_search_size: int = 0,
+                 local_search_radius: int = 2,
+                 local_search_budget: int = 200,
+                 checkpointer: Optional[Checkpointer] = None,
+                 seed: Union[None, int, np.random.SeedSequence, np.random.Generator] = None):
         """
         Inicializa o algoritmo genético.
         
         Args:
-            simulator: Instância do simulador de corrida
+            simulator: Instância do simulador de corrida ou modelo compilado
             population_size: Tamanho da população
             generations: Número de gerações
             mutation_rate: Taxa de mutação
             crossover_rate: Taxa de crossover
             elitism_size: Número de melhores indivíduos para elitismo
+            executor: Avaliador paralelo opcional (ParallelEvaluator) usado nas
+                avaliações em lote
+            stopping_criteria: Critérios de parada antecipada (None executa
+                todas as gerações)
+            local_search_size: Melhores filhos de cada geração refinados por
+                busca local (0 desativa a busca local)
+            local_search_radius: Deslocamento máximo (em voltas) de cada parada
+                na vizinhança
+            local_search_budget: Máximo de avaliações da busca local por geração
+            checkpointer: Checkpoints periódicos da execução; run() retoma do
+                último checkpoint, se existir
+            seed: Semente, SeedSequence ou np.random.Generator do fluxo
+                aleatório próprio da execução (None usa entropia do sistema)
         """
         self.simulator = simulator
         self.population_size = population_size
@@ -53,18 +92,53 @@ class GeneticAlgorithm:
         self.mutation_rate = mutation_rate
         self.crossover_rate = crossover_rate
         self.elitism_size = elitism_size
+        self.executor = executor
+        self.stopping_criteria = stopping_criteria
+        self.local_search_size = local_search_size
+        self.local_search_radius = local_search_radius
+        self.local_search_budget = local_search_budget
+        self.checkpointer = checkpointer
+        
+        # Fluxo aleatório próprio (independente dos geradores globais)
+        self.rng = np.random.default_rng(seed)
+        
+        # Modelo compilado (sem pandas) usado em tempo de execução
+        self.model = simulator.compile()
         
         # Obter compostos disponíveis
-        self.available_compounds = list(simulator.race_data['Compound'].unique())
-        self.available_compounds = [c for c in self.available_compounds if pd.notna(c)]
+        self.available_compounds = list(self.model.race_compounds)
         
         # Se não há compostos, usar padrão
         if not self.available_compounds:
             self.available_compounds = ['SOFT', 'MEDIUM', 'HARD']
         
         self.total_laps = simulator.total_laps
+        self.min_pit_lap, self.max_pit_lap = self.model.pit_window()
+        self.population = []
         self.best_individual = None
         self.fitness_history = []
+        
+        # Fitness por cromossomo canônico (válido para o modelo compilado atual)
+        self._fitness_cache = {}
+        
+        # Cromossomos únicos e efetivamente avaliados em cada geração
+        self.evaluation_stats = []
+        
+        # Avaliações efetivas (estratégias simuladas) acumuladas em cada geração
+        # do histórico e motivo da parada da última execução
+        self.evaluations = 0
+        self.evaluation_history = []
+        self.stop_reason = None
+        
+        # Estatísticas do avaliador paralelo na última execução
+        self.parallel_stats = None
+        self._parallel_stats_start = None
+        
+        # Contribuição da busca local (cromossomos encontrados por ela e
+        # melhora do melhor tempo atribuída a ela)
+        self._local_search_chromosomes = set()
+        self._best_fitness_so_far = 0.0
+        self.local_search_stats = {}
     
     def create_initial_population(self) -> List[Individual]:
         """
@@ -92,40 +166,36 @@ class GeneticAlgorithm:
         strategy = []
         
         # Número de paradas (0 a 3)
-        num_pits = random.randint(0, 3)
+        num_pits = int(self.rng.integers(0, 4))
         
         if num_pits == 0:
             return strategy
         
         # Gerar paradas
-        pit_laps = []
-        for _ in range(num_pits):
-            # Volta entre 5 e total_laps - 5
-            lap = random.randint(5, max(6, self.total_laps - 5))
-            pit_laps.append(lap)
-        
-        # Ordenar voltas de parada
-        pit_laps.sort()
+        # Voltas na janela de paradas, ordenadas
+        pit_laps = sorted(self.rng.integers(self.min_pit_lap, self.max_pit_lap + 1, size=num_pits).tolist())
         
         # Gerar compostos para cada parada
         compounds_used = set()
-        for lap in pit_laps:
-            compound = random.choice(self.available_compounds)
+        compound_indices = self.rng.integers(0, len(self.available_compounds), size=num_pits).tolist()
+        for lap, compound_index in zip(pit_laps, compound_indices):
+            compound = self.available_compounds[compound_index]
             compounds_used.add(compound)
             strategy.append((lap, compound))
         
         # Garantir que pelo menos dois compostos diferentes são usados
         if len(compounds_used) < 2 and len(strategy) > 0:
             # Adicionar um composto diferente
-            different_compound = random.choice([c for c in self.available_compounds if c not in compounds_used])
-            if different_compound:
-                strategy.append((random.randint(10, self.total_laps - 5), different_compound))
+            different_compounds = [c for c in self.available_compounds if c not in compounds_used]
+            if different_compounds:
+                different_compound = different_compounds[int(self.rng.integers(0, len(different_compounds)))]
+                strategy.append((int(self.rng.integers(10, self.max_pit_lap + 1)), different_compound))
         
         return strategy
     
     def calculate_fitness(self, individual: Individual) -> float:
         """
-        Calcula o fitness de um indivíduo.
+        Calcula o fitness de um indivíduo (consultando o cache de fitness).
         
         Args:
             individual: Indivíduo a ser avaliado
@@ -133,34 +203,246 @@ class GeneticAlgorithm:
         Returns:
             Valor de fitness (inverso do tempo total)
         """
+        fitness = self._fitness_cache.get(individual.chromosome)
+        if fitness is not None:
+            return fitness
+        
         try:
             total_time = self.simulator.evaluate_strategy(individual.chromosome)
+            fitness = self._fitness_from_time(individual.chromosome, total_time)
             
-            # Penalidade para estratégias inválidas
-            penalty = 0.0
+        except Exception as e:
+            print(f"Erro ao calcular fitness: {e}")
+            return 0.0
+        
+        self._fitness_cache[individual.chromosome] = fitness
+        return fitness
+    
+    def calculate_fitness_batch(self, individuals: List[Individual]) -> Dict:
+        """
+        Calcula e atribui o fitness de vários indivíduos com uma única chamada
+        ao simulador (RaceSimulator.evaluate_strategies).
+        
+        Cromossomos repetidos são avaliados uma única vez e cromossomos já
+        presentes no cache de fitness não são reavaliados.
+        
+        Args:
+            individuals: Indivíduos a serem avaliados
             
-            # Verificar se usa pelo menos dois compostos diferentes
-            compounds_used = set(compound for _, compound in individual.chromosome)
-            initial_compound = self.simulator.race_data['Compound'].iloc[0]
-            all_compounds_used = compounds_used | {initial_compound}
+        Returns:
+            Dicionário com o número de indivíduos, de cromossomos únicos e de
+            cromossomos efetivamente avaliados
+        """
+        unique = {individual.chromosome for individual in individuals}
+        pending = [chromosome for chromosome in unique if chromosome not in self._fitness_cache]
+        
+        self._evaluate_chromosomes(pending)
+        
+        for individual in individuals:
+            individual.fitness = self._fitness_cache.get(individual.chromosome, 0.0)
+        
+        return {'individuals': len(individuals), 'unique': len(unique), 'evaluated': len(pending)}
+    
+    def _evaluate_chromosomes(self, pending: List[Tuple[Tuple[int, str], ...]]):
+        """
+        Avalia cromossomos fora do cache com uma única chamada ao simulador e
+        registra o fitness no cache.
+        
+        Args:
+            pending: Cromossomos canônicos únicos ainda não avaliados
+        """
+        if not pending:
+            return
+        
+        try:
+            total_times = (self.executor or self.simulator).evaluate_strategies(pending)
+            for chromosome, total_time in zip(pending, total_times.tolist()):
+                self._fitness_cache[chromosome] = self._fitness_from_time(chromosome, total_time)
+        except Exception as e:
+            print(f"Erro na avaliação em lote, avaliando individualmente: {e}")
+            for chromosome in pending:
+                self.calculate_fitness(Individual(chromosome))
+    
+    def neighbourhood(self, chromosome: Tuple[Tuple[int, str], ...]) -> List[Tuple[Tuple[int, str], ...]]:
+        """
+        Vizinhança de um cromossomo para a busca local: cada parada deslocada
+        em até ±local_search_radius voltas (dentro da janela de paradas) e cada
+        parada com os outros compostos.
+        
+        Args:
+            chromosome: Cromossomo canônico
             
-            # REGRA F1: Deve usar pelo menos dois compostos diferentes
-            if len(all_compounds_used) < 2:
-                penalty = 10000.0  # Penalidade muito alta para violar regra F1
+        Returns:
+            Lista de cromossomos canônicos vizinhos (sem repetições)
+        """
+        neighbours = []
+        for index, (lap, compound) in enumerate(chromosome):
+            for offset in range(1, self.local_search_radius + 1):
+                for new_lap in (lap - offset, lap + offset):
+                    if self.min_pit_lap <= new_lap <= self.max_pit_lap:
+                        neighbours.append(self.model.apply_edit(chromosome, ('move', index, new_lap)))
             
-            # Verificar se as voltas de parada são válidas
-            pit_laps = [lap for lap, _ in individual.chromosome]
-            if len(set(pit_laps)) != len(pit_laps):
-                penalty = 500.0  # Penalidade para voltas duplicadas
+            for new_compound in self.available_compounds:
+                if new_compound != compound:
+                    neighbours.append(self.model.apply_edit(chromosome, ('compound', index, new_compound)))
+        
+        return [neighbour for neighbour in dict.fromkeys(neighbours) if neighbour != chromosome]
+    
+    def local_search(self, children: List[Individual]) -> Tuple[List[Individual], int]:
+        """
+        Refina os melhores filhos por subida de encosta (melhor vizinho), com a
+        vizinhança de cada passo avaliada em uma única chamada vetorizada.
+        
+        Respeita o orçamento local_search_budget de avaliações por geração;
+        vizinhos já presentes no cache de fitness não consomem orçamento.
+        
+        Args:
+            children: Filhos da geração, com fitness calculado
             
-            # Fitness é o inverso do tempo total (incluindo penalidades)
-            fitness = 1.0 / (total_time + penalty)
+        Returns:
+            Tupla (filhos com os refinados substituídos, avaliações consumidas)
+        """
+        # Melhores filhos distintos
+        selected = list({
+            child.chromosome: child for child in sorted(children, key=lambda x: x.fitness)
+        }.values())[::-1][:self.local_search_size]
+        
+        evaluated = 0
+        improved = {}
+        for child in selected:
+            current = child
+            while evaluated < self.local_search_budget:
+                neighbours = self.neighbourhood(current.chromosome)
+                pending = [neighbour for neighbour in neighbours if neighbour not in self._fitness_cache]
+                pending = pending[:self.local_search_budget - evaluated]
+                self._evaluate_chromosomes(pending)
+                evaluated += len(pending)
+                
+                best = max((neighbour for neighbour in neighbours if neighbour in self._fitness_cache),
+                           key=self._fitness_cache.get, default=None)
+                if best is None or self._fitness_cache[best] <= current.fitness:
+                    break
+                current = Individual(best, self._fitness_cache[best])
             
-            return fitness
+            if current is not child:
+                improved[child.chromosome] = current
+                self._local_search_chromosomes.add(current.chromosome)
+        
+        self.local_search_stats['evaluations'] += evaluated
+        self.local_search_stats['improved_children'] += len(improved)
+        
+        return [improved.get(child.chromosome, child) for child in children], evaluated
+    
+    def _credit_best_improvement(self):
+        """
+        Atribui a melhora do melhor tempo na geração à busca local, se o novo
+        melhor indivíduo foi encontrado diretamente por ela.
+        """
+        best = max(self.population, key=lambda x: x.fitness)
+        previous = self._best_fitness_so_far
+        if best.fitness <= previous:
+            return
+        
+        gain = 1.0 / previous - 1.0 / best.fitness if previous > 0 else 0.0
+        self.local_search_stats['best_improvement_time'] += gain
+        if best.chromosome in self._local_search_chromosomes:
+            self.local_search_stats['local_improvement_time'] += gain
+        self._best_fitness_so_far = best.fitness
+    
+    def get_local_search_stats(self) -> Dict:
+        """
+        Retorna as estatísticas da busca local da última execução.
+        
+        Returns:
+            Dicionário com avaliações consumidas, filhos melhorados, melhora
+            total do melhor tempo (s) desde a população inicial, parcela
+            obtida diretamente pela busca local (s) e sua fração
+        """
+        stats = dict(self.local_search_stats)
+        total = stats.get('best_improvement_time', 0.0)
+        stats['local_share'] = stats.get('local_improvement_time', 0.0) / total if total > 0 else 0.0
+        return stats
+    
+    def _fitness_from_time(self, chromosome: Tuple[Tuple[int, str], ...], total_time: float) -> float:
+        """
+        Converte o tempo total de uma estratégia em fitness, aplicando as
+        penalidades do GA.
+        
+        Args:
+            chromosome: Estratégia avaliada
+            total_time: Tempo total retornado pelo simulador
             
-        except Exception as e:
-            print(f"Erro ao calcular fitness: {e}")
-            return 0.0
+        Returns:
+            Valor de fitness (inverso do tempo total)
+        """
+        # Penalidade para estratégias inválidas
+        penalty = 0.0
+        
+        # Verificar se usa pelo menos dois compostos diferentes
+        compounds_used = set(compound for _, compound in chromosome)
+        initial_compound = self.model.initial_compound
+        all_compounds_used = compounds_used | {initial_compound}
+        
+        # REGRA F1: Deve usar pelo menos dois compostos diferentes
+        if len(all_compounds_used) < 2:
+            penalty = 10000.0  # Penalidade muito alta para violar regra F1
+        
+        # Verificar se as voltas de parada são válidas
+        pit_laps = [lap for lap, _ in chromosome]
+        if len(set(pit_laps)) != len(pit_laps):
+            penalty = 500.0  # Penalidade para voltas duplicadas
+        
+        # Fitness é o inverso do tempo total (incluindo penalidades)
+        fitness = 1.0 / (total_time + penalty)
+        
+        return fitness
+    
+    def _tournament_indices(self, n_candidates: int, n_tournaments: int,
+                            tournament_size: int = 3) -> np.ndarray:
+        """
+        Sorteia de uma vez os participantes de vários torneios (sem repetição
+        dentro de cada torneio).
+        
+        As linhas com participantes repetidos são sorteadas novamente, o que é
+        raro quando a população é bem maior que o torneio.
+        
+        Args:
+            n_candidates: Número de candidatos
+            n_tournaments: Número de torneios
+            tournament_size: Tamanho do torneio (limitado a n_candidates)
+        
+        Returns:
+            Array (n_tournaments, tournament_size) de índices dos candidatos
+        """
+        tournament_size = min(tournament_size, n_candidates)
+        indices = self.rng.integers(0, n_candidates, size=(n_tournaments, tournament_size))
+        
+        while tournament_size > 1:
+            ordered = np.sort(indices, axis=1)
+            repeated = np.flatnonzero(np.any(ordered[:, 1:] == ordered[:, :-1], axis=1))
+            if len(repeated) == 0:
+                break
+            indices[repeated] = self.rng.integers(0, n_candidates, size=(len(repeated), tournament_size))
+        
+        return indices
+    
+    def select_parents(self, population: List[Individual], n_parents: int,
+                       tournament_size: int = 3) -> List[Individual]:
+        """
+        Seleção por torneio de vários pais com sorteio em lote.
+        
+        Args:
+            population: População atual
+            n_parents: Número de pais
+            tournament_size: Tamanho do torneio
+        
+        Returns:
+            Lista de pais selecionados
+        """
+        fitness = np.array([individual.fitness for individual in population])
+        indices = self._tournament_indices(len(population), n_parents, tournament_size)
+        winners = indices[np.arange(n_parents), np.argmax(fitness[indices], axis=1)]
+        return [population[i] for i in winners.tolist()]
     
     def tournament_selection(self, population: List[Individual], tournament_size: int = 3) -> Individual:
         """
@@ -173,21 +455,27 @@ class GeneticAlgorithm:
         Returns:
             Indivíduo selecionado
         """
-        tournament = random.sample(population, tournament_size)
-        return max(tournament, key=lambda x: x.fitness)
+        return self.select_parents(population, 1, tournament_size)[0]
     
-    def crossover(self, parent1: Individual, parent2: Individual) -> Tuple[Individual, Individual]:
+    def crossover(self, parent1: Individual, parent2: Individual,
+                  draws: Optional[np.ndarray] = None) -> Tuple[Individual, Individual]:
         """
         Crossover de um ponto.
         
         Args:
             parent1: Primeiro pai
             parent2: Segundo pai
-            
+            draws: Dois números uniformes em [0, 1) já sorteados (aplicar o
+                crossover e ponto de corte); None sorteia do fluxo do GA
+        
         Returns:
-            Dois filhos
+            Dois filhos (os próprios pais quando não há crossover; como os
+            cromossomos são imutáveis, eles mantêm o fitness já calculado)
         """
-        if random.random() > self.crossover_rate:
+        if draws is None:
+            draws = self.rng.random(2)
+        
+        if draws[0] > self.crossover_rate:
             return parent1, parent2
         
         # Crossover de um ponto
@@ -199,7 +487,7 @@ class GeneticAlgorithm:
         if max_len == 0:
             return parent1, parent2
         
-        crossover_point = random.randint(0, max_len)
+        crossover_point = int(draws[1] * (max_len + 1))
         
         # Criar filhos
         child1_chromosome = parent1.chromosome[:crossover_point] + parent2.chromosome[crossover_point:]
@@ -210,41 +498,53 @@ class GeneticAlgorithm:
         
         return child1, child2
     
-    def mutate(self, individual: Individual):
+    def mutate(self, individual: Individual, draws: Optional[np.ndarray] = None) -> Individual:
         """
-        Aplica mutação em um indivíduo.
+        Aplica mutação em um indivíduo (cópia na escrita).
         
         Args:
             individual: Indivíduo a ser mutado
+            draws: Cinco números uniformes em [0, 1) já sorteados (aplicar a
+                mutação, tipo, parada, volta e composto); None sorteia do
+                fluxo do GA
+        
+        Returns:
+            Novo indivíduo mutado, ou o próprio indivíduo se não houve mutação
         """
-        if random.random() > self.mutation_rate:
-            return
+        if draws is None:
+            draws = self.rng.random(5)
+        
+        if draws[0] > self.mutation_rate:
+            return individual
+        
+        mutation_type = self.MUTATION_TYPES[int(draws[1] * len(self.MUTATION_TYPES))]
+        chromosome = list(individual.chromosome)
         
-        mutation_type = random.choice(['change_lap', 'change_compound', 'add_pit', 'remove_pit'])
+        # Parada, volta (na janela de paradas) e composto sorteados
+        idx = int(draws[2] * len(chromosome))
+        new_lap = self.min_pit_lap + int(draws[3] * (self.max_pit_lap - self.min_pit_lap + 1))
+        new_compound = self.available_compounds[int(draws[4] * len(self.available_compounds))]
         
-        if mutation_type == 'change_lap' and individual.chromosome:
+        if mutation_type == 'change_lap' and chromosome:
             # Alterar volta de uma parada
-            idx = random.randint(0, len(individual.chromosome) - 1)
-            new_lap = random.randint(5, max(6, self.total_laps - 5))
-            individual.chromosome[idx] = (new_lap, individual.chromosome[idx][1])
+            chromosome[idx] = (new_lap, chromosome[idx][1])
         
-        elif mutation_type == 'change_compound' and individual.chromosome:
+        elif mutation_type == 'change_compound' and chromosome:
             # Alterar composto de uma parada
-            idx = random.randint(0, len(individual.chromosome) - 1)
-            new_compound = random.choice(self.available_compounds)
-            individual.chromosome[idx] = (individual.chromosome[idx][0], new_compound)
+            chromosome[idx] = (chromosome[idx][0], new_compound)
         
         elif mutation_type == 'add_pit':
             # Adicionar uma parada
-            new_lap = random.randint(5, max(6, self.total_laps - 5))
-            new_compound = random.choice(self.available_compounds)
-            individual.chromosome.append((new_lap, new_compound))
-            individual.chromosome.sort(key=lambda x: x[0])
+            chromosome.append((new_lap, new_compound))
         
-        elif mutation_type == 'remove_pit' and individual.chromosome:
+        elif mutation_type == 'remove_pit' and chromosome:
             # Remover uma parada
-            idx = random.randint(0, len(individual.chromosome) - 1)
-            individual.chromosome.pop(idx)
+            chromosome.pop(idx)
+        
+        else:
+            return individual
+        
+        return Individual(chromosome)
     
     def run(self) -> Individual:
         """
@@ -253,62 +553,257 @@ class GeneticAlgorithm:
         Returns:
             Melhor indivíduo encontrado
         """
-        # Criar população inicial
-        population = self.create_initial_population()
-        
-        # Calcular fitness inicial
-        for individual in population:
-            individual.fitness = self.calculate_fitness(individual)
-        
-        best_fitness = max(individual.fitness for individual in population)
-        self.fitness_history.append(best_fitness)
+        if self.stopping_criteria is not None:
+            self.stopping_criteria.start()
+        
+        state = self.checkpointer.load() if self.checkpointer is not None else None
+        if state is None:
+            self.initialize()
+            start_generation = 0
+        else:
+            start_generation = self.restore_state(state)
+            print(f"♻️ Retomando o GA do checkpoint na geração {start_generation}")
+        self.stop_reason = 'generations'
         
         # Loop principal
-        for generation in range(self.generations):
-            # Ordenar população por fitness
-            population.sort(key=lambda x: x.fitness, reverse=True)
+        for generation in range(start_generation, self.generations):
+            self.evolve_generation(generation)
             
-            # Atualizar melhor indivíduo
-            if self.best_individual is None or population[0].fitness > self.best_individual.fitness:
-                self.best_individual = Individual(
-                    population[0].chromosome.copy(),
-                    population[0].fitness
-                )
+            reason = self.check_stopping_criteria()
+            if reason is not None:
+                self.stop_reason = reason
+                print(f"⏹️ Parada antecipada na geração {generation} ({reason}): "
+                      f"{self.evaluations} avaliações")
+                break
             
-            # Aplicar elitismo
-            new_population = population[:self.elitism_size].copy()
+            if self.checkpointer is not None:
+                self.checkpointer.save_if_due(lambda: self.get_state(generation + 1))
+        
+        self._finish_parallel_stats()
+        if self.checkpointer is not None:
+            self.checkpointer.clear()
+        return self.best_individual
+    
+    def get_state(self, next_generation: int) -> Dict:
+        """
+        Estado completo da execução entre duas gerações (para checkpoints).
+        
+        Inclui a população (na ordem atual), o cache de fitness, os históricos
+        e o estado do fluxo aleatório, de modo que a execução retomada
+        é idêntica à ininterrupta.
+        
+        Args:
+            next_generation: Próxima geração a ser executada
             
-            # Preencher resto da população
-            while len(new_population) < self.population_size:
-                # Seleção
-                parent1 = self.tournament_selection(population)
-                parent2 = self.tournament_selection(population)
-                
-                # Crossover
-                child1, child2 = self.crossover(parent1, parent2)
-                
-                # Mutação
-                self.mutate(child1)
-                self.mutate(child2)
-                
-                # Calcular fitness dos filhos
-                child1.fitness = self.calculate_fitness(child1)
-                child2.fitness = self.calculate_fitness(child2)
-                
-                new_population.extend([child1, child2])
+        Returns:
+            Dicionário serializável com pickle
+        """
+        return {
+            'next_generation': next_generation,
+            'population': self.population,
+            'best_individual': self.best_individual,
+            'fitness_history': self.fitness_history,
+            'evaluation_history': self.evaluation_history,
+            'evaluations': self.evaluations,
+            'evaluation_stats': self.evaluation_stats,
+            'fitness_cache': self._fitness_cache,
+            'local_search_stats': self.local_search_stats,
+            'local_search_chromosomes': self._local_search_chromosomes,
+            'best_fitness_so_far': self._best_fitness_so_far,
+            'rng_state': self.rng.bit_generator.state
+        }
+    
+    def restore_state(self, state: Dict) -> int:
+        """
+        Restaura uma execução a partir de get_state.
+        
+        Args:
+            state: Estado gravado
+            
+        Returns:
+            Próxima geração a ser executada
+        """
+        self.model = self.simulator.compile()
+        self._start_parallel_stats()
+        
+        self.population = list(state['population'])
+        self.best_individual = state['best_individual']
+        self.fitness_history = list(state['fitness_history'])
+        self.evaluation_history = list(state['evaluation_history'])
+        self.evaluations = state['evaluations']
+        self.evaluation_stats = list(state['evaluation_stats'])
+        self._fitness_cache = dict(state['fitness_cache'])
+        self.local_search_stats = dict(state['local_search_stats'])
+        self._local_search_chromosomes = set(state['local_search_chromosomes'])
+        self._best_fitness_so_far = state['best_fitness_so_far']
+        self.rng.bit_generator.state = state['rng_state']
+        
+        return state['next_generation']
+    
+    def initialize(self):
+        """
+        Cria e avalia a população inicial (self.population).
+        """
+        # Garantir que o modelo compilado está atualizado (o cache de fitness vale para ele)
+        self.model = self.simulator.compile()
+        self._fitness_cache = {}
+        
+        # Históricos e melhor indivíduo são da execução atual (reiniciados juntos)
+        self.best_individual = None
+        self.fitness_history = []
+        self.evaluation_stats = []
+        self.evaluations = 0
+        self.evaluation_history = []
+        self._local_search_chromosomes = set()
+        self.local_search_stats = {
+            'evaluations': 0, 'improved_children': 0,
+            'best_improvement_time': 0.0, 'local_improvement_time': 0.0
+        }
+        self._start_parallel_stats()
+        
+        # Criar população inicial
+        self.population = self.create_initial_population()
+        
+        # Calcular fitness inicial (uma única chamada ao simulador)
+        stats = self.calculate_fitness_batch(self.population)
+        self._record_evaluations(-1, stats)
+        
+        best_fitness = max(individual.fitness for individual in self.population)
+        self.fitness_history.append(best_fitness)
+        self._best_fitness_so_far = best_fitness
+    
+    def _record_evaluations(self, generation: int, stats: Dict):
+        """
+        Registra as avaliações de uma geração (estatísticas e total acumulado).
+        """
+        self.evaluation_stats.append({'generation': generation, **stats})
+        self.evaluations += stats['evaluated'] + stats.get('local_evaluated', 0)
+        self.evaluation_history.append(self.evaluations)
+    
+    def check_stopping_criteria(self) -> Optional[str]:
+        """
+        Verifica os critérios de parada antecipada.
+        
+        Returns:
+            Motivo da parada ou None para continuar
+        """
+        if self.stopping_criteria is None:
+            return None
+        return self.stopping_criteria.check(self.fitness_history, self.evaluations)
+    
+    def update_best(self):
+        """
+        Ordena a população por fitness e atualiza o melhor indivíduo.
+        """
+        self.population.sort(key=lambda x: x.fitness, reverse=True)
+        
+        # Melhor indivíduo é imutável e pode ser compartilhado
+        if self.best_individual is None or self.population[0].fitness > self.best_individual.fitness:
+            self.best_individual = self.population[0]
+    
+    def evolve_generation(self, generation: int):
+        """
+        Produz e avalia a próxima geração a partir de self.population.
+        
+        Args:
+            generation: Índice da geração (usado no registro de progresso)
+        """
+        population = self.population
+        self.update_best()
+        
+        # Aplicar elitismo (elites mantêm o fitness, sem reavaliação)
+        new_population = population[:self.elitism_size]
+        children = []
+        
+        # Sorteios da geração em lote (torneios, crossover e mutação)
+        n_pairs = max(0, -(-(self.population_size - len(new_population)) // 2))
+        parents = self.select_parents(population, 2 * n_pairs)
+        crossover_draws = self.rng.random((n_pairs, 2))
+        mutation_draws = self.rng.random((2 * n_pairs, 5))
+        
+        # Preencher resto da população
+        for pair in range(n_pairs):
+            # Crossover
+            child1, child2 = self.crossover(parents[2 * pair], parents[2 * pair + 1], crossover_draws[pair])
             
-            # Manter apenas population_size indivíduos
-            new_population = new_population[:self.population_size]
-            population = new_population
+            # Mutação (gera novos indivíduos; pais e elites não são alterados)
+            child1 = self.mutate(child1, mutation_draws[2 * pair])
+            child2 = self.mutate(child2, mutation_draws[2 * pair + 1])
             
-            # Registrar melhor fitness da geração
-            best_fitness = max(individual.fitness for individual in population)
-            self.fitness_history.append(best_fitness)
+            children.extend([child1, child2])
+            new_population.extend([child1, child2])
+        
+        # Calcular fitness dos filhos da geração em lote
+        # (cromossomos repetidos ou já avaliados não são simulados novamente)
+        stats = self.calculate_fitness_batch(children)
+        
+        # Busca local nos melhores filhos (opcional, com orçamento por geração)
+        if self.local_search_size > 0:
+            children, stats['local_evaluated'] = self.local_search(children)
+            new_population = population[:self.elitism_size] + children
+        
+        self._record_evaluations(generation, stats)
+        
+        # Manter apenas population_size indivíduos
+        self.population = new_population[:self.population_size]
+        self._credit_best_improvement()
+        
+        # Registrar melhor fitness da geração
+        best_fitness = max(individual.fitness for individual in self.population)
+        self.fitness_history.append(best_fitness)
+        
+        if generation % 10 == 0:
+            print(f"Geração {generation}: Melhor fitness = {best_fitness:.6f}")
+    
+    def get_top_individuals(self, k: int) -> List[Individual]:
+        """
+        Retorna os k melhores indivíduos da população atual (ex.: emigrantes).
+        
+        Args:
+            k: Número de indivíduos
             
-            if generation % 10 == 0:
-                print(f"Geração {generation}: Melhor fitness = {best_fitness:.6f}")
+        Returns:
+            Lista de indivíduos em ordem decrescente de fitness
+        """
+        self.update_best()
+        return self.population[:k]
+    
+    def receive_migrants(self, migrants: List[Individual]):
+        """
+        Substitui os piores indivíduos da população pelos imigrantes.
         
-        return self.best_individual
+        O fitness dos imigrantes (calculado com o mesmo modelo) é aproveitado
+        e registrado no cache, sem reavaliação.
+        
+        Args:
+            migrants: Indivíduos vindos de outras populações
+        """
+        migrants = migrants[:len(self.population)]
+        if not migrants:
+            return
+        
+        for migrant in migrants:
+            self._fitness_cache.setdefault(migrant.chromosome, migrant.fitness)
+        
+        self.update_best()
+        self.population[-len(migrants):] = migrants
+    
+    def _start_parallel_stats(self):
+        """
+        Marca o início de uma execução nas estatísticas do avaliador paralelo.
+        """
+        self.parallel_stats = None
+        if self.executor is not None:
+            self._parallel_stats_start = self.executor.get_stats()
+    
+    def _finish_parallel_stats(self):
+        """
+        Calcula e exibe a eficiência paralela da execução.
+        """
+        if self.executor is None:
+            return
+        self.parallel_stats = self.executor.stats_delta(self._parallel_stats_start, self.executor.get_stats())
+        print(self.executor.format_stats(self.parallel_stats))
     
     def get_fitness_history(self) -> List[float]:
         """
@@ -317,4 +812,47 @@ class GeneticAlgorithm:
         Returns:
             Lista com melhor fitness de cada geração
         """
-        return self.fitness_history 
\ No newline at end of file
+        return self.fitness_history 
+    
+    def get_evaluation_stats(self) -> List[Dict]:
+        """
+        Retorna, para cada geração, o número de filhos, de cromossomos únicos e
+        de cromossomos efetivamente avaliados (ausentes do cache de fitness).
+        
+        Returns:
+            Lista de dicionários (geração -1 é a população inicial)
+        """
+        return self.evaluation_stats
+
+
+# Motores disponíveis do algoritmo genético
+GA_ENGINES = ('object', 'array', 'island', 'steady_state')
+
+
+def create_genetic_algorithm(simulator: RaceSimulator, engine: str = 'object', **params) -> GeneticAlgorithm:
+    """
+    Cria o algoritmo genético com o motor escolhido.
+    
+    Args:
+        simulator: Instância do simulador de corrida
+        engine: 'object' (indivíduos como listas de tuplas), 'array'
+            (população em arrays NumPy, para populações grandes), 'island'
+            (subpopulações em processos com migração periódica) ou
+            'steady_state' (substituição incremental dos piores indivíduos)
+        **params: Parâmetros do algoritmo
+        
+    Returns:
+        Instância do algoritmo genético
+    """
+    if engine == 'object':
+        return GeneticAlgorithm(simulator, **params)
+    if engine == 'array':
+        from .array_genetic_algorithm import ArrayGeneticAlgorithm
+        return ArrayGeneticAlgorithm(simulator, **params)
+    if engine == 'island':
+        from .island_model import IslandGeneticAlgorithm
+        return IslandGeneticAlgorithm(simulator, **params)
+    if engine == 'steady_state':
+        from .steady_state_genetic_algorithm import SteadyStateGeneticAlgorithm
+        return SteadyStateGeneticAlgorithm(simulator, **params)
+    raise ValueError(f"Motor do GA não suportado: {engine}")
\ No newline at end of file
@@ -0,0 +1,349 @@
+import contextlib
+import io
+import multiprocessing
+import time
+import numpy as np
+from typing import Dict, List, Optional, Tuple, Union
+from .race_model import CompiledRaceModel
+from .race_simulator import RaceSimulator
+from .genetic_algorithm import GeneticAlgorithm, Individual
+from .stopping_criteria import StoppingCriteria
+from .random_streams import spawn_seeds
+
+
+class _Island:
+    """
+    Uma subpopulação do modelo de ilhas (executada em um processo próprio ou no processo principal).
+    """
+    
+    def __init__(self, model: CompiledRaceModel, ga_params: Dict,
+                 seed: np.random.SeedSequence, migration_size: int):
+        self.migration_size = migration_size
+        self.generation = 0
+        
+        # Fluxo aleatório próprio: as ilhas executadas no mesmo processo
+        # produzem os mesmos resultados que em processos separados
+        self.ga = GeneticAlgorithm(model, seed=seed, **ga_params)
+        
+        with self._quiet():
+            self.ga.initialize()
+    
+    @staticmethod
+    def _quiet():
+        """
+        Oculta o progresso por geração da ilha.
+        """
+        return contextlib.redirect_stdout(io.StringIO())
+    
+    def evolve(self, n_generations: int, migrants: List[Tuple]) -> Dict:
+        """
+        Recebe imigrantes, evolui n_generations gerações e retorna os emigrantes.
+        
+        Returns:
+            Dicionário com os emigrantes (lista de (cromossomo, fitness) dos
+            melhores indivíduos) e os históricos de fitness e de avaliações
+        """
+        self.ga.receive_migrants([Individual(chromosome, fitness) for chromosome, fitness in migrants])
+        
+        with self._quiet():
+            for _ in range(n_generations):
+                self.ga.evolve_generation(self.generation)
+                self.generation += 1
+        
+        emigrants = [(individual.chromosome, individual.fitness)
+                     for individual in self.ga.get_top_individuals(self.migration_size)]
+        return {
+            'emigrants': emigrants,
+            'fitness_history': self.ga.get_fitness_history(),
+            'evaluation_history': self.ga.evaluation_history
+        }
+    
+    def finish(self) -> Dict:
+        """
+        Resultado final da ilha.
+        """
+        self.ga.update_best()
+        best = self.ga.best_individual
+        return {
+            'best': (best.chromosome, best.fitness),
+            'fitness_history': self.ga.get_fitness_history(),
+            'evaluation_history': self.ga.evaluation_history
+        }
+
+
+def _island_worker(connection, model: CompiledRaceModel, ga_params: Dict,
+                   seed: np.random.SeedSequence, migration_size: int):
+    """
+    Processo de uma ilha: mantém a subpopulação e responde aos comandos do coordenador.
+    
+    Recebe apenas o modelo compilado (sem o DataFrame da corrida nem pandas).
+    """
+    island = _Island(model, ga_params, seed, migration_size)
+    connection.send('ready')
+    
+    while True:
+        command, payload = connection.recv()
+        if command == 'evolve':
+            connection.send(island.evolve(*payload))
+        elif command == 'finish':
+            connection.send(island.finish())
+            break
+    
+    connection.close()
+
+
+class IslandGeneticAlgorithm:
+    """
+    Algoritmo Genético no modelo de ilhas.
+    
+    A população é dividida em n_islands subpopulações que evoluem de forma
+    independente, cada uma em um processo persistente. A cada
+    migration_interval gerações, os migration_size melhores indivíduos de cada
+    ilha migram para as vizinhas segundo a topologia ('ring': cada ilha envia
+    para a seguinte; 'full': cada ilha recebe os migration_size melhores entre
+    os emigrantes de todas as outras), substituindo os piores.
+    
+    O tamanho da população e o elitismo são divididos entre as ilhas (o resto
+    da divisão vai para as primeiras), de modo que cada geração produz os
+    mesmos population_size - elitism_size filhos do GA com população única e o
+    tempo de execução cai quase linearmente com o número de ilhas.
+    """
+    
+    TOPOLOGIES = ('ring', 'full')
+    
+    def __init__(self, simulator: RaceSimulator,
+                 population_size: int = 50,
+                 generations: int = 100,
+                 mutation_rate: float = 0.1,
+                 crossover_rate: float = 0.8,
+                 elitism_size: int = 5,
+                 n_islands: int = 4,
+                 migration_interval: int = 10,
+                 migration_size: int = 2,
+                 topology: str = 'ring',
+                 use_processes: bool = True,
+                 seed: Union[None, int, np.random.SeedSequence, np.random.Generator] = None,
+                 executor=None,
+                 stopping_criteria: Optional[StoppingCriteria] = None):
+        """
+        Inicializa o GA em ilhas.
+        
+        Args:
+            simulator: Instância do simulador de corrida
+            population_size: Tamanho total da população (dividido entre as ilhas)
+            generations: Número de gerações
+            mutation_rate: Taxa de mutação
+            crossover_rate: Taxa de crossover
+            elitism_size: Elitismo total (dividido entre as ilhas)
+            n_islands: Número de ilhas (no máximo uma a cada 4 indivíduos)
+            migration_interval: Gerações entre migrações
+            migration_size: Indivíduos enviados por ilha em cada migração
+            topology: 'ring' ou 'full'
+            use_processes: Executar cada ilha em um processo (False: no processo principal)
+            seed: Semente base, SeedSequence ou np.random.Generator (cada ilha
+                recebe um fluxo aleatório independente derivado dele)
+            executor: Não utilizado (as ilhas já avaliam em processos próprios);
+                aceito para manter a interface dos demais motores
+            stopping_criteria: Critérios de parada antecipada, verificados pelo
+                coordenador a cada migração sobre o histórico combinado
+        """
+        if topology not in self.TOPOLOGIES:
+            raise ValueError(f"Topologia não suportada: {topology}")
+        
+        self.simulator = simulator
+        self.generations = generations
+        self.n_islands = max(1, min(n_islands, population_size // 4))
+        self.migration_interval = max(1, migration_interval)
+        self.migration_size = max(0, migration_size)
+        self.topology = topology
+        self.use_processes = use_processes
+        self.seed = seed
+        self.stopping_criteria = stopping_criteria
+        
+        # População e elitismo de cada ilha (somam os totais do GA com população única)
+        island_populations = self._split(population_size, self.n_islands)
+        island_elitism = self._split(elitism_size, self.n_islands)
+        self.island_params = [
+            {
+                'population_size': island_population,
+                'generations': generations,
+                'mutation_rate': mutation_rate,
+                'crossover_rate': crossover_rate,
+                'elitism_size': min(island_elite, island_population - 1)
+            }
+            for island_population, island_elite in zip(island_populations, island_elitism)
+        ]
+        
+        self.best_individual = None
+        self.fitness_history = []
+        self.island_histories = []
+        self.evaluations = 0
+        self.evaluation_history = []
+        self.stop_reason = None
+        self.parallel_stats = None
+    
+    @staticmethod
+    def _split(total: int, n_parts: int) -> List[int]:
+        """
+        Divide um total em n_parts inteiros que diferem em no máximo 1.
+        """
+        base, remainder = divmod(max(0, total), n_parts)
+        return [base + 1 if i < remainder else base for i in range(n_parts)]
+    
+    def _merge_histories(self, results: List[Dict]):
+        """
+        Combina os históricos das ilhas: melhor fitness entre as ilhas e total
+        de avaliações em cada geração.
+        """
+        self.island_histories = [result['fitness_history'] for result in results]
+        self.fitness_history = np.max(np.array(self.island_histories), axis=0).tolist()
+        self.evaluation_history = np.sum(
+            np.array([result['evaluation_history'] for result in results]), axis=0
+        ).tolist()
+        self.evaluations = self.evaluation_history[-1]
+    
+    def _migration_loop(self, evolve_islands) -> None:
+        """
+        Alterna épocas de evolução e migrações até o fim das gerações ou até um
+        critério de parada ser satisfeito.
+        
+        Args:
+            evolve_islands: Função (n_gerações, imigrantes de cada ilha) ->
+                resultados de evolve de cada ilha
+        """
+        immigrants = [[] for _ in range(self.n_islands)]
+        for n_generations in self._epochs():
+            results = evolve_islands(n_generations, immigrants)
+            immigrants = self._route_migrants([result['emigrants'] for result in results])
+            
+            if self.stopping_criteria is not None:
+                self._merge_histories(results)
+                reason = self.stopping_criteria.check(self.fitness_history, self.evaluations)
+                if reason is not None:
+                    self.stop_reason = reason
+                    print(f"⏹️ Parada antecipada na geração {len(self.fitness_history) - 2} ({reason}): "
+                          f"{self.evaluations} avaliações")
+                    break
+    
+    def _route_migrants(self, emigrants: List[List[Tuple]]) -> List[List[Tuple]]:
+        """
+        Distribui os emigrantes de cada ilha segundo a topologia.
+        
+        Returns:
+            Lista de imigrantes de cada ilha
+        """
+        n = self.n_islands
+        if n == 1:
+            return [[]]
+        
+        if self.topology == 'ring':
+            return [emigrants[(i - 1) % n] for i in range(n)]
+        
+        immigrants = []
+        for i in range(n):
+            pool = [migrant for j in range(n) if j != i for migrant in emigrants[j]]
+            pool.sort(key=lambda migrant: migrant[1], reverse=True)
+            immigrants.append(pool[:self.migration_size])
+        return immigrants
+    
+    def _epochs(self) -> List[int]:
+        """
+        Número de gerações de cada época (intervalo entre migrações).
+        """
+        n_full, remainder = divmod(self.generations, self.migration_interval)
+        return [self.migration_interval] * n_full + ([remainder] if remainder else [])
+    
+    def run(self) -> Individual:
+        """
+        Executa o GA em ilhas.
+        
+        Returns:
+            Melhor indivíduo encontrado entre todas as ilhas
+        """
+        seeds = spawn_seeds(self.seed, self.n_islands)
+        
+        start = time.perf_counter()
+        self.stop_reason = 'generations'
+        if self.stopping_criteria is not None:
+            self.stopping_criteria.start()
+        
+        if self.use_processes and self.n_islands > 1:
+            results = self._run_processes(seeds)
+        else:
+            results = self._run_local(seeds)
+        elapsed = time.perf_counter() - start
+        
+        # Histórico combinado: melhor fitness entre as ilhas em cada geração
+        self._merge_histories(results)
+        
+        best_chromosome, best_fitness = max((result['best'] for result in results), key=lambda best: best[1])
+        self.best_individual = Individual(best_chromosome, best_fitness)
+        
+        print(f"🏝️ {self.n_islands} ilhas ({self.topology}): melhor fitness = {best_fitness:.6f}, "
+              f"{self.evaluations} avaliações em {elapsed:.2f}s")
+        
+        return self.best_individual
+    
+    def _run_local(self, seeds: List[np.random.SeedSequence]) -> List[Dict]:
+        """
+        Executa todas as ilhas no processo principal (em sequência a cada época).
+        """
+        model = self.simulator.compile()
+        islands = [_Island(model, params, seed, self.migration_size)
+                   for params, seed in zip(self.island_params, seeds)]
+        self._migration_loop(lambda n_generations, immigrants: [
+            island.evolve(n_generations, migrants) for island, migrants in zip(islands, immigrants)
+        ])
+        return [island.finish() for island in islands]
+    
+    def _run_processes(self, seeds: List[np.random.SeedSequence]) -> List[Dict]:
+        """
+        Executa cada ilha em um processo persistente, coordenando as migrações.
+        """
+        model = self.simulator.compile()
+        connections = []
+        processes = []
+        try:
+            for params, seed in zip(self.island_params, seeds):
+                parent_connection, child_connection = multiprocessing.Pipe()
+                process = multiprocessing.Process(
+                    target=_island_worker,
+                    args=(child_connection, model, params, seed, self.migration_size),
+                    daemon=True
+                )
+                process.start()
+                child_connection.close()
+                connections.append(parent_connection)
+                processes.append(process)
+            
+            for connection in connections:
+                connection.recv()
+            
+            def evolve_islands(n_generations, immigrants):
+                # Todas as ilhas evoluem em paralelo até a próxima migração
+                for connection, migrants in zip(connections, immigrants):
+                    connection.send(('evolve', (n_generations, migrants)))
+                return [connection.recv() for connection in connections]
+            
+            self._migration_loop(evolve_islands)
+            
+            for connection in connections:
+                connection.send(('finish', None))
+            return [connection.recv() for connection in connections]
+        
+        finally:
+            for connection in connections:
+                connection.close()
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+    
+    def get_fitness_history(self) -> List[float]:
+        """
+        Retorna o histórico de fitness combinado das ilhas.
+        
+        Returns:
+            Lista com o melhor fitness entre as ilhas em cada geração
+        """
+        return self.fitness_history
\ No newline at end of file
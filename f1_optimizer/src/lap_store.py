@@ -0,0 +1,212 @@
+import json
+import os
+import re
+import shutil
+import numpy as np
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class LapStore:
+    """
+    Armazenamento colunar em disco das voltas pré-processadas.
+    
+    Cada sessão (ano, corrida) é um diretório com um arquivo .npy por coluna,
+    lido com memory-mapping, e um meta.json com a versão do pré-processamento.
+    As voltas ficam agrupadas por piloto, de modo que carregar um piloto lê
+    apenas a fatia correspondente. Colunas de texto são gravadas como códigos
+    inteiros com a lista de categorias no meta.json.
+    """
+    
+    FORMAT_VERSION = 1
+    
+    # Colunas persistidas (as usadas pelo modelo e pelos scripts)
+    COLUMNS = ['Driver', 'LapNumber', 'Stint', 'TyreLife', 'Compound', 'LapTimeSeconds']
+    
+    def __init__(self, store_dir: str = "data/lap_store", version: int = 1):
+        """
+        Inicializa o armazenamento.
+        
+        Args:
+            store_dir: Diretório raiz do armazenamento
+            version: Versão do pré-processamento; entradas com outra versão são ignoradas
+        """
+        self.store_dir = store_dir
+        self.version = version
+    
+    def _session_dir(self, year: int, race_name: str) -> str:
+        """
+        Diretório de uma sessão.
+        """
+        slug = re.sub(r'[^A-Za-z0-9]+', '_', race_name).strip('_')
+        return os.path.join(self.store_dir, str(year), slug)
+    
+    def _read_meta(self, year: int, race_name: str) -> Optional[Dict]:
+        """
+        Lê os metadados de uma sessão (None se ausente ou de outra versão).
+        """
+        meta_path = os.path.join(self._session_dir(year, race_name), 'meta.json')
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if meta.get('format') != self.FORMAT_VERSION or meta.get('version') != self.version:
+            return None
+        
+        return meta
+    
+    def contains(self, year: int, race_name: str) -> bool:
+        """
+        Verifica se a sessão está armazenada na versão atual.
+        """
+        return self._read_meta(year, race_name) is not None
+    
+    def load(self, year: int, race_name: str, driver_code: Optional[str] = None) -> Optional['pd.DataFrame']:
+        """
+        Carrega as voltas de uma sessão (ou de um piloto) do armazenamento.
+        
+        Args:
+            year: Ano da corrida
+            race_name: Nome da corrida
+            driver_code: Código do piloto (None para todos)
+        
+        Returns:
+            DataFrame com as voltas, DataFrame vazio se o piloto não está na
+            sessão, ou None se a sessão não está armazenada na versão atual
+        """
+        meta = self._read_meta(year, race_name)
+        if meta is None:
+            return None
+        
+        import pandas as pd
+        
+        if driver_code is None:
+            start, stop = 0, meta['n_rows']
+        elif driver_code in meta['drivers']:
+            start, stop = meta['drivers'][driver_code]
+        else:
+            return pd.DataFrame()
+        
+        session_dir = self._session_dir(year, race_name)
+        columns = {}
+        try:
+            for name, info in meta['columns'].items():
+                values = np.load(os.path.join(session_dir, f"{name}.npy"), mmap_mode='r')[start:stop]
+                if 'categories' in info:
+                    # Códigos -1 representam valores ausentes
+                    categories = np.array(info['categories'] + [None], dtype=object)
+                    values = categories[values]
+                columns[name] = values
+        except (OSError, ValueError) as e:
+            print(f"Aviso: Armazenamento de voltas corrompido para {year} {race_name}: {e}")
+            return None
+        
+        return pd.DataFrame(columns, copy=False)
+    
+    def save(self, year: int, race_name: str, session_laps: 'pd.DataFrame') -> bool:
+        """
+        Grava as voltas pré-processadas de uma sessão (substitui a entrada anterior).
+        
+        Args:
+            year: Ano da corrida
+            race_name: Nome da corrida
+            session_laps: DataFrame com as voltas de todos os pilotos
+        
+        Returns:
+            True se a sessão foi gravada
+        """
+        if session_laps.empty or 'Driver' not in session_laps:
+            return False
+        
+        import pandas as pd
+        
+        # Agrupar as voltas por piloto (ordem estável dentro de cada piloto)
+        driver_codes, drivers = pd.factorize(session_laps['Driver'], sort=False)
+        order = np.argsort(driver_codes, kind='stable')
+        laps = session_laps.iloc[order]
+        bounds = np.searchsorted(driver_codes[order], np.arange(len(drivers) + 1))
+        
+        session_dir = self._session_dir(year, race_name)
+        tmp_dir = f"{session_dir}.tmp-{os.getpid()}"
+        
+        try:
+            os.makedirs(tmp_dir, exist_ok=True)
+            columns_meta = {}
+            for name in self.COLUMNS:
+                if name not in laps:
+                    continue
+                column = laps[name]
+                if pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column):
+                    values = column.to_numpy(dtype=float)
+                    columns_meta[name] = {'dtype': str(values.dtype)}
+                else:
+                    codes, categories = pd.factorize(column, sort=False)
+                    values = codes.astype(np.int32)
+                    columns_meta[name] = {'dtype': 'category', 'categories': [str(c) for c in categories]}
+                np.save(os.path.join(tmp_dir, f"{name}.npy"), values)
+            
+            meta = {
+                'format': self.FORMAT_VERSION,
+                'version': self.version,
+                'year': year,
+                'race_name': race_name,
+                'n_rows': len(laps),
+                'columns': columns_meta,
+                'drivers': {str(driver): [int(bounds[i]), int(bounds[i + 1])] for i, driver in enumerate(drivers)}
+            }
+            with open(os.path.join(tmp_dir, 'meta.json'), 'w') as f:
+                json.dump(meta, f, indent=2)
+            
+            # Substituir a entrada anterior apenas com a nova completamente gravada
+            if os.path.exists(session_dir):
+                shutil.rmtree(session_dir)
+            os.replace(tmp_dir, session_dir)
+            return True
+        
+        except OSError as e:
+            print(f"Aviso: Não foi possível gravar o armazenamento de voltas: {e}")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return False
+    
+    def invalidate(self, year: int, race_name: str):
+        """
+        Remove uma sessão do armazenamento.
+        """
+        shutil.rmtree(self._session_dir(year, race_name), ignore_errors=True)
+    
+    def list_sessions(self) -> List[Dict]:
+        """
+        Lista as sessões armazenadas na versão atual.
+        
+        Returns:
+            Lista de dicionários com ano, corrida, número de voltas e pilotos
+        """
+        sessions = []
+        if not os.path.isdir(self.store_dir):
+            return sessions
+        
+        for year in sorted(os.listdir(self.store_dir)):
+            year_dir = os.path.join(self.store_dir, year)
+            if not os.path.isdir(year_dir):
+                continue
+            for slug in sorted(os.listdir(year_dir)):
+                meta_path = os.path.join(year_dir, slug, 'meta.json')
+                try:
+                    with open(meta_path, 'r') as f:
+                        meta = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                if meta.get('format') != self.FORMAT_VERSION or meta.get('version') != self.version:
+                    continue
+                sessions.append({
+                    'year': meta['year'],
+                    'race_name': meta['race_name'],
+                    'n_rows': meta['n_rows'],
+                    'drivers': list(meta['drivers'])
+                })
+        
+        return sessions
\ No newline at end of file
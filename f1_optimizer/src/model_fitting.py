@@ -0,0 +1,140 @@
+import numpy as np
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Efeito do combustível (padrão da indústria), em segundos por volta
+FUEL_EFFECT_COEFF = 0.035
+
+# Mínimo de voltas de um composto para ajustar sua reta de degradação
+MIN_LAPS_PER_COMPOUND = 3
+
+
+def grouped_linear_fit(groups: np.ndarray, x: np.ndarray, y: np.ndarray,
+                       n_groups: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Ajusta uma regressão linear simples (y = a*x + b) por grupo, em forma fechada.
+    
+    Todas as somas são feitas com np.bincount, sem laço por grupo. Grupos com
+    x constante recebem inclinação 0 e intercepto igual à média de y (mesma
+    solução de mínima norma do LinearRegression).
+    
+    Args:
+        groups: Índice do grupo de cada observação (0..n_groups-1)
+        x: Variável independente
+        y: Variável dependente
+        n_groups: Número de grupos
+    
+    Returns:
+        Tupla (inclinações, interceptos, contagens) por grupo; grupos sem
+        observações têm inclinação e intercepto NaN
+    """
+    counts = np.bincount(groups, minlength=n_groups).astype(float)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_x = np.bincount(groups, weights=x, minlength=n_groups) / counts
+        mean_y = np.bincount(groups, weights=y, minlength=n_groups) / counts
+        
+        # Somas centradas (numericamente estáveis)
+        dx = x - mean_x[groups]
+        dy = y - mean_y[groups]
+        sxx = np.bincount(groups, weights=dx * dx, minlength=n_groups)
+        sxy = np.bincount(groups, weights=dx * dy, minlength=n_groups)
+        
+        slopes = np.where(sxx > 0, sxy / np.where(sxx > 0, sxx, 1.0), 0.0)
+    slopes[counts == 0] = np.nan
+    intercepts = mean_y - slopes * mean_x
+    
+    return slopes, intercepts, counts
+
+
+def fit_lap_time_parameters(laps: 'pd.DataFrame',
+                            by: Optional[str] = None,
+                            fuel_effect_coeff: float = FUEL_EFFECT_COEFF) -> Dict:
+    """
+    Ajusta os parâmetros do modelo de tempo de volta em uma única passada.
+    
+    Para cada composto, o tempo corrigido pelo combustível é ajustado em
+    função da idade do pneu (TyreLife). A inclinação é o coeficiente de
+    degradação; os interceptos definem T_base (composto de referência, HARD
+    quando disponível) e os deltas de performance (alpha) dos demais compostos.
+    Com `by`, todos os grupos (ex.: pilotos de uma sessão) são ajustados juntos.
+    
+    Args:
+        laps: DataFrame com LapNumber, TyreLife, Compound e LapTimeSeconds
+        by: Coluna de agrupamento (ex.: 'Driver'); None para um único conjunto
+        fuel_effect_coeff: Efeito do combustível em segundos por volta
+    
+    Returns:
+        Dicionário com degradation_coeffs, alpha_coeffs e T_base (antes da
+        validação); com `by`, um dicionário desses por valor da coluna
+    """
+    import pandas as pd
+    
+    if by is None:
+        keys = np.zeros(len(laps), dtype=np.int64)
+        key_values = [None]
+    else:
+        keys, key_values = pd.factorize(laps[by], sort=False)
+    
+    # Compostos na ordem em que aparecem (como Series.unique), NaN com código -1
+    compound_codes, compound_values = pd.factorize(laps['Compound'], sort=False)
+    n_compounds = len(compound_values)
+    
+    x = laps['TyreLife'].to_numpy(dtype=float)
+    y = (
+        laps['LapTimeSeconds'].to_numpy(dtype=float) +
+        (fuel_effect_coeff * laps['LapNumber'].to_numpy(dtype=float))
+    )
+    
+    # Um grupo por (chave, composto); voltas sem composto ou com valores ausentes ficam de fora
+    n_groups = max(len(key_values), 1) * max(n_compounds, 1)
+    usable = (keys >= 0) & (compound_codes >= 0) & np.isfinite(x) & np.isfinite(y)
+    groups = keys[usable] * n_compounds + compound_codes[usable]
+    slopes, intercepts, counts = grouped_linear_fit(groups, x[usable], y[usable], n_groups)
+    
+    # Ordem de aparição dos compostos dentro de cada chave (NaN incluído, como no ajuste original)
+    valid_keys = keys >= 0
+    positions = np.flatnonzero(valid_keys)
+    pairs = keys[valid_keys].astype(np.int64) * (n_compounds + 1) + (compound_codes[valid_keys] + 1)
+    _, first_positions = np.unique(pairs, return_index=True)
+    first_positions = np.sort(positions[first_positions])
+    
+    compounds_by_key = [[] for _ in key_values]
+    for position in first_positions:
+        code = compound_codes[position]
+        compound = compound_values[code] if code >= 0 else laps['Compound'].iloc[position]
+        compounds_by_key[keys[position]].append((code, compound))
+    
+    results = {}
+    for key_index, key in enumerate(key_values):
+        degradation_coeffs = {}
+        compound_intercepts = {}
+        for code, compound in compounds_by_key[key_index]:
+            if code < 0:
+                continue
+            group = key_index * n_compounds + code
+            if counts[group] < MIN_LAPS_PER_COMPOUND:
+                continue
+            degradation_coeffs[compound] = float(slopes[group])
+            compound_intercepts[compound] = float(intercepts[group])
+        
+        # Definir composto de referência (HARD como baseline)
+        compounds = [compound for _, compound in compounds_by_key[key_index]]
+        reference_compound = 'HARD' if 'HARD' in compounds else (compounds[0] if compounds else None)
+        reference_intercept = compound_intercepts.get(reference_compound, 0)
+        
+        alpha_coeffs = {}
+        for compound in compounds:
+            if compound in compound_intercepts:
+                alpha_coeffs[compound] = reference_intercept - compound_intercepts[compound]
+            else:
+                alpha_coeffs[compound] = 0
+        
+        results[key] = {
+            'degradation_coeffs': degradation_coeffs,
+            'alpha_coeffs': alpha_coeffs,
+            'T_base': reference_intercept
+        }
+    
+    return results[None] if by is None else results
\ No newline at end of file
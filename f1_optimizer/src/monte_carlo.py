@@ -0,0 +1,316 @@
+import numpy as np
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from .race_simulator import RaceSimulator
+
+
+class MonteCarloResult:
+    """
+    Resultado de uma avaliação Monte Carlo (estatísticas por estratégia).
+    """
+    
+    def __init__(self, strategies: List[List[Tuple[int, str]]], deterministic_times: np.ndarray,
+                 statistics: Dict[str, np.ndarray], n_samples: int,
+                 samples: Optional[np.ndarray] = None):
+        """
+        Inicializa o resultado.
+        
+        Args:
+            strategies: Estratégias avaliadas
+            deterministic_times: Tempo de cada estratégia sem eventos aleatórios
+            statistics: Estatísticas por estratégia (média, desvio, percentis, ...)
+            n_samples: Número de corridas amostradas
+            samples: Matriz (estratégias, amostras) de tempos, se mantida
+        """
+        self.strategies = strategies
+        self.deterministic_times = deterministic_times
+        self.statistics = statistics
+        self.n_samples = n_samples
+        self.samples = samples
+    
+    @property
+    def mean_times(self) -> np.ndarray:
+        """Tempo médio de cada estratégia."""
+        return self.statistics['mean']
+    
+    def best_index(self, criterion: str = 'mean') -> int:
+        """
+        Índice da melhor estratégia segundo uma estatística.
+        
+        Args:
+            criterion: Nome da estatística (ex.: 'mean', 'p95')
+        
+        Returns:
+            Índice da estratégia com menor valor
+        """
+        if criterion not in self.statistics:
+            raise ValueError(f"Critério não disponível: {criterion}")
+        return int(np.argmin(self.statistics[criterion]))
+    
+    def summary(self, index: int) -> Dict:
+        """
+        Estatísticas de uma estratégia.
+        
+        Args:
+            index: Índice da estratégia
+        
+        Returns:
+            Dicionário com estratégia, tempo determinístico e estatísticas
+        """
+        summary = {
+            'strategy': self.strategies[index],
+            'deterministic_time': float(self.deterministic_times[index])
+        }
+        for name, values in self.statistics.items():
+            summary[name] = float(values[index])
+        return summary
+
+
+class MonteCarloSimulator:
+    """
+    Avaliação estocástica de estratégias com safety car, VSC e variação no pit stop.
+    
+    Cada corrida amostrada sorteia os períodos de safety car (SC) e virtual
+    safety car (VSC) volta a volta. Voltas neutralizadas ficam mais lentas e
+    pit stops feitos sob neutralização perdem menos tempo. O tempo de cada
+    estratégia em cada amostra é o tempo determinístico do simulador mais os
+    desvios causados pelos eventos, calculados como produtos de matrizes
+    (estratégias x voltas) por (voltas x amostras).
+    """
+    
+    def __init__(self, simulator: RaceSimulator,
+                 n_samples: int = 1000,
+                 sc_probability: Union[float, np.ndarray] = 0.01,
+                 vsc_probability: Union[float, np.ndarray] = 0.015,
+                 sc_duration: int = 4,
+                 vsc_duration: int = 2,
+                 sc_lap_factor: float = 1.4,
+                 vsc_lap_factor: float = 1.3,
+                 sc_pit_factor: float = 0.5,
+                 vsc_pit_factor: float = 0.7,
+                 pit_time_std: float = 1.5,
+                 chunk_size: int = 2000,
+                 keep_samples: bool = True,
+                 seed: Optional[int] = None):
+        """
+        Inicializa o simulador Monte Carlo.
+        
+        Args:
+            simulator: Instância do simulador de corrida
+            n_samples: Número de corridas amostradas
+            sc_probability: Probabilidade de acionar o SC em cada volta (escalar ou array por volta)
+            vsc_probability: Probabilidade de acionar o VSC em cada volta (escalar ou array por volta)
+            sc_duration: Duração do SC em voltas
+            vsc_duration: Duração do VSC em voltas
+            sc_lap_factor: Multiplicador do tempo de volta sob SC
+            vsc_lap_factor: Multiplicador do tempo de volta sob VSC
+            sc_pit_factor: Multiplicador do tempo de pit stop sob SC
+            vsc_pit_factor: Multiplicador do tempo de pit stop sob VSC
+            pit_time_std: Desvio padrão do tempo de cada pit stop (segundos)
+            chunk_size: Amostras processadas por bloco (limita a memória)
+            keep_samples: Se True, mantém a matriz completa de tempos (necessária para percentis)
+            seed: Semente para reprodutibilidade
+        """
+        self.simulator = simulator
+        self.total_laps = simulator.total_laps
+        self.n_samples = n_samples
+        self.sc_probability = self._per_lap(sc_probability, 'sc_probability')
+        self.vsc_probability = self._per_lap(vsc_probability, 'vsc_probability')
+        self.sc_duration = max(1, int(sc_duration))
+        self.vsc_duration = max(1, int(vsc_duration))
+        self.sc_lap_factor = sc_lap_factor
+        self.vsc_lap_factor = vsc_lap_factor
+        self.sc_pit_factor = sc_pit_factor
+        self.vsc_pit_factor = vsc_pit_factor
+        self.pit_time_std = pit_time_std
+        self.chunk_size = max(1, int(chunk_size))
+        self.keep_samples = keep_samples
+        self.seed = seed
+    
+    def _per_lap(self, probability: Union[float, np.ndarray], name: str) -> np.ndarray:
+        """
+        Converte uma probabilidade (escalar ou por volta) em array por volta.
+        """
+        probability = np.asarray(probability, dtype=float)
+        if probability.ndim == 0:
+            probability = np.full(self.total_laps, float(probability))
+        if probability.shape != (self.total_laps,):
+            raise ValueError(f"{name} deve ser escalar ou ter {self.total_laps} valores")
+        if np.any((probability < 0) | (probability > 1)):
+            raise ValueError(f"{name} deve estar entre 0 e 1")
+        return probability
+    
+    def _generators(self) -> Tuple[np.random.Generator, ...]:
+        """
+        Geradores independentes para SC, VSC e pit stops.
+        
+        Fluxos separados tornam o resultado independente do tamanho do bloco,
+        e a mesma semente gera as mesmas corridas para todas as estratégias.
+        """
+        children = np.random.SeedSequence(self.seed).spawn(3)
+        return tuple(np.random.default_rng(child) for child in children)
+    
+    def _neutralized_laps(self, rng: np.random.Generator, probability: np.ndarray,
+                          duration: int, n_samples: int) -> np.ndarray:
+        """
+        Sorteia os períodos de neutralização de um bloco de amostras.
+        
+        Returns:
+            Array booleano (amostras, total_laps) com as voltas neutralizadas
+        """
+        deployments = rng.random((n_samples, self.total_laps)) < probability[None, :]
+        
+        # Uma volta está neutralizada se houve acionamento nas últimas `duration` voltas
+        counts = np.cumsum(deployments, axis=1)
+        shifted = np.zeros_like(counts)
+        shifted[:, duration:] = counts[:, :-duration]
+        return (counts - shifted) > 0
+    
+    def sample_race_conditions(self, n_samples: int,
+                               generators: Optional[Tuple[np.random.Generator, ...]] = None
+                               ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sorteia as condições de um bloco de corridas.
+        
+        Args:
+            n_samples: Número de corridas do bloco
+            generators: Geradores (sc, vsc, pit); novos geradores da semente se None
+        
+        Returns:
+            Tupla com multiplicadores de tempo de volta (amostras, total_laps) e
+            de pit stop (amostras, total_laps + 1)
+        """
+        if generators is None:
+            generators = self._generators()
+        sc_rng, vsc_rng, _ = generators
+        
+        sc_laps = self._neutralized_laps(sc_rng, self.sc_probability, self.sc_duration, n_samples)
+        vsc_laps = self._neutralized_laps(vsc_rng, self.vsc_probability, self.vsc_duration, n_samples)
+        vsc_laps &= ~sc_laps  # SC tem prioridade sobre o VSC
+        
+        lap_factors = np.ones((n_samples, self.total_laps))
+        lap_factors[vsc_laps] = self.vsc_lap_factor
+        lap_factors[sc_laps] = self.sc_lap_factor
+        
+        # Paradas após o fim da corrida (última coluna) não são afetadas
+        pit_factors = np.ones((n_samples, self.total_laps + 1))
+        pit_factors[:, :-1][vsc_laps] = self.vsc_pit_factor
+        pit_factors[:, :-1][sc_laps] = self.sc_pit_factor
+        
+        return lap_factors, pit_factors
+    
+    def iter_sample_chunks(self, strategies: List[List[Tuple[int, str]]]) -> Iterator[np.ndarray]:
+        """
+        Gera os tempos amostrados em blocos, sem manter todas as amostras em memória.
+        
+        Args:
+            strategies: Lista de estratégias
+        
+        Yields:
+            Arrays (estratégias, amostras_do_bloco) com o tempo total de cada corrida
+        """
+        deterministic_times = self.simulator.evaluate_strategies(strategies)
+        for deviations in self._iter_deviations(strategies):
+            yield deterministic_times[:, None] + deviations
+    
+    def _iter_deviations(self, strategies: List[List[Tuple[int, str]]]) -> Iterator[np.ndarray]:
+        """
+        Gera, em blocos, os desvios de cada corrida em relação ao tempo determinístico.
+        
+        Yields:
+            Arrays (estratégias, amostras_do_bloco) com os desvios
+        """
+        model = self.simulator.compile()
+        batch = model.encode_strategies(strategies)
+        
+        lap_times, paid_counts = model.lap_time_profiles(batch)
+        # Soma de k normais independentes = sqrt(k) vezes uma normal
+        pit_noise_scale = self.pit_time_std * np.sqrt(paid_counts)
+        
+        generators = self._generators()
+        pit_rng = generators[2]
+        
+        for start in range(0, self.n_samples, self.chunk_size):
+            n_chunk = min(self.chunk_size, self.n_samples - start)
+            lap_factors, pit_factors = self.sample_race_conditions(n_chunk, generators)
+            
+            # Desvios em relação à corrida determinística
+            lap_deviation = lap_times @ (lap_factors - 1.0).T
+            pit_deviation = model.pit_stop_time * (paid_counts @ (pit_factors - 1.0).T)
+            
+            # Variação do tempo de pit stop: uma normal por amostra e volta,
+            # compartilhada por todas as estratégias que param naquela volta
+            # (as amostras de uma estratégia não dependem das demais do lote)
+            pit_noise = pit_noise_scale @ pit_rng.standard_normal((n_chunk, self.total_laps + 1)).T
+            
+            yield lap_deviation + pit_deviation + pit_noise
+    
+    def evaluate(self, strategies: List[List[Tuple[int, str]]],
+                 percentiles: Tuple[float, ...] = (5, 50, 95)) -> MonteCarloResult:
+        """
+        Avalia estratégias contra todas as corridas amostradas.
+        
+        Args:
+            strategies: Lista de estratégias
+            percentiles: Percentis calculados (exigem keep_samples=True)
+        
+        Returns:
+            Resultado com estatísticas por estratégia
+        """
+        n_strategies = len(strategies)
+        deterministic_times = self.simulator.evaluate_strategies(strategies)
+        
+        total = np.zeros(n_strategies)
+        total_squares = np.zeros(n_strategies)
+        minimum = np.full(n_strategies, np.inf)
+        maximum = np.full(n_strategies, -np.inf)
+        chunks = []
+        
+        # Acumular desvios (centrados no tempo determinístico, menor erro numérico na variância)
+        for deviations in self._iter_deviations(strategies):
+            total += deviations.sum(axis=1)
+            total_squares += (deviations ** 2).sum(axis=1)
+            minimum = np.minimum(minimum, deviations.min(axis=1))
+            maximum = np.maximum(maximum, deviations.max(axis=1))
+            if self.keep_samples:
+                chunks.append(deterministic_times[:, None] + deviations)
+        
+        mean_deviation = total / self.n_samples
+        variance = np.maximum(total_squares / self.n_samples - mean_deviation ** 2, 0.0)
+        
+        statistics = {
+            'mean': deterministic_times + mean_deviation,
+            'std': np.sqrt(variance),
+            'min': deterministic_times + minimum,
+            'max': deterministic_times + maximum
+        }
+        
+        # Estratégias inválidas (tempo infinito) ficam com todas as estatísticas infinitas
+        valid = np.isfinite(deterministic_times)
+        statistics['std'][~valid] = np.inf
+        
+        samples = None
+        if self.keep_samples:
+            samples = np.concatenate(chunks, axis=1)
+            for q in percentiles:
+                statistics[f"p{q:g}"] = np.full(n_strategies, np.inf)
+            if valid.any():
+                values = np.percentile(samples[valid], percentiles, axis=1)
+                for q, value in zip(percentiles, values):
+                    statistics[f"p{q:g}"][valid] = value
+        elif percentiles:
+            print("Aviso: percentis não calculados (keep_samples=False)")
+        
+        return MonteCarloResult(list(strategies), deterministic_times, statistics,
+                                self.n_samples, samples)
+    
+    def evaluate_strategy(self, strategy: List[Tuple[int, str]]) -> Dict:
+        """
+        Avalia uma única estratégia.
+        
+        Args:
+            strategy: Lista de tuplas (volta_parada, composto_novo)
+        
+        Returns:
+            Dicionário com tempo determinístico e estatísticas
+        """
+        return self.evaluate([strategy]).summary(0)
\ No newline at end of file
@@ -0,0 +1,242 @@
+import os
+import threading
+import time
+import numpy as np
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Optional
+from .race_model import CompiledRaceModel
+from .race_simulator import RaceSimulator
+
+# Contadores acumulados pelo avaliador
+STAT_COUNTERS = (
+    'parallel_batches', 'local_batches', 'parallel_strategies', 'local_strategies',
+    'parallel_wall_time', 'worker_time', 'local_time'
+)
+
+# Modelo compilado de cada processo de trabalho (criado uma vez pelo inicializador)
+_worker_model: Optional[CompiledRaceModel] = None
+
+
+def _init_worker(model: CompiledRaceModel):
+    """
+    Inicializador dos processos: reconstrói o modelo compilado (e suas tabelas) uma única vez.
+    """
+    global _worker_model
+    _worker_model = model
+
+
+def _evaluate_chunk(batch: np.ndarray):
+    """
+    Avalia um bloco de estratégias codificadas no processo de trabalho.
+    
+    Returns:
+        Tupla (tempos totais, segundos gastos na avaliação)
+    """
+    start = time.perf_counter()
+    total_times = _worker_model.evaluate_strategies(batch)
+    return total_times, time.perf_counter() - start
+
+
+class ParallelEvaluator:
+    """
+    Avaliador de estratégias em um pool de processos.
+    
+    Cada processo recebe o CompiledRaceModel do simulador uma única vez (no
+    inicializador) e avalia blocos do lote codificado. Lotes menores que
+    min_batch_size são avaliados no próprio processo, onde o custo de
+    comunicação não compensa. Os resultados são idênticos à avaliação em
+    processo (cada estratégia é avaliada de forma independente).
+    
+    O mesmo avaliador pode ser compartilhado por várias execuções do GA e do
+    ACO sobre o mesmo simulador; o pool é recriado se o modelo mudar.
+    """
+    
+    def __init__(self, simulator: RaceSimulator, max_workers: Optional[int] = None,
+                 min_batch_size: int = 2000, chunks_per_worker: int = 1):
+        """
+        Inicializa o avaliador (o pool é criado no primeiro lote grande).
+        
+        Args:
+            simulator: Simulador de corrida
+            max_workers: Número de processos (padrão: número de CPUs)
+            min_batch_size: Tamanho mínimo do lote para avaliar em paralelo
+            chunks_per_worker: Blocos enviados por processo em cada lote
+        """
+        self.simulator = simulator
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_batch_size = min_batch_size
+        self.chunks_per_worker = max(1, chunks_per_worker)
+        
+        self._executor = None
+        self._executor_model = None
+        
+        # Lotes assíncronos em andamento (o tempo de parede conta enquanto houver algum)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._busy_since = 0.0
+        self.reset_stats()
+    
+    def reset_stats(self):
+        """
+        Zera as estatísticas de avaliação.
+        """
+        self._stats = {name: 0 for name in STAT_COUNTERS}
+    
+    def _get_executor(self, model: CompiledRaceModel) -> ProcessPoolExecutor:
+        """
+        Retorna o pool de processos para o modelo atual (recriado se o modelo mudou).
+        """
+        if self._executor is not None and self._executor_model is not model:
+            self.close()
+        
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=_init_worker, initargs=(model,)
+            )
+            self._executor_model = model
+        
+        return self._executor
+    
+    def evaluate_strategies(self, batch) -> np.ndarray:
+        """
+        Avalia um lote de estratégias (em paralelo, se o lote for grande o suficiente).
+        
+        Args:
+            batch: Array (n, max_paradas, 2) de encode_strategies ou lista de estratégias
+        
+        Returns:
+            Array (n,) com o tempo total de cada estratégia
+        """
+        model = self.simulator.compile()
+        if not isinstance(batch, np.ndarray):
+            batch = model.encode_strategies(batch)
+        
+        n_strategies = len(batch)
+        if self.max_workers <= 1 or n_strategies < self.min_batch_size:
+            start = time.perf_counter()
+            total_times = model.evaluate_strategies(batch)
+            self._stats['local_batches'] += 1
+            self._stats['local_strategies'] += n_strategies
+            self._stats['local_time'] += time.perf_counter() - start
+            return total_times
+        
+        start = time.perf_counter()
+        executor = self._get_executor(model)
+        chunks = np.array_split(batch, self.max_workers * self.chunks_per_worker)
+        results = list(executor.map(_evaluate_chunk, [chunk for chunk in chunks if len(chunk)]))
+        
+        self._stats['parallel_batches'] += 1
+        self._stats['parallel_strategies'] += n_strategies
+        self._stats['worker_time'] += sum(elapsed for _, elapsed in results)
+        self._stats['parallel_wall_time'] += time.perf_counter() - start
+        
+        return np.concatenate([total_times for total_times, _ in results])
+    
+    def submit_strategies(self, batch) -> Future:
+        """
+        Envia um lote para avaliação assíncrona em um dos processos.
+        
+        Permite avaliar filhos à medida que os processos ficam livres, sem
+        barreira por geração (ex.: GA steady-state). Com um único processo ou
+        um lote menor que min_batch_size, o lote é avaliado imediatamente no
+        próprio processo e o Future já é retornado concluído.
+        
+        Args:
+            batch: Array (n, max_paradas, 2) de encode_strategies ou lista de estratégias
+        
+        Returns:
+            Future com o array (n,) de tempos totais
+        """
+        if self.max_workers <= 1 or len(batch) < self.min_batch_size:
+            future = Future()
+            future.set_result(self.evaluate_strategies(batch))
+            return future
+        
+        model = self.simulator.compile()
+        if not isinstance(batch, np.ndarray):
+            batch = model.encode_strategies(batch)
+        
+        executor = self._get_executor(model)
+        with self._lock:
+            if self._in_flight == 0:
+                self._busy_since = time.perf_counter()
+            self._in_flight += 1
+        
+        result = Future()
+        chunk_future = executor.submit(_evaluate_chunk, batch)
+        
+        def on_done(done):
+            with self._lock:
+                self._in_flight -= 1
+                if self._in_flight == 0:
+                    self._stats['parallel_wall_time'] += time.perf_counter() - self._busy_since
+                if done.exception() is None:
+                    total_times, elapsed = done.result()
+                    self._stats['parallel_batches'] += 1
+                    self._stats['parallel_strategies'] += len(batch)
+                    self._stats['worker_time'] += elapsed
+            
+            if done.exception() is not None:
+                result.set_exception(done.exception())
+            else:
+                result.set_result(done.result()[0])
+        
+        chunk_future.add_done_callback(on_done)
+        return result
+    
+    def get_stats(self) -> Dict:
+        """
+        Retorna as estatísticas de avaliação e a eficiência paralela.
+        
+        A eficiência é o tempo de avaliação somado dos processos dividido pelo
+        tempo de parede dos lotes paralelos vezes o número de processos.
+        
+        Returns:
+            Dicionário com contagens, tempos, speedup e eficiência
+        """
+        return self._derive_efficiency(dict(self._stats), self.max_workers)
+    
+    @staticmethod
+    def _derive_efficiency(stats: Dict, workers: int) -> Dict:
+        """
+        Acrescenta número de processos, speedup e eficiência aos contadores.
+        """
+        wall_time = stats['parallel_wall_time']
+        stats['workers'] = workers
+        stats['speedup'] = stats['worker_time'] / wall_time if wall_time > 0 else 0.0
+        stats['efficiency'] = stats['speedup'] / workers
+        return stats
+    
+    @classmethod
+    def stats_delta(cls, before: Dict, after: Dict) -> Dict:
+        """
+        Estatísticas de um intervalo (ex.: uma execução) a partir de duas leituras de get_stats.
+        """
+        stats = {name: after[name] - before[name] for name in STAT_COUNTERS}
+        return cls._derive_efficiency(stats, after['workers'])
+    
+    @staticmethod
+    def format_stats(stats: Dict) -> str:
+        """
+        Resumo de uma linha das estatísticas de avaliação.
+        """
+        return (
+            f"⚙️ Avaliação paralela: {stats['parallel_batches']} lotes em {stats['workers']} processos "
+            f"(speedup {stats['speedup']:.2f}x, eficiência {stats['efficiency']:.0%}), "
+            f"{stats['local_batches']} lotes no processo principal"
+        )
+    
+    def close(self):
+        """
+        Encerra o pool de processos.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._executor_model = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
\ No newline at end of file
@@ -1,13 +1,14 @@
 import itertools
-import random
 import time
 import json
 import numpy as np
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional, Union
 from .data_handler import DataHandler
 from .race_simulator import RaceSimulator
-from .genetic_algorithm import GeneticAlgorithm
+from .genetic_algorithm import create_genetic_algorithm
 from .ant_colony import AntColonyOptimizer
+from .checkpoint import Checkpointer
+from .random_streams import as_seed_sequence, spawn_seeds
 
 
 class ParameterOptimizer:
@@ -15,7 +16,10 @@ class ParameterOptimizer:
     Classe para otimização de parâmetros dos algoritmos GA e ACO.
     """
     
-    def __init__(self, algorithm_type: str, base_params: Dict, param_ranges: Dict):
+    def __init__(self, algorithm_type: str, base_params: Dict, param_ranges: Dict,
+                 engine: str = 'object', checkpoint_path: Optional[str] = None,
+                 checkpoint_interval: float = 5.0,
+                 seed: Union[None, int, np.random.SeedSequence] = None):
         """
         Inicializa o otimizador de parâmetros.
         
@@ -23,13 +27,41 @@ class ParameterOptimizer:
             algorithm_type: 'GA' ou 'ACO'
             base_params: Parâmetros base do algoritmo
             param_ranges: Dicionário com ranges de parâmetros para testar
+            engine: Motor do GA ('object', 'array', 'island' ou 'steady_state')
+            checkpoint_path: Arquivo de checkpoint do progresso (None desativa).
+                Uma busca interrompida é retomada do último checkpoint, com o
+                mesmo resultado de uma execução ininterrupta
+            checkpoint_interval: Intervalo mínimo entre checkpoints (segundos)
+            seed: Semente da busca. Cada execução de cada configuração usa um
+                fluxo aleatório independente derivado dela (e o sorteio de
+                parâmetros do random search, outro), de modo que a busca é
+                reproduzível
         """
         self.algorithm_type = algorithm_type
+        self.engine = engine
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        self._checkpointer = None
+        self._run_checkpointer = None
         self.base_params = base_params
         self.param_ranges = param_ranges
         self.results = []
         self.best_params = None
         self.best_score = float('inf')
+        self._set_seed(as_seed_sequence(seed))
+    
+    def _set_seed(self, seed_sequence: np.random.SeedSequence):
+        """
+        Define a raiz dos fluxos aleatórios e o fluxo do sorteio de parâmetros.
+        """
+        self.seed_sequence = seed_sequence
+        self.rng = np.random.default_rng(spawn_seeds(seed_sequence, 1, 0)[0])
+    
+    def _execution_seed(self, config_id: int, execution: int) -> np.random.SeedSequence:
+        """
+        Semente da execução de uma configuração (independe da ordem das execuções).
+        """
+        return spawn_seeds(self.seed_sequence, execution + 1, 1, config_id)[execution]
     
     def grid_search(self, scenario: Dict, n_executions: int = 5) -> Dict:
         """
@@ -66,12 +98,19 @@ class ParameterOptimizer:
         
         print(f"📊 Testando {len(combinations)} combinações de parâmetros...")
         
+        state = self._open_checkpoint('grid', n_executions)
+        start_index = state['index'] if state else 0
+        
         for i, combination in enumerate(combinations):
+            if i < start_index:
+                continue
+            
             # Criar dicionário de parâmetros
             params = dict(zip(param_names, combination))
             
-            # Avaliar configuração
-            score = self._evaluate_configuration(simulator, params, n_executions)
+            # Avaliar configuração (retomando as execuções já concluídas)
+            scores = state['scores'] if state and i == start_index else []
+            score = self._evaluate_configuration(simulator, params, n_executions, i, scores)
             
             # Armazenar resultado
             result = {
@@ -89,6 +128,7 @@ class ParameterOptimizer:
             if (i + 1) % 10 == 0:
                 print(f"  Progresso: {i + 1}/{len(combinations)} - Melhor score: {self.best_score:.2f}")
         
+        self._close_checkpoint()
         print(f"✅ Grid Search concluído! Melhor score: {self.best_score:.2f}")
         return self.best_params
     
@@ -121,12 +161,19 @@ class ParameterOptimizer:
         # Criar simulador
         simulator = RaceSimulator(race_data)
         
-        for trial in range(n_trials):
-            # Gerar parâmetros aleatórios
-            params = self._generate_random_params()
+        state = self._open_checkpoint('random', (n_trials, n_executions))
+        start_trial = state['index'] if state else 0
+        
+        for trial in range(start_trial, n_trials):
+            if state and trial == start_trial:
+                # Tentativa interrompida: parâmetros já sorteados e execuções concluídas
+                params, scores = state['params'], state['scores']
+            else:
+                # Gerar parâmetros aleatórios
+                params, scores = self._generate_random_params(), []
             
             # Avaliar configuração
-            score = self._evaluate_configuration(simulator, params, n_executions)
+            score = self._evaluate_configuration(simulator, params, n_executions, trial, scores)
             
             # Armazenar resultado
             result = {
@@ -144,10 +191,12 @@ class ParameterOptimizer:
             if (trial + 1) % 20 == 0:
                 print(f"  Progresso: {trial + 1}/{n_trials} - Melhor score: {self.best_score:.2f}")
         
+        self._close_checkpoint()
         print(f"✅ Random Search concluído! Melhor score: {self.best_score:.2f}")
         return self.best_params
     
-    def _evaluate_configuration(self, simulator: RaceSimulator, params: Dict, n_executions: int) -> float:
+    def _evaluate_configuration(self, simulator: RaceSimulator, params: Dict, n_executions: int,
+                                config_id: int = 0, scores: Optional[List[float]] = None) -> float:
         """
         Avalia uma configuração de parâmetros.
         
@@ -155,20 +204,26 @@ class ParameterOptimizer:
             simulator: Simulador de corrida
             params: Parâmetros a testar
             n_executions: Número de execuções
+            config_id: Índice da configuração (identifica os checkpoints)
+            scores: Scores de execuções já concluídas (retomada de checkpoint)
             
         Returns:
             Score médio da configuração (menor = melhor)
         """
-        scores = []
+        scores = list(scores or [])
         
-        for _ in range(n_executions):
+        for execution in range(len(scores), n_executions):
+            self._save_progress(config_id, params, scores)
+            run_params = self._run_checkpoint_params(config_id, execution)
+            run_params['seed'] = self._execution_seed(config_id, execution)
+            
             try:
                 if self.algorithm_type == 'GA':
-                    algorithm = GeneticAlgorithm(simulator, **params)
+                    algorithm = create_genetic_algorithm(simulator, self.engine, **params, **run_params)
                     best_individual = algorithm.run()
                     score = 1 / best_individual.fitness if best_individual.fitness > 0 else float('inf')
                 elif self.algorithm_type == 'ACO':
-                    algorithm = AntColonyOptimizer(simulator, **params)
+                    algorithm = AntColonyOptimizer(simulator, **params, **run_params)
                     best_ant = algorithm.run()
                     score = best_ant.total_time
                 else:
@@ -182,6 +237,76 @@ class ParameterOptimizer:
         
         return np.mean(scores)
     
+    def _open_checkpoint(self, search: str, budget) -> Optional[Dict]:
+        """
+        Prepara os checkpoints de uma busca e carrega o progresso salvo.
+        
+        Args:
+            search: 'grid' ou 'random'
+            budget: Orçamento da busca (identifica o checkpoint junto com os ranges)
+            
+        Returns:
+            Estado salvo (índice da configuração em andamento, parâmetros e
+            scores parciais) ou None
+        """
+        if self.checkpoint_path is None:
+            return None
+        
+        tag = (self.algorithm_type, self.engine, search, repr(self.param_ranges), budget)
+        self._checkpointer = Checkpointer(self.checkpoint_path, self.checkpoint_interval, tag)
+        self._run_checkpointer = Checkpointer(f"{self.checkpoint_path}.run", self.checkpoint_interval)
+        
+        state = self._checkpointer.load()
+        if state is None:
+            return None
+        
+        self.results = list(state['results'])
+        self.best_params = state['best_params']
+        self.best_score = state['best_score']
+        self._set_seed(np.random.SeedSequence(state['seed_entropy']))
+        self.rng.bit_generator.state = state['rng_state']
+        print(f"♻️ Retomando do checkpoint: {len(self.results)} configurações concluídas")
+        return state
+    
+    def _save_progress(self, index: int, params: Dict, scores: List[float]):
+        """
+        Grava o progresso da busca (se o intervalo mínimo passou) antes de uma execução.
+        """
+        if self._checkpointer is None:
+            return
+        
+        self._checkpointer.save_if_due(lambda: {
+            'index': index,
+            'params': params,
+            'scores': list(scores),
+            'results': self.results,
+            'best_params': self.best_params,
+            'best_score': self.best_score,
+            'seed_entropy': self.seed_sequence.entropy,
+            'rng_state': self.rng.bit_generator.state
+        })
+    
+    def _run_checkpoint_params(self, config_id: int, execution: int) -> Dict:
+        """
+        Checkpointer da execução atual, para os algoritmos que retomam execuções
+        (GA 'object' e ACO); os demais motores retomam a partir da execução.
+        """
+        if self._run_checkpointer is None or (self.algorithm_type == 'GA' and self.engine != 'object'):
+            return {}
+        
+        self._run_checkpointer.tag = (config_id, execution)
+        return {'checkpointer': self._run_checkpointer}
+    
+    def _close_checkpoint(self):
+        """
+        Remove os checkpoints ao fim da busca.
+        """
+        if self._checkpointer is not None:
+            self._checkpointer.clear()
+            self._run_checkpointer.clear()
+        self._checkpointer = None
+        self._run_checkpointer = None
+    
     def _generate_random_params(self) -> Dict:
         """
         Gera parâmetros aleatórios dentro dos ranges definidos.
@@ -192,17 +317,16 @@ class ParameterOptimizer:
         params = {}
         
         for param_name, param_range in self.param_ranges.items():
-            if isinstance(param_range, list):
-                params[param_name] = random.choice(param_range)
-            elif isinstance(param_range, tuple) and len(param_range) == 2:
+            if isinstance(param_range, tuple) and len(param_range) == 2:
                 # Range numérico
                 min_val, max_val = param_range
                 if isinstance(min_val, int):
-                    params[param_name] = random.randint(min_val, max_val)
+                    params[param_name] = int(self.rng.integers(min_val, max_val + 1))
                 else:
-                    params[param_name] = random.uniform(min_val, max_val)
+                    params[param_name] = float(self.rng.uniform(min_val, max_val))
             else:
-                params[param_name] = random.choice(param_range)
+                values = list(param_range)
+                params[param_name] = values[int(self.rng.integers(len(values)))]
         
         return params
     
@@ -259,13 +383,17 @@ class ParameterOptimizer:
         print(f"💾 Resultados salvos em: {filename}")
 
 
-def optimize_ga_parameters(scenario: Dict) -> Dict:
+def optimize_ga_parameters(scenario: Dict, engine: str = 'object', checkpoint: bool = True,
+                           seed: Optional[int] = None) -> Dict:
     """
     Otimiza parâmetros do Algoritmo Genético.
     
     Args:
         scenario: Dicionário com cenário
-        
+        engine: Motor do GA ('object', 'array', 'island' ou 'steady_state')
+        checkpoint: Gravar checkpoints periódicos (e retomar uma busca interrompida)
+        seed: Semente da busca (None usa entropia do sistema)
+    
     Returns:
         Dicionário com melhores parâmetros
     """
@@ -287,24 +415,28 @@ def optimize_ga_parameters(scenario: Dict) -> Dict:
         'elitism_size': 5
     }
     
-    optimizer = ParameterOptimizer('GA', ga_base, ga_ranges)
+    filename = f'results/ga_optimization_{scenario["year"]}_{scenario["race_name"].replace(" ", "_")}_{scenario["driver_code"]}.json'
+    checkpoint_path = f'{filename}.checkpoint' if checkpoint else None
+    optimizer = ParameterOptimizer('GA', ga_base, ga_ranges, engine, checkpoint_path, seed=seed)
     
     # Realizar otimização
     best_params = optimizer.grid_search(scenario, n_executions=3)
     
     # Salvar resultados
-    optimizer.save_results(f'results/ga_optimization_{scenario["year"]}_{scenario["race_name"].replace(" ", "_")}_{scenario["driver_code"]}.json')
+    optimizer.save_results(filename)
     
     return best_params
 
 
-def optimize_aco_parameters(scenario: Dict) -> Dict:
+def optimize_aco_parameters(scenario: Dict, checkpoint: bool = True, seed: Optional[int] = None) -> Dict:
     """
     Otimiza parâmetros do Algoritmo ACO.
     
     Args:
         scenario: Dicionário com cenário
-        
+        checkpoint: Gravar checkpoints periódicos (e retomar uma busca interrompida)
+        seed: Semente da busca (None usa entropia do sistema)
+    
     Returns:
         Dicionário com melhores parâmetros
     """
@@ -326,12 +458,14 @@ def optimize_aco_parameters(scenario: Dict) -> Dict:
         'beta': 2.0
     }
     
-    optimizer = ParameterOptimizer('ACO', aco_base, aco_ranges)
+    filename = f'results/aco_optimization_{scenario["year"]}_{scenario["race_name"].replace(" ", "_")}_{scenario["driver_code"]}.json'
+    checkpoint_path = f'{filename}.checkpoint' if checkpoint else None
+    optimizer = ParameterOptimizer('ACO', aco_base, aco_ranges, checkpoint_path=checkpoint_path, seed=seed)
     
     # Realizar otimização
     best_params = optimizer.grid_search(scenario, n_executions=3)
     
     # Salvar resultados
-    optimizer.save_results(f'results/aco_optimization_{scenario["year"]}_{scenario["race_name"].replace(" ", "_")}_{scenario["driver_code"]}.json')
+    optimizer.save_results(filename)
     
     return best_params 
\ No newline at end of file
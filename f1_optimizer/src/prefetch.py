@@ -0,0 +1,228 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
+from .data_handler import DataHandler
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _prefetch_race(year: int, race_name: str, cache_dir: str, lap_store_dir: str,
+                   load_profile: str) -> Dict:
+    """
+    Carrega uma corrida em um processo do pool (aquece o cache do FastF1 e o
+    armazenamento de voltas).
+    
+    Returns:
+        Dicionário com status, número de voltas, pilotos e tempos de carga
+    """
+    start = time.perf_counter()
+    data_handler = DataHandler(cache_dir=cache_dir, lap_store_dir=lap_store_dir, load_profile=load_profile)
+    session_laps = data_handler.get_session_laps(year, race_name)
+    
+    return {
+        'status': 'done' if not session_laps.empty else 'failed',
+        'rows': len(session_laps),
+        'drivers': session_laps['Driver'].unique().tolist() if not session_laps.empty else [],
+        'elapsed': time.perf_counter() - start,
+        'timings': data_handler.load_timings.get((year, race_name), {})
+    }
+
+
+class SeasonPrefetcher:
+    """
+    Pré-carrega as corridas de uma temporada em paralelo.
+    
+    Um pool limitado de processos aquece o cache do FastF1 e o armazenamento
+    de voltas. O progresso é gravado em um manifesto, e corridas já concluídas
+    são ignoradas ao retomar. `iter_races` entrega as corridas em ordem assim
+    que ficam prontas, permitindo otimizar a corrida N enquanto as seguintes
+    ainda carregam.
+    """
+    
+    def __init__(self, year: int, races: Optional[List[str]] = None,
+                 max_workers: int = 2,
+                 cache_dir: str = "data/cache",
+                 lap_store_dir: str = "data/lap_store",
+                 manifest_path: Optional[str] = None,
+                 load_profile: str = 'laps'):
+        """
+        Inicializa o pré-carregador.
+        
+        Args:
+            year: Ano da temporada
+            races: Corridas a carregar (padrão: todas as corridas do calendário)
+            max_workers: Número máximo de processos carregando em paralelo
+            cache_dir: Diretório do cache do FastF1
+            lap_store_dir: Diretório do armazenamento de voltas
+            manifest_path: Arquivo de manifesto (padrão: prefetch_<ano>.json em lap_store_dir)
+            load_profile: Perfil de carga das sessões
+        """
+        self.year = year
+        self.max_workers = max(1, max_workers)
+        self.cache_dir = cache_dir
+        self.lap_store_dir = lap_store_dir
+        self.load_profile = load_profile
+        self.manifest_path = manifest_path or os.path.join(lap_store_dir, f"prefetch_{year}.json")
+        
+        self.data_handler = DataHandler(cache_dir=cache_dir, lap_store_dir=lap_store_dir,
+                                        load_profile=load_profile)
+        if self.data_handler.source is not None:
+            raise ValueError("O pré-carregamento requer a fonte de dados FastF1")
+        self.races = list(races) if races is not None else self.get_season_races(year)
+        self.manifest = self._load_manifest()
+    
+    def get_season_races(self, year: int) -> List[str]:
+        """
+        Obtém as corridas do calendário de uma temporada (sem testes de pré-temporada).
+        
+        Args:
+            year: Ano da temporada
+        
+        Returns:
+            Lista com o nome de cada corrida, em ordem
+        """
+        schedule = self.data_handler._get_fastf1().get_event_schedule(year, include_testing=False)
+        return [event['EventName'] for _, event in schedule.iterrows() if event['RoundNumber'] > 0]
+    
+    def _load_manifest(self) -> Dict:
+        """
+        Lê o manifesto de uma execução anterior (vazio se ausente ou de outra versão).
+        """
+        try:
+            with open(self.manifest_path, 'r') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {'year': self.year, 'version': DataHandler.PREPROCESSING_VERSION, 'races': {}}
+        
+        if manifest.get('version') != DataHandler.PREPROCESSING_VERSION:
+            return {'year': self.year, 'version': DataHandler.PREPROCESSING_VERSION, 'races': {}}
+        
+        return manifest
+    
+    def _save_manifest(self):
+        """
+        Grava o manifesto de forma atômica.
+        """
+        os.makedirs(os.path.dirname(self.manifest_path) or '.', exist_ok=True)
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+    
+    def is_done(self, race_name: str) -> bool:
+        """
+        Verifica se a corrida já foi carregada (manifesto e armazenamento de voltas).
+        """
+        entry = self.manifest['races'].get(race_name)
+        return (
+            entry is not None and entry['status'] == 'done' and
+            self.data_handler.lap_store.contains(self.year, race_name)
+        )
+    
+    def pending_races(self) -> List[str]:
+        """
+        Corridas que ainda precisam ser carregadas.
+        """
+        return [race for race in self.races if not self.is_done(race)]
+    
+    def _record(self, race_name: str, result: Dict, done: int, total: int, start_time: float):
+        """
+        Registra o resultado de uma corrida no manifesto e exibe progresso e ETA.
+        """
+        self.manifest['races'][race_name] = result
+        self._save_manifest()
+        
+        elapsed = time.perf_counter() - start_time
+        eta = (elapsed / done) * (total - done) if done else 0.0
+        status = "✅" if result['status'] == 'done' else "❌"
+        print(f"{status} [{done}/{total}] {race_name}: {result.get('rows', 0)} voltas em "
+              f"{result.get('elapsed', 0.0):.1f}s | decorrido {elapsed:.0f}s, ETA {eta:.0f}s")
+    
+    def _submit_all(self) -> Iterator[Tuple[str, Dict]]:
+        """
+        Executa o pool e gera (corrida, resultado) na ordem de conclusão.
+        
+        O número de corridas em andamento é limitado ao tamanho do pool.
+        """
+        pending = self.pending_races()
+        total = len(pending)
+        if not pending:
+            return
+        
+        print(f"📥 Pré-carregando {total} corridas de {self.year} com {self.max_workers} processos...")
+        start_time = time.perf_counter()
+        done = 0
+        
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            queue = list(pending)
+            running = {}
+            
+            while queue or running:
+                # Manter no máximo max_workers corridas em andamento
+                while queue and len(running) < self.max_workers:
+                    race_name = queue.pop(0)
+                    future = executor.submit(
+                        _prefetch_race, self.year, race_name, self.cache_dir,
+                        self.lap_store_dir, self.load_profile
+                    )
+                    running[future] = race_name
+                
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    race_name = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {'status': 'failed', 'error': str(e)}
+                    
+                    done += 1
+                    self._record(race_name, result, done, total, start_time)
+                    yield race_name, result
+    
+    def run(self) -> Dict:
+        """
+        Pré-carrega todas as corridas pendentes.
+        
+        Returns:
+            Resumo com corridas concluídas, ignoradas (já carregadas) e com falha
+        """
+        skipped = [race for race in self.races if self.is_done(race)]
+        completed, failed = [], []
+        
+        for race_name, result in self._submit_all():
+            (completed if result['status'] == 'done' else failed).append(race_name)
+        
+        return {'completed': completed, 'skipped': skipped, 'failed': failed}
+    
+    def iter_races(self) -> Iterator[Tuple[str, 'pd.DataFrame']]:
+        """
+        Gera (corrida, voltas) na ordem do calendário, assim que cada corrida fica pronta.
+        
+        Enquanto o consumidor processa uma corrida, as seguintes continuam
+        carregando no pool. Corridas com falha são ignoradas.
+        
+        Yields:
+            Tuplas (nome da corrida, DataFrame com as voltas de todos os pilotos)
+        """
+        results = {race: self.manifest['races'][race] for race in self.races if self.is_done(race)}
+        producer = self._submit_all()
+        
+        for race_name in self.races:
+            # Consumir resultados do pool até esta corrida estar pronta
+            while race_name not in results:
+                try:
+                    finished_race, result = next(producer)
+                except StopIteration:
+                    break
+                results[finished_race] = result
+            
+            result = results.get(race_name)
+            if result is None or result['status'] != 'done':
+                continue
+            
+            session_laps = self.data_handler.get_session_laps(self.year, race_name)
+            if not session_laps.empty:
+                yield race_name, session_laps
\ No newline at end of file
@@ -0,0 +1,966 @@
+import numpy as np
+from typing import List, Tuple, Dict, Optional
+
+
+class StintBreakdown:
+    """
+    Decomposição de uma estratégia em stints com o custo de cada um, usada na
+    reavaliação incremental (CompiledRaceModel.evaluate_edit).
+    """
+    
+    __slots__ = ('strategy', 'stints', 'stint_costs', 'total_time', 'recomputed_stints', 'model')
+    
+    def __init__(self, strategy: Tuple, stints: List[Tuple[str, int, int]], stint_costs: List[float],
+                 total_time: float, recomputed_stints: int, model: 'CompiledRaceModel'):
+        """
+        Inicializa a decomposição.
+        
+        Args:
+            strategy: Estratégia canônica (ordenada por volta)
+            stints: Lista de stints (composto, volta_inicial, volta_final_exclusiva)
+            stint_costs: Tempo de cada stint
+            total_time: Tempo total da estratégia (com penalizações)
+            recomputed_stints: Quantos stints precisaram ser calculados
+            model: Modelo que calculou os custos
+        """
+        self.strategy = strategy
+        self.stints = stints
+        self.stint_costs = stint_costs
+        self.total_time = total_time
+        self.recomputed_stints = recomputed_stints
+        self.model = model
+    
+    def __str__(self):
+        return f"Strategy: {list(self.strategy)}, Time: {self.total_time:.2f}s"
+
+
+class CompiledRaceModel:
+    """
+    Modelo de tempo de volta compilado a partir de um RaceSimulator.
+    
+    Contém apenas tipos simples e arrays NumPy (sem DataFrame), é imutável e
+    barato de serializar com pickle, podendo ser enviado a processos de trabalho.
+    Todas as avaliações de estratégia em tempo de execução passam por ele.
+    """
+    
+    __slots__ = (
+        'total_laps', 'pit_stop_time', 'evaluation_mode', 'T_base', 'fuel_effect_coeff',
+        'compound_names', 'compound_ids', 'modeled_compounds', 'race_compounds',
+        'initial_compound', 'initial_compound_id', 'degradation', 'alpha',
+        'max_table_bytes', 'lap_time_table', 'stint_prefix_sums', 'table_bytes',
+        '_coefficients'
+    )
+    
+    EVALUATION_MODES = ('exact', 'closed_form', 'table')
+    
+    # Coeficientes usados para compostos sem parâmetros no modelo
+    DEFAULT_DEGRADATION = 0.05
+    DEFAULT_ALPHA = 0.0
+    
+    # Voltas no início e no fim da corrida em que os otimizadores não param
+    PIT_WINDOW_MARGIN = 5
+    
+    def __init__(self, total_laps: int, pit_stop_time: float, evaluation_mode: str,
+                 T_base: float, fuel_effect_coeff: float,
+                 compound_names: Tuple, degradation: Tuple, alpha: Tuple,
+                 modeled_compounds: int, race_compounds: Tuple, initial_compound,
+                 max_table_bytes: int = 64 * 1024 * 1024):
+        """
+        Inicializa o modelo compilado (use RaceSimulator.compile()).
+        
+        Args:
+            total_laps: Número de voltas da corrida
+            pit_stop_time: Tempo de pit stop em segundos
+            evaluation_mode: 'exact', 'closed_form' ou 'table'
+            T_base: Tempo de volta base
+            fuel_effect_coeff: Efeito do combustível por volta
+            compound_names: Nomes dos compostos, na ordem dos ids
+            degradation: Coeficiente de degradação de cada composto
+            alpha: Delta de performance de cada composto
+            modeled_compounds: Quantos dos primeiros compostos têm coeficientes
+                próprios (apenas estes entram nas tabelas de tempo de volta)
+            race_compounds: Compostos presentes nos dados da corrida
+            initial_compound: Composto com que o piloto largou
+            max_table_bytes: Limite de memória das tabelas de tempo de volta
+        """
+        if evaluation_mode not in self.EVALUATION_MODES:
+            raise ValueError(f"Modo de avaliação não suportado: {evaluation_mode}")
+        
+        compound_names = tuple(compound_names)
+        if initial_compound not in compound_names:
+            compound_names = compound_names + (initial_compound,)
+            degradation = tuple(degradation) + (self.DEFAULT_DEGRADATION,)
+            alpha = tuple(alpha) + (self.DEFAULT_ALPHA,)
+        
+        degradation_array = np.array(degradation, dtype=float)
+        alpha_array = np.array(alpha, dtype=float)
+        degradation_array.flags.writeable = False
+        alpha_array.flags.writeable = False
+        
+        compound_ids = {compound: i for i, compound in enumerate(compound_names)}
+        
+        setattr_ = object.__setattr__
+        setattr_(self, 'total_laps', int(total_laps))
+        setattr_(self, 'pit_stop_time', pit_stop_time)
+        setattr_(self, 'evaluation_mode', evaluation_mode)
+        setattr_(self, 'T_base', T_base)
+        setattr_(self, 'fuel_effect_coeff', fuel_effect_coeff)
+        setattr_(self, 'compound_names', compound_names)
+        setattr_(self, 'compound_ids', compound_ids)
+        setattr_(self, 'modeled_compounds', int(modeled_compounds))
+        setattr_(self, 'race_compounds', tuple(race_compounds))
+        setattr_(self, 'initial_compound', initial_compound)
+        setattr_(self, 'initial_compound_id', compound_ids[initial_compound])
+        setattr_(self, 'degradation', degradation_array)
+        setattr_(self, 'alpha', alpha_array)
+        setattr_(self, 'max_table_bytes', max_table_bytes)
+        setattr_(self, '_coefficients', {
+            compound: (float(degradation_array[i]), float(alpha_array[i]))
+            for i, compound in enumerate(compound_names[:modeled_compounds])
+        })
+        
+        self._build_lap_time_tables()
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("CompiledRaceModel é imutável; use RaceSimulator.compile()")
+    
+    def compile(self) -> 'CompiledRaceModel':
+        """
+        Retorna o próprio modelo, que já está compilado.
+        
+        Permite usar o modelo onde se espera um RaceSimulator (ex.: o GA de
+        cada ilha, executado em um processo sem o DataFrame da corrida).
+        """
+        return self
+    
+    def __reduce__(self):
+        # As tabelas são reconstruídas no destino em vez de serializadas
+        return (CompiledRaceModel, (
+            self.total_laps, self.pit_stop_time, self.evaluation_mode, self.T_base,
+            self.fuel_effect_coeff, self.compound_names, tuple(self.degradation.tolist()),
+            tuple(self.alpha.tolist()), self.modeled_compounds, self.race_compounds,
+            self.initial_compound, self.max_table_bytes
+        ))
+    
+    def _build_lap_time_tables(self):
+        """
+        Pré-calcula a tabela densa de tempos de volta indexada por
+        (composto, volta inicial do stint, idade do pneu) e as somas acumuladas
+        ao longo da idade, de modo que o custo de qualquer stint seja uma consulta.
+        """
+        setattr_ = object.__setattr__
+        setattr_(self, 'lap_time_table', None)
+        setattr_(self, 'stint_prefix_sums', None)
+        setattr_(self, 'table_bytes', 0)
+        
+        # Apenas compostos com coeficientes próprios entram nas tabelas; os demais
+        # (valores padrão) usam sempre a forma fechada
+        n_compounds = self.modeled_compounds
+        
+        # Voltas iniciais e idades de 0 a total_laps + 1 (a heurística do ACO
+        # consulta a volta seguinte à última)
+        size = self.total_laps + 2
+        table_bytes = n_compounds * size * (2 * size + 1) * 8
+        
+        if table_bytes > self.max_table_bytes:
+            print(f"Aviso: Tabelas de tempo de volta exigiriam {table_bytes / 1e6:.1f} MB "
+                  f"(limite: {self.max_table_bytes / 1e6:.1f} MB)")
+            print("Usando soma por stint em forma fechada")
+            return
+        
+        degradation = self.degradation[:n_compounds]
+        alpha = self.alpha[:n_compounds]
+        start_laps = np.arange(size)[:, None]
+        tyre_ages = np.arange(size)[None, :]
+        
+        lap_times = (
+            self.T_base +
+            alpha[:, None, None] +
+            (degradation[:, None, None] * tyre_ages) -
+            (self.fuel_effect_coeff * (start_laps + tyre_ages))
+        )
+        lap_time_table = np.maximum(lap_times, 60.0)
+        
+        # stint_prefix_sums[c, a, n] = tempo das n primeiras voltas de um stint
+        # iniciado na volta a (soma sequencial, igual ao laço volta a volta)
+        stint_prefix_sums = np.zeros((n_compounds, size, size + 1))
+        stint_prefix_sums[:, :, 1:] = np.cumsum(lap_time_table, axis=2)
+        
+        lap_time_table.flags.writeable = False
+        stint_prefix_sums.flags.writeable = False
+        
+        setattr_(self, 'lap_time_table', lap_time_table)
+        setattr_(self, 'stint_prefix_sums', stint_prefix_sums)
+        setattr_(self, 'table_bytes', lap_time_table.nbytes + stint_prefix_sums.nbytes)
+    
+    def pit_window(self) -> Tuple[int, int]:
+        """
+        Janela de paradas comum aos otimizadores (GA, ACO e referência do DP).
+        
+        Returns:
+            Tupla (primeira, última) volta em que uma parada é considerada
+        """
+        margin = self.PIT_WINDOW_MARGIN
+        return margin, max(margin + 1, self.total_laps - margin)
+    
+    def get_table_memory(self) -> Dict:
+        """
+        Retorna o uso de memória das tabelas de tempo de volta.
+        
+        Returns:
+            Dicionário com bytes usados, limite configurado e se as tabelas existem
+        """
+        return {
+            'enabled': self.lap_time_table is not None,
+            'bytes': self.table_bytes,
+            'max_bytes': self.max_table_bytes,
+            'compounds': self.modeled_compounds if self.lap_time_table is not None else 0,
+            'total_laps': self.total_laps
+        }
+    
+    def _coefficient_arrays(self, n_ids: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Coeficientes indexados por id de composto, estendidos com os valores
+        padrão para ids de compostos desconhecidos (atribuídos em encode_strategies).
+        
+        Args:
+            n_ids: Número de ids necessários
+        
+        Returns:
+            Tupla (degradação, alpha)
+        """
+        n_extra = n_ids - len(self.compound_names)
+        if n_extra <= 0:
+            return self.degradation, self.alpha
+        
+        degradation = np.concatenate([self.degradation, np.full(n_extra, self.DEFAULT_DEGRADATION)])
+        alpha = np.concatenate([self.alpha, np.full(n_extra, self.DEFAULT_ALPHA)])
+        return degradation, alpha
+    
+    def encode_strategies(self, strategies: List[List[Tuple[int, str]]]) -> np.ndarray:
+        """
+        Converte uma lista de estratégias para o formato de lote.
+        
+        Compostos desconhecidos pelo modelo recebem ids a partir de
+        len(compound_names), válidos apenas dentro do lote retornado.
+        
+        Args:
+            strategies: Lista de estratégias (listas de tuplas (volta_parada, composto_novo))
+        
+        Returns:
+            Array (n, max_paradas, 2) com voltas de parada e ids de composto;
+            posições vazias têm composto -1
+        """
+        compound_ids = self.compound_ids
+        unknown_ids = {}
+        max_stops = max((len(strategy) for strategy in strategies), default=0)
+        rows = []
+        
+        for strategy in strategies:
+            row = []
+            for lap, compound in strategy:
+                compound_id = compound_ids.get(compound)
+                if compound_id is None:
+                    compound_id = unknown_ids.setdefault(
+                        compound, len(self.compound_names) + len(unknown_ids)
+                    )
+                row.append((lap, compound_id))
+            row.extend([(-1, -1)] * (max_stops - len(row)))
+            rows.append(row)
+        
+        return np.array(rows, dtype=np.int64).reshape(len(strategies), max_stops, 2)
+    
+    def evaluate_strategies(self, batch) -> np.ndarray:
+        """
+        Avalia um lote de estratégias com operações vetorizadas.
+        
+        O resultado é idêntico (bit a bit) a chamar evaluate_strategy para cada
+        estratégia: as contribuições de voltas (ou stints) e pit stops são
+        acumuladas na mesma ordem do caminho escalar.
+        
+        Args:
+            batch: Array (n, max_paradas, 2) de encode_strategies ou lista de estratégias
+        
+        Returns:
+            Array (n,) com o tempo total de cada estratégia
+        """
+        if not isinstance(batch, np.ndarray):
+            batch = self.encode_strategies(batch)
+        
+        n_strategies, max_stops = batch.shape[0], batch.shape[1]
+        if max_stops == 0:
+            # Nenhuma estratégia tem paradas: todas são inválidas
+            return np.full(n_strategies, float('inf'))
+        
+        stop_laps, compounds, active, paid_stop, n_stops = self._sorted_batch(batch)
+        
+        if self.evaluation_mode == 'exact':
+            total_times = self._batch_lap_totals(stop_laps, compounds, active, paid_stop)
+        else:
+            total_times = self._batch_stint_totals(stop_laps, compounds, active, paid_stop)
+        
+        # Penalizações (mesmas regras de evaluate_strategy)
+        penalties = np.maximum(n_stops - 3, 0) * 1000.0
+        uses_two_compounds = (active & (compounds != self.initial_compound_id)).any(axis=1)
+        penalties = penalties + np.where(uses_two_compounds, 0.0, 50000.0)
+        
+        total_times = total_times + penalties
+        total_times[n_stops == 0] = float('inf')
+        
+        return total_times
+    
+    def _sorted_batch(self, batch: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        Ordena as paradas de um lote e calcula as voltas efetivas e os pit stops pagos.
+        
+        Args:
+            batch: Array (n, max_paradas, 2) de encode_strategies
+        
+        Returns:
+            Tupla (voltas_efetivas, compostos, ativas, pagas, numero_paradas)
+        """
+        max_stops = batch.shape[1]
+        
+        # Ordenar paradas por volta (ordenação estável, posições vazias no fim)
+        active = batch[:, :, 1] >= 0
+        sort_key = np.where(active, batch[:, :, 0], np.iinfo(np.int64).max)
+        order = np.argsort(sort_key, axis=1, kind='stable')
+        pit_laps = np.take_along_axis(batch[:, :, 0], order, axis=1)
+        compounds = np.take_along_axis(batch[:, :, 1], order, axis=1)
+        active = np.take_along_axis(active, order, axis=1)
+        n_stops = active.sum(axis=1)
+        
+        # Volta em que cada parada efetivamente ocorre (o laço escalar para em total_laps + 1)
+        stop_laps = np.clip(pit_laps, 1, self.total_laps + 1)
+        
+        # Apenas as paradas anteriores à última pagam o tempo de pit stop
+        paid_stop = active & (np.arange(max_stops)[None, :] < (n_stops - 1)[:, None])
+        
+        return stop_laps, compounds, active, paid_stop, n_stops
+    
+    def lap_time_profiles(self, batch) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Tempos de volta e pit stops pagos de cada estratégia, volta a volta.
+        
+        Usado por simulações estocásticas que alteram voltas ou pit stops
+        individualmente (ex.: safety car).
+        
+        Args:
+            batch: Array (n, max_paradas, 2) de encode_strategies ou lista de estratégias
+        
+        Returns:
+            Tupla com array (n, total_laps) de tempos de volta e array
+            (n, total_laps + 1) com o número de pit stops pagos antes de cada volta
+            (a última coluna conta paradas após o fim da corrida)
+        """
+        if not isinstance(batch, np.ndarray):
+            batch = self.encode_strategies(batch)
+        
+        n_strategies = batch.shape[0]
+        if batch.shape[1] == 0:
+            batch = np.full((n_strategies, 1, 2), -1, dtype=np.int64)
+        
+        stop_laps, compounds, active, paid_stop, _ = self._sorted_batch(batch)
+        lap_times = self._lap_time_grid(stop_laps, compounds, active)
+        
+        paid_counts = np.zeros((n_strategies, self.total_laps + 1))
+        rows, cols = np.nonzero(paid_stop)
+        np.add.at(paid_counts, (rows, stop_laps[rows, cols] - 1), 1.0)
+        
+        return lap_times, paid_counts
+    
+    def _lap_time_grid(self, stop_laps: np.ndarray, compounds: np.ndarray,
+                       active: np.ndarray) -> np.ndarray:
+        """
+        Tempo de cada volta de um lote ordenado.
+        
+        Returns:
+            Array (n, total_laps) com os tempos de volta
+        """
+        # Para cada volta, a última parada já realizada define composto e idade do pneu
+        laps = np.arange(1, self.total_laps + 1)
+        stops_done = ((stop_laps[:, None, :] <= laps[None, :, None]) & active[:, None, :]).sum(axis=2)
+        last_stop = np.maximum(stops_done - 1, 0)
+        lap_compounds = np.where(
+            stops_done > 0, np.take_along_axis(compounds, last_stop, axis=1), self.initial_compound_id
+        )
+        stint_start = np.where(
+            stops_done > 0, np.take_along_axis(stop_laps, last_stop, axis=1), 1
+        )
+        tyre_ages = laps[None, :] - stint_start
+        
+        degradation, alpha = self._coefficient_arrays(max(compounds.max(), self.initial_compound_id) + 1)
+        lap_times = (
+            self.T_base +
+            alpha[lap_compounds] +
+            (degradation[lap_compounds] * tyre_ages) -
+            (self.fuel_effect_coeff * laps[None, :])
+        )
+        
+        return np.maximum(lap_times, 60.0)
+    
+    def _batch_lap_totals(self, stop_laps: np.ndarray, compounds: np.ndarray,
+                          active: np.ndarray, paid_stop: np.ndarray) -> np.ndarray:
+        """
+        Soma volta a volta de um lote ordenado (modo 'exact').
+        
+        Returns:
+            Array (n,) com o tempo total sem penalizações
+        """
+        n_strategies, max_stops = stop_laps.shape
+        lap_times = self._lap_time_grid(stop_laps, compounds, active)
+        
+        # Contribuições em ordem cronológica: para cada volta, as paradas que
+        # acontecem antes dela e depois a própria volta (bloco extra após a última volta)
+        contributions = np.zeros((n_strategies, self.total_laps + 1, max_stops + 1))
+        contributions[:, :-1, max_stops] = lap_times
+        
+        rows, cols = np.nonzero(paid_stop)
+        contributions[rows, stop_laps[rows, cols] - 1, cols] = self.pit_stop_time
+        
+        # Soma acumulada sequencial (mesma ordem de arredondamento do laço escalar)
+        return np.cumsum(contributions.reshape(n_strategies, -1), axis=1)[:, -1]
+    
+    def _batch_stint_totals(self, stop_laps: np.ndarray, compounds: np.ndarray,
+                            active: np.ndarray, paid_stop: np.ndarray) -> np.ndarray:
+        """
+        Soma stint a stint de um lote ordenado (modos 'closed_form' e 'table').
+        
+        Returns:
+            Array (n,) com o tempo total sem penalizações
+        """
+        n_strategies, max_stops = stop_laps.shape
+        starts, ends, stint_compounds = self._stint_bounds(stop_laps, compounds, active)
+        
+        stint_times = self.stint_times(stint_compounds, starts, ends)
+        pit_times = np.where(paid_stop, self.pit_stop_time, 0.0)
+        
+        # Acumular na mesma ordem do caminho escalar: stint, pit, stint, ...
+        total_times = np.zeros(n_strategies)
+        for k in range(max_stops):
+            total_times += stint_times[:, k]
+            total_times += pit_times[:, k]
+        total_times += stint_times[:, max_stops]
+        
+        return total_times
+    
+    def _stint_bounds(self, stop_laps: np.ndarray, compounds: np.ndarray,
+                      active: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Decompõe um lote ordenado em stints: o stint k vai de starts[:, k] até
+        ends[:, k] - 1 com o composto stint_compounds[:, k] (stints vazios após
+        a última parada).
+        
+        Returns:
+            Tupla (starts, ends, stint_compounds), cada uma (n, max_paradas + 1)
+        """
+        n_strategies = stop_laps.shape[0]
+        end_lap = self.total_laps + 1
+        
+        stop_bounds = np.where(active, stop_laps, end_lap)
+        bounds = np.concatenate([
+            np.ones((n_strategies, 1), dtype=np.int64),
+            stop_bounds,
+            np.full((n_strategies, 1), end_lap, dtype=np.int64)
+        ], axis=1)
+        stint_compounds = np.concatenate([
+            np.full((n_strategies, 1), self.initial_compound_id, dtype=np.int64),
+            np.where(active, compounds, self.initial_compound_id)
+        ], axis=1)
+        
+        return bounds[:, :-1], bounds[:, 1:], stint_compounds
+    
+    def stint_times(self, compounds: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """
+        Versão vetorizada de stint_time segundo o modo de avaliação ('table'
+        consulta as somas acumuladas; 'closed_form' usa a progressão aritmética).
+        
+        Args:
+            compounds: Ids de composto de cada stint
+            starts: Primeira volta de cada stint
+            ends: Volta seguinte à última volta de cada stint
+        
+        Returns:
+            Array com o tempo de cada stint
+        """
+        if self.evaluation_mode != 'table' or self.stint_prefix_sums is None:
+            return self._closed_form_stint_times(compounds, starts, ends)
+        
+        in_table = compounds < self.modeled_compounds
+        n_laps = np.maximum(ends - starts, 0)
+        stint_times = self.stint_prefix_sums[np.where(in_table, compounds, 0), starts, n_laps]
+        
+        if not in_table.all():
+            outside = ~in_table
+            stint_times[outside] = self._closed_form_stint_times(
+                compounds[outside], starts[outside], ends[outside]
+            )
+        
+        return stint_times
+    
+    def _closed_form_stint_times(self, compounds: np.ndarray, starts: np.ndarray,
+                                 ends: np.ndarray) -> np.ndarray:
+        """
+        Versão vetorizada de _closed_form_stint_time.
+        
+        Args:
+            compounds: Ids de composto de cada stint
+            starts: Primeira volta de cada stint
+            ends: Volta seguinte à última volta de cada stint
+        
+        Returns:
+            Array com o tempo de cada stint
+        """
+        degradation, alpha = self._coefficient_arrays(int(compounds.max(initial=0)) + 1)
+        n_laps = ends - starts
+        
+        base = self.T_base + alpha[compounds]
+        first = base - (self.fuel_effect_coeff * starts)
+        last = base + (degradation[compounds] * (n_laps - 1)) - (self.fuel_effect_coeff * (ends - 1))
+        stint_times = n_laps * (first + last) / 2
+        stint_times[n_laps <= 0] = 0.0
+        
+        # Stints em que o piso de 60s atua são somados volta a volta
+        floor_binds = (n_laps > 0) & (np.minimum(first, last) < 60.0)
+        for index in zip(*np.nonzero(floor_binds)):
+            stint_times[index] = self._exact_stint_time_by_coefficients(
+                float(degradation[compounds[index]]), float(alpha[compounds[index]]),
+                int(starts[index]), int(ends[index])
+            )
+        
+        return stint_times
+    
+    def evaluate_strategy(self, strategy: List[Tuple[int, str]]) -> float:
+        """
+        Avalia uma estratégia de pit stop.
+        
+        Args:
+            strategy: Lista de tuplas (volta_parada, composto_novo)
+        
+        Returns:
+            Tempo total da corrida em segundos
+        """
+        if not strategy:
+            # REGRA F1: Estratégia sem paradas é inválida - deve usar pelo menos dois compostos
+            # Retornar tempo muito alto para penalizar
+            return float('inf')
+        
+        # Ordenar estratégia por volta
+        strategy = sorted(strategy, key=lambda x: x[0])
+        
+        # Penalização por excesso de paradas
+        penalty = 0
+        if len(strategy) > 3:
+            penalty = (len(strategy) - 3) * 1000  # Penalização alta por excesso
+        
+        # REGRA F1: Verificar se usa pelo menos dois compostos diferentes
+        if all(compound == self.initial_compound for _, compound in strategy):
+            # Violação da regra F1 - penalização muito alta
+            penalty += 50000.0
+        
+        if self.evaluation_mode != 'exact':
+            return self._simulate_by_stints(strategy) + penalty
+        
+        # Simular corrida
+        total_time = 0
+        current_lap = 1
+        current_compound = self.initial_compound
+        current_tyre_age = 0
+        
+        for i, (pit_lap, new_compound) in enumerate(strategy):
+            # Simular voltas até a parada
+            while current_lap < pit_lap and current_lap <= self.total_laps:
+                lap_time = self.calculate_lap_time(
+                    current_lap, current_compound, current_tyre_age
+                )
+                total_time += lap_time
+                current_lap += 1
+                current_tyre_age += 1
+            
+            # Adicionar tempo de pit stop (exceto na última parada)
+            if i < len(strategy) - 1:
+                total_time += self.pit_stop_time
+            
+            # Atualizar estado do pneu
+            current_compound = new_compound
+            current_tyre_age = 0
+        
+        # Simular voltas restantes
+        while current_lap <= self.total_laps:
+            lap_time = self.calculate_lap_time(
+                current_lap, current_compound, current_tyre_age
+            )
+            total_time += lap_time
+            current_lap += 1
+            current_tyre_age += 1
+        
+        return total_time + penalty
+    
+    def _simulate_by_stints(self, strategy: List[Tuple[int, str]]) -> float:
+        """
+        Simula uma estratégia já ordenada somando stints inteiros (modos
+        'closed_form' e 'table'); o custo não depende do número de voltas.
+        
+        Args:
+            strategy: Lista ordenada de tuplas (volta_parada, composto_novo)
+        
+        Returns:
+            Tempo total da corrida sem penalizações
+        """
+        total_time = 0.0
+        current_lap = 1
+        current_compound = self.initial_compound
+        
+        for i, (pit_lap, new_compound) in enumerate(strategy):
+            # Mesma volta de parada que o laço volta a volta alcançaria
+            stop_lap = max(current_lap, min(pit_lap, self.total_laps + 1))
+            total_time += self.stint_time(current_compound, current_lap, stop_lap)
+            
+            # Adicionar tempo de pit stop (exceto na última parada)
+            if i < len(strategy) - 1:
+                total_time += self.pit_stop_time
+            
+            current_compound = new_compound
+            current_lap = stop_lap
+        
+        total_time += self.stint_time(current_compound, current_lap, self.total_laps + 1)
+        
+        return total_time
+    
+    def stint_breakdown(self, strategy: List[Tuple[int, str]]) -> StintBreakdown:
+        """
+        Avalia uma estratégia guardando o custo de cada stint, para que edições
+        locais possam ser reavaliadas com evaluate_edit.
+        
+        Nos modos 'table' e 'closed_form' o total é idêntico (bit a bit) ao de
+        evaluate_strategy; no modo 'exact' cada stint é somado volta a volta
+        separadamente, o que pode diferir apenas no arredondamento.
+        
+        Args:
+            strategy: Lista de tuplas (volta_parada, composto_novo)
+            
+        Returns:
+            StintBreakdown com stints, custos e tempo total
+        """
+        strategy = tuple(sorted(((lap, compound) for lap, compound in strategy), key=lambda x: x[0]))
+        stints = self._strategy_stints(strategy)
+        stint_costs = [self._breakdown_stint_time(*stint) for stint in stints]
+        
+        return StintBreakdown(
+            strategy, stints, stint_costs,
+            self._total_from_stints(strategy, stint_costs), len(stints), self
+        )
+    
+    def evaluate_edit(self, breakdown: StintBreakdown, edit: Tuple) -> StintBreakdown:
+        """
+        Reavalia uma estratégia após uma edição local, recalculando apenas os
+        stints que mudaram.
+        
+        Edições suportadas (índices referem-se a breakdown.strategy):
+            ('move', índice, nova_volta)
+            ('compound', índice, novo_composto)
+            ('add', volta, composto)
+            ('remove', índice)
+        
+        Args:
+            breakdown: Decomposição da estratégia original (de stint_breakdown)
+            edit: Edição a aplicar
+            
+        Returns:
+            StintBreakdown da estratégia editada
+        """
+        strategy = self.apply_edit(breakdown.strategy, edit)
+        
+        if breakdown.model is not self:
+            # Custos calculados por outro modelo (parâmetros diferentes)
+            return self.stint_breakdown(strategy)
+        
+        stints = self._strategy_stints(strategy)
+        known_costs = dict(zip(breakdown.stints, breakdown.stint_costs))
+        stint_costs = []
+        recomputed = 0
+        
+        for stint in stints:
+            cost = known_costs.get(stint)
+            if cost is None:
+                cost = self._breakdown_stint_time(*stint)
+                recomputed += 1
+            stint_costs.append(cost)
+        
+        return StintBreakdown(
+            strategy, stints, stint_costs,
+            self._total_from_stints(strategy, stint_costs), recomputed, self
+        )
+    
+    @staticmethod
+    def apply_edit(strategy: Tuple, edit: Tuple) -> Tuple:
+        """
+        Aplica uma edição local a uma estratégia canônica.
+        
+        Args:
+            strategy: Estratégia canônica (ordenada por volta)
+            edit: Edição (ver evaluate_edit)
+            
+        Returns:
+            Nova estratégia canônica
+        """
+        strategy = list(strategy)
+        kind = edit[0]
+        
+        if kind == 'move':
+            _, index, new_lap = edit
+            strategy[index] = (new_lap, strategy[index][1])
+        elif kind == 'compound':
+            _, index, new_compound = edit
+            strategy[index] = (strategy[index][0], new_compound)
+        elif kind == 'add':
+            _, lap, compound = edit
+            strategy.append((lap, compound))
+        elif kind == 'remove':
+            _, index = edit
+            strategy.pop(index)
+        else:
+            raise ValueError(f"Edição não suportada: {kind}")
+        
+        return tuple(sorted(strategy, key=lambda x: x[0]))
+    
+    def _strategy_stints(self, strategy: Tuple) -> List[Tuple[str, int, int]]:
+        """
+        Decompõe uma estratégia ordenada em stints, com as mesmas voltas de
+        parada que a simulação volta a volta alcançaria.
+        
+        Args:
+            strategy: Estratégia ordenada por volta
+            
+        Returns:
+            Lista de stints (composto, volta_inicial, volta_final_exclusiva)
+        """
+        stints = []
+        current_lap = 1
+        current_compound = self.initial_compound
+        
+        for pit_lap, new_compound in strategy:
+            stop_lap = max(current_lap, min(pit_lap, self.total_laps + 1))
+            stints.append((current_compound, current_lap, stop_lap))
+            current_compound = new_compound
+            current_lap = stop_lap
+        
+        stints.append((current_compound, current_lap, self.total_laps + 1))
+        
+        return stints
+    
+    def _breakdown_stint_time(self, compound: str, start_lap: int, end_lap: int) -> float:
+        """
+        Custo de um stint na decomposição (soma volta a volta no modo 'exact').
+        
+        Returns:
+            Tempo total do stint em segundos
+        """
+        if self.evaluation_mode == 'exact':
+            return self.exact_stint_time(compound, start_lap, end_lap)
+        return self.stint_time(compound, start_lap, end_lap)
+    
+    def _total_from_stints(self, strategy: Tuple, stint_costs: List[float]) -> float:
+        """
+        Soma custos de stints e pit stops na mesma ordem de _simulate_by_stints
+        e aplica as penalizações de evaluate_strategy.
+        
+        Args:
+            strategy: Estratégia ordenada por volta
+            stint_costs: Custo de cada stint
+            
+        Returns:
+            Tempo total da corrida em segundos
+        """
+        if not strategy:
+            return float('inf')
+        
+        total_time = 0.0
+        for i in range(len(strategy)):
+            total_time += stint_costs[i]
+            
+            # Adicionar tempo de pit stop (exceto na última parada)
+            if i < len(strategy) - 1:
+                total_time += self.pit_stop_time
+        total_time += stint_costs[-1]
+        
+        penalty = 0
+        if len(strategy) > 3:
+            penalty = (len(strategy) - 3) * 1000
+        if all(compound == self.initial_compound for _, compound in strategy):
+            penalty += 50000.0
+        
+        return total_time + penalty
+    
+    def calculate_lap_time(self, lap_number: int, compound: str, tyre_age: int) -> float:
+        """
+        Calcula o tempo de uma volta específica pela fórmula do modelo.
+        
+        Args:
+            lap_number: Número da volta
+            compound: Composto do pneu
+            tyre_age: Idade do pneu (voltas de uso)
+        
+        Returns:
+            Tempo da volta em segundos
+        """
+        # Usar valores padrão se o composto não estiver no modelo
+        degradation_coeff, alpha_coeff = self._coefficients.get(
+            compound, (self.DEFAULT_DEGRADATION, self.DEFAULT_ALPHA)
+        )
+        
+        # Fórmula do modelo
+        lap_time = (
+            self.T_base +
+            alpha_coeff +
+            (degradation_coeff * tyre_age) -
+            (self.fuel_effect_coeff * lap_number)
+        )
+        
+        return max(lap_time, 60.0)  # Tempo mínimo de 60s
+    
+    def lap_times(self, lap_numbers: np.ndarray, compound: str, tyre_ages: np.ndarray) -> np.ndarray:
+        """
+        Versão vetorizada de lap_time para um composto (mesmos valores, elemento
+        a elemento, que a tabela pré-calculada e a fórmula do modelo).
+        
+        Args:
+            lap_numbers: Números das voltas
+            compound: Composto do pneu
+            tyre_ages: Idades do pneu (mesma forma ou difundível com lap_numbers)
+        
+        Returns:
+            Array com os tempos de volta em segundos
+        """
+        degradation_coeff, alpha_coeff = self._coefficients.get(
+            compound, (self.DEFAULT_DEGRADATION, self.DEFAULT_ALPHA)
+        )
+        
+        lap_times = (
+            self.T_base +
+            alpha_coeff +
+            (degradation_coeff * np.asarray(tyre_ages)) -
+            (self.fuel_effect_coeff * np.asarray(lap_numbers))
+        )
+        
+        return np.maximum(lap_times, 60.0)
+    
+    def lap_time(self, lap_number: int, compound: str, tyre_age: int) -> float:
+        """
+        Tempo de uma volta lido da tabela pré-calculada (ou calculado pela
+        fórmula se a combinação estiver fora da tabela).
+        
+        Args:
+            lap_number: Número da volta
+            compound: Composto do pneu
+            tyre_age: Idade do pneu (voltas de uso)
+        
+        Returns:
+            Tempo da volta em segundos
+        """
+        compound_id = self.compound_ids.get(compound, self.modeled_compounds)
+        start_lap = lap_number - tyre_age
+        
+        if (self.lap_time_table is not None and compound_id < self.modeled_compounds and
+                1 <= start_lap and lap_number <= self.total_laps + 1 and tyre_age >= 0):
+            return float(self.lap_time_table[compound_id, start_lap, tyre_age])
+        
+        return self.calculate_lap_time(lap_number, compound, tyre_age)
+    
+    def stint_time(self, compound: str, start_lap: int, end_lap: int) -> float:
+        """
+        Tempo de um stint com pneu novo da volta start_lap até end_lap - 1
+        segundo o modo de avaliação ('table' consulta as somas acumuladas).
+        
+        Args:
+            compound: Composto do pneu
+            start_lap: Primeira volta do stint
+            end_lap: Volta seguinte à última volta do stint
+        
+        Returns:
+            Tempo total do stint em segundos
+        """
+        n_laps = end_lap - start_lap
+        if n_laps <= 0:
+            return 0.0
+        
+        if self.evaluation_mode == 'table' and self.stint_prefix_sums is not None:
+            compound_id = self.compound_ids.get(compound, self.modeled_compounds)
+            if compound_id < self.modeled_compounds and start_lap >= 1 and end_lap <= self.total_laps + 1:
+                return float(self.stint_prefix_sums[compound_id, start_lap, n_laps])
+        
+        return self._closed_form_stint_time(compound, start_lap, end_lap)
+    
+    def _closed_form_stint_time(self, compound: str, start_lap: int, end_lap: int) -> float:
+        """
+        Tempo de um stint com pneu novo da volta start_lap até end_lap - 1.
+        
+        Como o tempo de volta é linear na idade do pneu e no número da volta,
+        o stint é uma progressão aritmética: soma = n * (primeira + última) / 2.
+        Se o piso de 60s atuar em alguma volta, o stint é somado volta a volta.
+        
+        Args:
+            compound: Composto do pneu
+            start_lap: Primeira volta do stint
+            end_lap: Volta seguinte à última volta do stint
+        
+        Returns:
+            Tempo total do stint em segundos
+        """
+        n_laps = end_lap - start_lap
+        if n_laps <= 0:
+            return 0.0
+        
+        degradation_coeff, alpha_coeff = self._coefficients.get(
+            compound, (self.DEFAULT_DEGRADATION, self.DEFAULT_ALPHA)
+        )
+        base = self.T_base + alpha_coeff
+        first = base - (self.fuel_effect_coeff * start_lap)
+        last = (
+            base +
+            (degradation_coeff * (n_laps - 1)) -
+            (self.fuel_effect_coeff * (end_lap - 1))
+        )
+        
+        if min(first, last) < 60.0:
+            return self._exact_stint_time_by_coefficients(
+                degradation_coeff, alpha_coeff, start_lap, end_lap
+            )
+        
+        return n_laps * (first + last) / 2
+    
+    def exact_stint_time(self, compound: str, start_lap: int, end_lap: int) -> float:
+        """
+        Soma volta a volta de um stint (aplica o piso de 60s em cada volta).
+        
+        Args:
+            compound: Composto do pneu
+            start_lap: Primeira volta do stint
+            end_lap: Volta seguinte à última volta do stint
+        
+        Returns:
+            Tempo total do stint em segundos
+        """
+        degradation_coeff, alpha_coeff = self._coefficients.get(
+            compound, (self.DEFAULT_DEGRADATION, self.DEFAULT_ALPHA)
+        )
+        return self._exact_stint_time_by_coefficients(degradation_coeff, alpha_coeff, start_lap, end_lap)
+    
+    def _exact_stint_time_by_coefficients(self, degradation_coeff: float, alpha_coeff: float,
+                                          start_lap: int, end_lap: int) -> float:
+        """
+        Soma volta a volta de um stint a partir dos coeficientes do composto.
+        
+        Returns:
+            Tempo total do stint em segundos
+        """
+        total_time = 0.0
+        for lap in range(start_lap, end_lap):
+            lap_time = (
+                self.T_base +
+                alpha_coeff +
+                (degradation_coeff * (lap - start_lap)) -
+                (self.fuel_effect_coeff * lap)
+            )
+            total_time += max(lap_time, 60.0)
+        return total_time
@@ -1,7 +1,11 @@
-import pandas as pd
 import numpy as np
-from sklearn.linear_model import LinearRegression
-from typing import List, Tuple, Dict, Optional
+from collections import OrderedDict
+from typing import List, Tuple, Dict, Optional, TYPE_CHECKING
+from .race_model import CompiledRaceModel, StintBreakdown
+from .model_fitting import FUEL_EFFECT_COEFF, fit_lap_time_parameters
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class RaceSimulator:
@@ -9,80 +13,105 @@ class RaceSimulator:
     Simulador de corrida que calcula o tempo total para uma estratégia específica.
     """
     
-    def __init__(self, race_data: pd.DataFrame, pit_stop_time: float = 25.0):
+    EVALUATION_MODES = CompiledRaceModel.EVALUATION_MODES
+    
+    def __init__(self, race_data: 'pd.DataFrame', pit_stop_time: float = 25.0,
+                 evaluation_mode: str = 'table',
+                 max_table_bytes: int = 64 * 1024 * 1024,
+                 cache_size: int = 0,
+                 fitted_parameters: Optional[Dict] = None):
         """
         Inicializa o simulador com dados da corrida.
         
         Args:
             race_data: DataFrame com dados processados da corrida
             pit_stop_time: Tempo de pit stop em segundos (padrão: 25s)
+            evaluation_mode: 'exact' soma volta a volta; 'closed_form' soma cada
+                stint em tempo constante (custo independente do número de voltas);
+                'table' consulta o custo de cada stint nas tabelas pré-calculadas
+            max_table_bytes: Limite de memória das tabelas de tempo de volta; acima
+                dele as tabelas não são criadas e o modo 'table' usa 'closed_form'
+            cache_size: Número máximo de estratégias memorizadas (cache LRU);
+                0 desativa o cache
+            fitted_parameters: Parâmetros já ajustados (ver fit_lap_time_parameters);
+                se None, são ajustados a partir de race_data
         """
+        if evaluation_mode not in self.EVALUATION_MODES:
+            raise ValueError(f"Modo de avaliação não suportado: {evaluation_mode}")
+        
         self.race_data = race_data
         self.pit_stop_time = pit_stop_time
+        self.evaluation_mode = evaluation_mode
+        self.max_table_bytes = max_table_bytes
         self.total_laps = len(race_data)
         
         # Calcular parâmetros do modelo
-        self._calculate_model_parameters()
+        self._calculate_model_parameters(fitted_parameters)
+        
+        # Modelo compilado (sem pandas) usado em todas as avaliações
+        self._model = self._compile_model()
+        
+        # Cache LRU de avaliações, invalidado quando os parâmetros do modelo mudam
+        self.cache_size = cache_size
+        self._evaluation_cache = OrderedDict()
+        self._cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+        self._model_signature = self._compute_model_signature()
     
-    def _calculate_model_parameters(self):
+    @classmethod
+    def from_session_laps(cls, session_laps: 'pd.DataFrame', drivers: Optional[List[str]] = None,
+                          driver_column: str = 'Driver', **kwargs) -> Dict[str, 'RaceSimulator']:
         """
-        Calcula os parâmetros do modelo de tempo de volta.
-        """
-        # Efeito do combustível (padrão da indústria)
-        self.fuel_effect_coeff = 0.035  # segundos por volta
+        Cria um simulador por piloto a partir das voltas de uma sessão inteira.
         
-        # Inicializar dicionários para coeficientes
-        self.degradation_coeffs = {}
-        self.alpha_coeffs = {}
+        Os parâmetros de todos os pilotos são ajustados juntos, em uma única passada.
         
-        # Obter compostos únicos
-        compounds = self.race_data['Compound'].unique()
+        Args:
+            session_laps: DataFrame pré-processado com as voltas de todos os pilotos
+            drivers: Pilotos desejados (padrão: todos da sessão)
+            driver_column: Coluna com o código do piloto
+            **kwargs: Argumentos repassados a cada RaceSimulator
+            
+        Returns:
+            Dicionário {piloto: RaceSimulator}
+        """
+        if session_laps.empty:
+            return {}
         
-        # Definir composto de referência (HARD como baseline)
-        reference_compound = 'HARD' if 'HARD' in compounds else compounds[0]
+        fitted = fit_lap_time_parameters(session_laps, by=driver_column)
+        driver_laps = dict(tuple(session_laps.groupby(driver_column, sort=False)))
         
-        # Calcular parâmetros para cada composto
-        compound_intercepts = {}
+        if drivers is None:
+            drivers = list(fitted)
         
-        for compound in compounds:
-            if pd.isna(compound):
-                continue
-                
-            # Filtrar dados para este composto
-            compound_data = self.race_data[self.race_data['Compound'] == compound].copy()
-            
-            if len(compound_data) < 3:
+        simulators = {}
+        for driver in drivers:
+            if driver not in fitted:
+                print(f"Aviso: Sem dados para o piloto {driver}")
                 continue
-            
-            # Corrigir tempos para efeito do combustível
-            compound_data['CorrectedTime'] = (
-                compound_data['LapTimeSeconds'] + 
-                (self.fuel_effect_coeff * compound_data['LapNumber'])
-            )
-            
-            # Preparar dados para regressão linear
-            X = compound_data[['TyreLife']].values
-            y = compound_data['CorrectedTime'].values
-            
-            # Ajustar regressão linear
-            model = LinearRegression()
-            model.fit(X, y)
-            
-            # Armazenar coeficientes
-            self.degradation_coeffs[compound] = model.coef_[0]  # Penalidade por volta
-            compound_intercepts[compound] = model.intercept_
+            simulators[driver] = cls(driver_laps[driver], fitted_parameters=fitted[driver], **kwargs)
         
-        # Calcular deltas de performance (alpha_coeffs)
-        reference_intercept = compound_intercepts.get(reference_compound, 0)
+        return simulators
+    
+    def _calculate_model_parameters(self, fitted_parameters: Optional[Dict] = None):
+        """
+        Calcula os parâmetros do modelo de tempo de volta.
         
-        for compound in compounds:
-            if compound in compound_intercepts:
-                self.alpha_coeffs[compound] = reference_intercept - compound_intercepts[compound]
-            else:
-                self.alpha_coeffs[compound] = 0
+        Args:
+            fitted_parameters: Parâmetros já ajustados por fit_lap_time_parameters
+                (ex.: ajuste conjunto de todos os pilotos); ajusta sobre race_data se None
+        """
+        # Efeito do combustível (padrão da indústria)
+        self.fuel_effect_coeff = FUEL_EFFECT_COEFF  # segundos por volta
+        
+        # Ajuste por mínimos quadrados de todos os compostos em uma única passada
+        if fitted_parameters is None:
+            fitted_parameters = fit_lap_time_parameters(self.race_data, fuel_effect_coeff=self.fuel_effect_coeff)
+        
+        self.degradation_coeffs = dict(fitted_parameters['degradation_coeffs'])
+        self.alpha_coeffs = dict(fitted_parameters['alpha_coeffs'])
         
         # Tempo de volta base
-        self.T_base = reference_intercept
+        self.T_base = fitted_parameters['T_base']
         
         # Se não temos dados suficientes, usar valores padrão
         if not self.degradation_coeffs:
@@ -147,72 +176,351 @@ class RaceSimulator:
                 else:
                     self.alpha_coeffs[compound] = 0.0  # Valor padrão
     
-    def evaluate_strategy(self, strategy: List[Tuple[int, str]]) -> float:
+    def compile(self) -> CompiledRaceModel:
+        """
+        Retorna o modelo compilado (imutável, sem pandas) para os parâmetros atuais.
+        
+        O modelo é recompilado apenas quando pit_stop_time, o modo de avaliação
+        ou os coeficientes mudam.
+        
+        Returns:
+            CompiledRaceModel usado nas avaliações em tempo de execução
+        """
+        self.refresh_model()
+        return self._model
+    
+    @staticmethod
+    def _is_missing(value) -> bool:
+        """
+        Verifica se um valor está ausente (None, NaN ou pd.NA) sem depender do pandas.
+        """
+        if value is None:
+            return True
+        try:
+            return bool(value != value)
+        except TypeError:
+            return True  # pd.NA não tem valor booleano
+    
+    def _compile_model(self) -> CompiledRaceModel:
+        """
+        Constrói o CompiledRaceModel a partir dos parâmetros atuais.
+        
+        Returns:
+            Novo modelo compilado
+        """
+        # Compostos com coeficientes próprios primeiro (entram nas tabelas)
+        modeled = list(dict.fromkeys(list(self.degradation_coeffs) + list(self.alpha_coeffs)))
+        race_compounds = [c for c in self.race_data['Compound'].unique() if not self._is_missing(c)]
+        compound_names = modeled + [c for c in race_compounds if c not in modeled]
+        initial_compound = self.race_data['Compound'].iloc[0] if self.total_laps > 0 else None
+        
+        return CompiledRaceModel(
+            total_laps=self.total_laps,
+            pit_stop_time=self.pit_stop_time,
+            evaluation_mode=self.evaluation_mode,
+            T_base=self.T_base,
+            fuel_effect_coeff=self.fuel_effect_coeff,
+            compound_names=compound_names,
+            degradation=[self.degradation_coeffs.get(c, 0.05) for c in compound_names],
+            alpha=[self.alpha_coeffs.get(c, 0.0) for c in compound_names],
+            modeled_compounds=len(modeled),
+            race_compounds=race_compounds,
+            initial_compound=initial_compound,
+            max_table_bytes=self.max_table_bytes
+        )
+    
+    def get_table_memory(self) -> Dict:
         """
-        Avalia uma estratégia de pit stop.
+        Retorna o uso de memória das tabelas de tempo de volta.
+        
+        Returns:
+            Dicionário com bytes usados, limite configurado e se as tabelas existem
+        """
+        return self.compile().get_table_memory()
+    
+    def lap_time(self, lap_number: int, compound: str, tyre_age: int) -> float:
+        """
+        Tempo de uma volta lido da tabela pré-calculada (ou calculado pela
+        fórmula se a combinação estiver fora da tabela).
+        
+        Args:
+            lap_number: Número da volta
+            compound: Composto do pneu
+            tyre_age: Idade do pneu (voltas de uso)
+            
+        Returns:
+            Tempo da volta em segundos
+        """
+        return self.compile().lap_time(lap_number, compound, tyre_age)
+    
+    def stint_time(self, compound: str, start_lap: int, end_lap: int) -> float:
+        """
+        Tempo de um stint com pneu novo da volta start_lap até end_lap - 1.
+        
+        Args:
+            compound: Composto do pneu
+            start_lap: Primeira volta do stint
+            end_lap: Volta seguinte à última volta do stint
+            
+        Returns:
+            Tempo total do stint em segundos
+        """
+        return self.compile().stint_time(compound, start_lap, end_lap)
+    
+    def stint_breakdown(self, strategy: List[Tuple[int, str]]) -> StintBreakdown:
+        """
+        Avalia uma estratégia guardando o custo de cada stint
+        (ver CompiledRaceModel.stint_breakdown).
         
         Args:
             strategy: Lista de tuplas (volta_parada, composto_novo)
             
         Returns:
-            Tempo total da corrida em segundos
+            StintBreakdown com stints, custos e tempo total
+        """
+        return self.compile().stint_breakdown(strategy)
+    
+    def evaluate_edit(self, breakdown: StintBreakdown, edit: Tuple) -> StintBreakdown:
+        """
+        Reavalia uma estratégia após uma edição local (mover parada, trocar
+        composto, inserir ou remover parada), recalculando apenas os stints
+        afetados (ver CompiledRaceModel.evaluate_edit).
+        
+        Args:
+            breakdown: Decomposição da estratégia original
+            edit: Edição a aplicar
+            
+        Returns:
+            StintBreakdown da estratégia editada
+        """
+        return self.compile().evaluate_edit(breakdown, edit)
+    
+    def _compute_model_signature(self) -> Tuple:
         """
-        if not strategy:
-            # REGRA F1: Estratégia sem paradas é inválida - deve usar pelo menos dois compostos
-            # Retornar tempo muito alto para penalizar
-            return float('inf')
+        Resume tudo o que influencia o resultado de uma avaliação.
         
-        # Ordenar estratégia por volta
-        strategy = sorted(strategy, key=lambda x: x[0])
+        Returns:
+            Tupla comparável com os parâmetros atuais do modelo
+        """
+        return (
+            self.pit_stop_time,
+            self.evaluation_mode,
+            self.max_table_bytes,
+            self.total_laps,
+            self.T_base,
+            self.fuel_effect_coeff,
+            tuple(self.degradation_coeffs.items()),
+            tuple(self.alpha_coeffs.items())
+        )
+    
+    def refresh_model(self) -> bool:
+        """
+        Verifica se pit_stop_time, o modo de avaliação ou os coeficientes do modelo
+        mudaram desde a última avaliação; se sim, recompila o modelo (e suas
+        tabelas de tempo de volta) e esvazia o cache de avaliações.
         
-        # Penalização por excesso de paradas
-        penalty = 0
-        if len(strategy) > 3:
-            penalty = (len(strategy) - 3) * 1000  # Penalização alta por excesso
+        Chamado automaticamente por evaluate_strategy e evaluate_strategies.
         
-        # REGRA F1: Verificar se usa pelo menos dois compostos diferentes
-        compounds_used = set(compound for _, compound in strategy)
-        initial_compound = self.race_data['Compound'].iloc[0]
-        all_compounds_used = compounds_used | {initial_compound}
+        Returns:
+            True se o modelo mudou
+        """
+        signature = self._compute_model_signature()
+        if signature == self._model_signature:
+            return False
         
-        if len(all_compounds_used) < 2:
-            # Violação da regra F1 - penalização muito alta
-            penalty += 50000.0
+        if self.evaluation_mode not in self.EVALUATION_MODES:
+            raise ValueError(f"Modo de avaliação não suportado: {self.evaluation_mode}")
         
-        # Simular corrida
-        total_time = 0
-        current_lap = 1
-        current_compound = self.race_data['Compound'].iloc[0]
-        current_tyre_age = 0
-        
-        for i, (pit_lap, new_compound) in enumerate(strategy):
-            # Simular voltas até a parada
-            while current_lap < pit_lap and current_lap <= self.total_laps:
-                lap_time = self._calculate_lap_time(
-                    current_lap, current_compound, current_tyre_age
-                )
-                total_time += lap_time
-                current_lap += 1
-                current_tyre_age += 1
+        self._model_signature = signature
+        self._model = self._compile_model()
+        
+        if self._evaluation_cache:
+            self._cache_stats['invalidations'] += 1
+        self._evaluation_cache.clear()
+        
+        return True
+    
+    def set_cache_size(self, cache_size: int):
+        """
+        Ativa, redimensiona ou desativa (cache_size=0) o cache de avaliações.
+        
+        Args:
+            cache_size: Número máximo de estratégias memorizadas
+        """
+        self.cache_size = cache_size
+        while len(self._evaluation_cache) > max(cache_size, 0):
+            self._evaluation_cache.popitem(last=False)
+            self._cache_stats['evictions'] += 1
+    
+    def get_cache_stats(self) -> Dict:
+        """
+        Retorna as estatísticas do cache de avaliações.
+        
+        Returns:
+            Dicionário com tamanho, acertos, falhas, remoções e taxa de acerto
+        """
+        lookups = self._cache_stats['hits'] + self._cache_stats['misses']
+        
+        return {
+            'enabled': self.cache_size > 0,
+            'max_size': self.cache_size,
+            'size': len(self._evaluation_cache),
+            'hits': self._cache_stats['hits'],
+            'misses': self._cache_stats['misses'],
+            'evictions': self._cache_stats['evictions'],
+            'invalidations': self._cache_stats['invalidations'],
+            'hit_rate': self._cache_stats['hits'] / lookups if lookups > 0 else 0.0
+        }
+    
+    @staticmethod
+    def _canonical_strategy(strategy: List[Tuple[int, str]]) -> Tuple:
+        """
+        Forma canônica (ordenada por volta, imutável) de uma estratégia.
+        
+        A ordenação é estável, como em evaluate_strategy, então duas estratégias
+        com a mesma forma canônica têm sempre o mesmo tempo total.
+        
+        Args:
+            strategy: Lista de tuplas (volta_parada, composto_novo)
             
-            # Adicionar tempo de pit stop (exceto na última parada)
-            if i < len(strategy) - 1:
-                total_time += self.pit_stop_time
+        Returns:
+            Tupla de tuplas (volta_parada, composto_novo)
+        """
+        return tuple(sorted(((lap, compound) for lap, compound in strategy), key=lambda x: x[0]))
+    
+    def _cache_lookup(self, key: Tuple) -> Optional[float]:
+        """
+        Busca uma estratégia canônica no cache, atualizando a ordem LRU.
+        
+        Args:
+            key: Estratégia canônica
             
-            # Atualizar estado do pneu
-            current_compound = new_compound
-            current_tyre_age = 0
-        
-        # Simular voltas restantes
-        while current_lap <= self.total_laps:
-            lap_time = self._calculate_lap_time(
-                current_lap, current_compound, current_tyre_age
-            )
-            total_time += lap_time
-            current_lap += 1
-            current_tyre_age += 1
+        Returns:
+            Tempo total memorizado ou None
+        """
+        total_time = self._evaluation_cache.get(key)
+        
+        if total_time is None:
+            self._cache_stats['misses'] += 1
+        else:
+            self._evaluation_cache.move_to_end(key)
+            self._cache_stats['hits'] += 1
+        
+        return total_time
+    
+    def _cache_store(self, key: Tuple, total_time: float):
+        """
+        Memoriza o tempo total de uma estratégia canônica (remove a menos
+        usada recentemente quando o cache está cheio).
         
-        return total_time + penalty
+        Args:
+            key: Estratégia canônica
+            total_time: Tempo total da estratégia
+        """
+        self._evaluation_cache[key] = total_time
+        
+        if len(self._evaluation_cache) > self.cache_size:
+            self._evaluation_cache.popitem(last=False)
+            self._cache_stats['evictions'] += 1
+    
+    def encode_strategies(self, strategies: List[List[Tuple[int, str]]]) -> np.ndarray:
+        """
+        Converte uma lista de estratégias para o formato de lote
+        (ver CompiledRaceModel.encode_strategies).
+        
+        Args:
+            strategies: Lista de estratégias (listas de tuplas (volta_parada, composto_novo))
+            
+        Returns:
+            Array (n, max_paradas, 2) com voltas de parada e ids de composto
+        """
+        return self.compile().encode_strategies(strategies)
+    
+    def evaluate_strategies(self, batch) -> np.ndarray:
+        """
+        Avalia um lote de estratégias com operações vetorizadas.
+        
+        O resultado é idêntico (bit a bit) a chamar evaluate_strategy para cada
+        estratégia no mesmo modo de avaliação: as contribuições de voltas (ou
+        stints) e pit stops são acumuladas na mesma ordem do caminho escalar.
+        
+        Com o cache ativo e uma lista de estratégias, apenas as estratégias
+        ausentes do cache (sem repetições) são simuladas.
+        
+        Args:
+            batch: Array (n, max_paradas, 2) de encode_strategies ou lista de estratégias
+            
+        Returns:
+            Array (n,) com o tempo total de cada estratégia
+        """
+        self.refresh_model()
+        
+        if isinstance(batch, np.ndarray):
+            return self._model.evaluate_strategies(batch)
+        if self.cache_size <= 0:
+            return self._model.evaluate_strategies(self.encode_strategies(batch))
+        
+        total_times = np.empty(len(batch))
+        pending = {}
+        
+        for index, strategy in enumerate(batch):
+            key = self._canonical_strategy(strategy)
+            if key in pending:
+                # Repetida no mesmo lote: será simulada uma única vez
+                self._cache_stats['hits'] += 1
+                pending[key].append(index)
+                continue
+            
+            cached = self._cache_lookup(key)
+            if cached is None:
+                pending[key] = [index]
+            else:
+                total_times[index] = cached
+        
+        if pending:
+            keys = list(pending)
+            new_times = self._model.evaluate_strategies(self.encode_strategies(keys))
+            for key, total_time in zip(keys, new_times.tolist()):
+                self._cache_store(key, total_time)
+                total_times[pending[key]] = total_time
+        
+        return total_times
+    
+    def evaluate_strategy(self, strategy: List[Tuple[int, str]]) -> float:
+        """
+        Avalia uma estratégia de pit stop (consultando o cache, se ativo).
+        
+        Args:
+            strategy: Lista de tuplas (volta_parada, composto_novo)
+            
+        Returns:
+            Tempo total da corrida em segundos
+        """
+        self.refresh_model()
+        
+        if self.cache_size <= 0:
+            return self._simulate_strategy(strategy)
+        
+        key = self._canonical_strategy(strategy)
+        total_time = self._cache_lookup(key)
+        
+        if total_time is None:
+            total_time = self._simulate_strategy(strategy)
+            self._cache_store(key, total_time)
+        
+        return total_time
+    
+    def _simulate_strategy(self, strategy: List[Tuple[int, str]]) -> float:
+        """
+        Simula uma estratégia de pit stop no modelo compilado, sem passar pelo cache.
+        
+        Args:
+            strategy: Lista de tuplas (volta_parada, composto_novo)
+            
+        Returns:
+            Tempo total da corrida em segundos
+        """
+        return self._model.evaluate_strategy(strategy)
     
     def _calculate_lap_time(self, lap_number: int, compound: str, tyre_age: int) -> float:
         """
@@ -226,19 +534,7 @@ class RaceSimulator:
         Returns:
             Tempo da volta em segundos
         """
-        # Usar valores padrão se o composto não estiver nos dados
-        degradation_coeff = self.degradation_coeffs.get(compound, 0.05)
-        alpha_coeff = self.alpha_coeffs.get(compound, 0.0)
-        
-        # Fórmula do modelo
-        lap_time = (
-            self.T_base + 
-            alpha_coeff + 
-            (degradation_coeff * tyre_age) - 
-            (self.fuel_effect_coeff * lap_number)
-        )
-        
-        return max(lap_time, 60.0)  # Tempo mínimo de 60s
+        return self.compile().calculate_lap_time(lap_number, compound, tyre_age)
     
     def _simulate_no_pit_strategy(self, compound: str) -> float:
         """
@@ -271,5 +567,7 @@ class RaceSimulator:
             'degradation_coeffs': self.degradation_coeffs,
             'alpha_coeffs': self.alpha_coeffs,
             'pit_stop_time': self.pit_stop_time,
-            'total_laps': self.total_laps
+            'total_laps': self.total_laps,
+            'evaluation_mode': self.evaluation_mode,
+            'lap_time_table_bytes': self._model.table_bytes
         } 
\ No newline at end of file
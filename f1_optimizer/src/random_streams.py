@@ -0,0 +1,46 @@
+import numpy as np
+from typing import List, Union
+
+
+def as_seed_sequence(seed: Union[None, int, np.random.SeedSequence, np.random.Generator] = None) -> np.random.SeedSequence:
+    """
+    Converte uma semente na raiz (SeedSequence) dos fluxos aleatórios derivados.
+    
+    Args:
+        seed: Semente inteira, SeedSequence, np.random.Generator (uma semente
+            é sorteada dele) ou None (entropia do sistema)
+    
+    Returns:
+        SeedSequence raiz
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    if isinstance(seed, np.random.Generator):
+        return np.random.SeedSequence(int(seed.integers(2 ** 63)))
+    return np.random.SeedSequence(seed)
+
+
+def spawn_seeds(seed: Union[None, int, np.random.SeedSequence, np.random.Generator],
+                n: int, *key: int) -> List[np.random.SeedSequence]:
+    """
+    Sementes de n fluxos aleatórios independentes derivados de uma raiz.
+    
+    O i-ésimo fluxo depende apenas da raiz, da chave e de i (não da ordem em
+    que os fluxos são criados nem do número de processos), de modo que cada
+    execução de um estudo é reproduzível isoladamente.
+    
+    Args:
+        seed: Raiz (ver as_seed_sequence)
+        n: Número de fluxos
+        *key: Inteiros que distinguem grupos de fluxos da mesma raiz (ex.:
+            algoritmo ou configuração)
+    
+    Returns:
+        Lista de SeedSequence (aceitas por np.random.default_rng e pelos
+        otimizadores)
+    """
+    root = as_seed_sequence(seed)
+    return [
+        np.random.SeedSequence(root.entropy, spawn_key=root.spawn_key + tuple(key) + (i,))
+        for i in range(n)
+    ]
\ No newline at end of file
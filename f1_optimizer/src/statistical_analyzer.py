@@ -1,13 +1,15 @@
 import numpy as np
-import pandas as pd
 import json
 import time
-from typing import Dict, List, Tuple, Any
-from scipy import stats
+from typing import Dict, List, Tuple, Any, Optional, Union
 from .data_handler import DataHandler
 from .race_simulator import RaceSimulator
-from .genetic_algorithm import GeneticAlgorithm
+from .genetic_algorithm import create_genetic_algorithm
 from .ant_colony import AntColonyOptimizer
+from .dynamic_programming import DynamicProgrammingSolver
+from .parallel_evaluation import ParallelEvaluator
+from .stopping_criteria import StoppingCriteria
+from .random_streams import as_seed_sequence, spawn_seeds
 
 
 class StatisticalAnalyzer:
@@ -15,10 +17,29 @@ class StatisticalAnalyzer:
     Classe para análise estatística robusta dos algoritmos GA e ACO.
     """
     
-    def __init__(self):
+    # Chave dos fluxos aleatórios de cada algoritmo (derivados da mesma semente)
+    ALGORITHM_KEYS = {'GA': 0, 'ACO': 1}
+    
+    def __init__(self, engine: str = 'object', n_workers: int = 1,
+                 stopping_criteria: Optional[StoppingCriteria] = None,
+                 seed: Union[None, int, np.random.SeedSequence] = None):
         """
         Inicializa o analisador estatístico.
+        
+        Args:
+            engine: Motor do GA ('object', 'array', 'island' ou 'steady_state')
+            n_workers: Processos para avaliar as gerações/iterações em paralelo
+                (1 avalia no próprio processo)
+            stopping_criteria: Critérios de parada antecipada aplicados a
+                todas as execuções (None executa o orçamento completo)
+            seed: Semente do estudo. Cada execução usa um fluxo aleatório
+                independente derivado dela, de modo que o estudo é
+                reproduzível com qualquer número de processos
         """
+        self.engine = engine
+        self.n_workers = n_workers
+        self.stopping_criteria = stopping_criteria
+        self.seed_sequence = as_seed_sequence(seed)
         self.results = {}
         self.statistical_tests = {}
     
@@ -53,6 +74,21 @@ class StatisticalAnalyzer:
         # Criar simulador
         simulator = RaceSimulator(race_data)
         
+        # Ótimo exato do cenário (referência para o gap de otimalidade), na
+        # mesma janela de paradas que o GA e o ACO exploram
+        min_pit_lap, max_pit_lap = simulator.compile().pit_window()
+        dp_solver = DynamicProgrammingSolver(simulator, min_pit_lap=min_pit_lap, max_pit_lap=max_pit_lap)
+        optimal_solution = dp_solver.run()
+        print(f"🎯 Ótimo (DP): {optimal_solution.total_time:.2f}s em {dp_solver.solve_time:.3f}s")
+        
+        # Avaliador paralelo compartilhado pelas execuções (um pool por cenário)
+        executor = ParallelEvaluator(simulator, self.n_workers) if self.n_workers > 1 else None
+        
+        # Fluxos aleatórios independentes, um por execução
+        if algorithm_type not in self.ALGORITHM_KEYS:
+            raise ValueError(f"Algoritmo não suportado: {algorithm_type}")
+        seeds = spawn_seeds(self.seed_sequence, n_executions, self.ALGORITHM_KEYS[algorithm_type])
+        
         # Lista para armazenar resultados
         execution_results = []
         
@@ -63,7 +99,10 @@ class StatisticalAnalyzer:
             
             try:
                 if algorithm_type == 'GA':
-                    algorithm = GeneticAlgorithm(simulator, **params)
+                    algorithm = create_genetic_algorithm(
+                        simulator, self.engine, executor=executor,
+                        stopping_criteria=self.stopping_criteria, seed=seeds[execution], **params
+                    )
                     best_individual = algorithm.run()
                     execution_time = time.time() - start_time
                     
@@ -77,8 +116,15 @@ class StatisticalAnalyzer:
                         'final_fitness': best_individual.fitness
                     }
                     
+                    # Parcela da melhora obtida pela busca local (GA memético)
+                    if getattr(algorithm, 'local_search_size', 0) > 0:
+                        result['local_search_share'] = algorithm.get_local_search_stats()['local_share']
+                    
                 elif algorithm_type == 'ACO':
-                    algorithm = AntColonyOptimizer(simulator, **params)
+                    algorithm = AntColonyOptimizer(
+                        simulator, executor=executor, stopping_criteria=self.stopping_criteria,
+                        seed=seeds[execution], **params
+                    )
                     best_ant = algorithm.run()
                     execution_time = time.time() - start_time
                     
@@ -95,6 +141,15 @@ class StatisticalAnalyzer:
                 else:
                     raise ValueError(f"Algoritmo não suportado: {algorithm_type}")
                 
+                result['optimality_gap'] = dp_solver.optimality_gap(result['best_time'])
+                
+                # Avaliações consumidas e avaliações até o melhor fitness
+                convergence_index = int(np.argmax(algorithm.get_fitness_history()))
+                result['stop_reason'] = algorithm.stop_reason
+                result['evaluations'] = algorithm.evaluations
+                result['evaluations_to_convergence'] = algorithm.evaluation_history[convergence_index]
+                if algorithm.parallel_stats is not None:
+                    result['parallel_efficiency'] = algorithm.parallel_stats['efficiency']
                 execution_results.append(result)
                 
             except Exception as e:
@@ -107,15 +162,21 @@ class StatisticalAnalyzer:
                     'error': str(e)
                 })
         
+        if executor is not None:
+            executor.close()
+        
         # Calcular estatísticas
         statistics = self._calculate_statistics(execution_results, algorithm_type)
+        statistics['optimal_time'] = optimal_solution.total_time
+        statistics['optimal_strategy'] = optimal_solution.strategy
         
         # Armazenar resultados
         self.results[algorithm_type] = {
             'execution_results': execution_results,
             'statistics': statistics,
             'params': params,
-            'scenario': scenario
+            'scenario': scenario,
+            'seed_entropy': self.seed_sequence.entropy
         }
         
         print(f"✅ {algorithm_type} concluído! Tempo médio: {statistics['mean_time']:.2f}s")
@@ -171,16 +232,38 @@ class StatisticalAnalyzer:
             'unique_strategies': len(set(str(s) for s in strategies))
         })
         
+        # Distância até o ótimo exato (quando disponível)
+        gaps = [r['optimality_gap'] for r in valid_results if 'optimality_gap' in r]
+        if gaps:
+            statistics['mean_optimality_gap'] = np.mean(gaps)
+            statistics['std_optimality_gap'] = np.std(gaps)
+            statistics['min_optimality_gap'] = np.min(gaps)
+        
         # Análise de convergência
         if algorithm_type == 'GA':
             convergence_gens = [r['convergence_generation'] for r in valid_results]
             statistics['mean_convergence_gen'] = np.mean(convergence_gens)
             statistics['std_convergence_gen'] = np.std(convergence_gens)
+            
+            local_shares = [r['local_search_share'] for r in valid_results if 'local_search_share' in r]
+            if local_shares:
+                statistics['mean_local_search_share'] = np.mean(local_shares)
         else:  # ACO
             convergence_iters = [r['convergence_iteration'] for r in valid_results]
             statistics['mean_convergence_iter'] = np.mean(convergence_iters)
             statistics['std_convergence_iter'] = np.std(convergence_iters)
         
+        # Custo em avaliações (comparável entre GA e ACO) e motivos de parada
+        evaluations = [r['evaluations'] for r in valid_results]
+        evaluations_to_convergence = [r['evaluations_to_convergence'] for r in valid_results]
+        stop_reasons = [r['stop_reason'] for r in valid_results]
+        statistics.update({
+            'mean_evaluations': np.mean(evaluations),
+            'mean_evaluations_to_convergence': np.mean(evaluations_to_convergence),
+            'std_evaluations_to_convergence': np.std(evaluations_to_convergence),
+            'stop_reasons': {reason: stop_reasons.count(reason) for reason in sorted(set(stop_reasons))}
+        })
+        
         return statistics
     
     def perform_statistical_tests(self, ga_results: Dict, aco_results: Dict) -> Dict:
@@ -203,6 +286,9 @@ class StatisticalAnalyzer:
         if not ga_times or not aco_times:
             return {'error': 'Dados insuficientes para testes estatísticos'}
         
+        # SciPy é carregado apenas quando os testes são executados
+        from scipy import stats
+        
         # Teste de normalidade (Shapiro-Wilk)
         ga_normal = stats.shapiro(ga_times)
         aco_normal = stats.shapiro(aco_times)
@@ -329,12 +415,16 @@ class StatisticalAnalyzer:
                 'ga_performance': {
                     'mean_time': ga_stats['mean_time'],
                     'std_time': ga_stats['std_time'],
-                    'cv_time': ga_stats['cv_time']
+                    'cv_time': ga_stats['cv_time'],
+                    'mean_optimality_gap': ga_stats.get('mean_optimality_gap'),
+                    'mean_evaluations_to_convergence': ga_stats.get('mean_evaluations_to_convergence')
                 },
                 'aco_performance': {
                     'mean_time': aco_stats['mean_time'],
                     'std_time': aco_stats['std_time'],
-                    'cv_time': aco_stats['cv_time']
+                    'cv_time': aco_stats['cv_time'],
+                    'mean_optimality_gap': aco_stats.get('mean_optimality_gap'),
+                    'mean_evaluations_to_convergence': aco_stats.get('mean_evaluations_to_convergence')
                 }
             }
         
@@ -395,7 +485,10 @@ class StatisticalAnalyzer:
 
 
 def run_statistical_study(scenario: Dict, ga_params: Dict, aco_params: Dict, 
-                         n_executions: int = 30) -> Dict:
+                         n_executions: int = 30, engine: str = 'object',
+                         n_workers: int = 1,
+                         stopping_criteria: Optional[StoppingCriteria] = None,
+                         seed: Optional[int] = None) -> Dict:
     """
     Executa estudo estatístico completo.
     
@@ -404,13 +497,17 @@ def run_statistical_study(scenario: Dict, ga_params: Dict, aco_params: Dict,
         ga_params: Parâmetros otimizados do GA
         aco_params: Parâmetros otimizados do ACO
         n_executions: Número de execuções por algoritmo
-        
+        engine: Motor do GA ('object', 'array', 'island' ou 'steady_state')
+        n_workers: Processos para avaliação paralela (1 avalia no próprio processo)
+        stopping_criteria: Critérios de parada antecipada (None executa o orçamento completo)
+        seed: Semente do estudo (None usa entropia do sistema)
+    
     Returns:
         Dicionário com resultados do estudo
     """
     print("📊 Iniciando estudo estatístico completo...")
     
-    analyzer = StatisticalAnalyzer()
+    analyzer = StatisticalAnalyzer(engine, n_workers, stopping_criteria, seed)
     
     # Executar GA múltiplas vezes
     print("\n🔬 Executando Algoritmo Genético...")
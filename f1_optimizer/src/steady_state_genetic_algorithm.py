@@ -0,0 +1,279 @@
+import heapq
+import itertools
+import numpy as np
+from collections import deque
+from concurrent.futures import Future
+from typing import List, Optional, Union, TYPE_CHECKING
+from .race_simulator import RaceSimulator
+from .genetic_algorithm import GeneticAlgorithm, Individual
+from .stopping_criteria import StoppingCriteria
+
+if TYPE_CHECKING:
+    from .parallel_evaluation import ParallelEvaluator
+
+
+class SteadyStateGeneticAlgorithm(GeneticAlgorithm):
+    """
+    Algoritmo Genético steady-state (substituição incremental).
+    
+    Em vez de reconstruir a população a cada geração, cada lote de filhos
+    (batch_size) é avaliado e inserido assim que fica pronto, substituindo os
+    piores indivíduos quando é melhor que eles. A população é mantida em um
+    heap de mínimo por fitness: a consulta ao pior é O(1) e a substituição
+    O(log n). Filhos com cromossomo já presente na população são descartados.
+    
+    Com um ParallelEvaluator, até max_in_flight lotes ficam em avaliação ao
+    mesmo tempo e um novo lote é gerado a partir da população corrente sempre
+    que o lote mais antigo é inserido (sem barreira por geração). Os lotes são
+    inseridos na ordem de envio, não na ordem em que os processos terminam:
+    com a mesma semente e o mesmo max_in_flight o resultado é o mesmo para
+    qualquer número de processos.
+    
+    Para comparação com o GA geracional, uma "geração" corresponde a
+    population_size - elitism_size filhos avaliados: o orçamento total é o
+    mesmo e fitness_history/evaluation_history têm um ponto por geração. O
+    elitismo é implícito (os melhores nunca são os substituídos).
+    """
+    
+    def __init__(self, simulator: RaceSimulator,
+                 population_size: int = 50,
+                 generations: int = 100,
+                 mutation_rate: float = 0.1,
+                 crossover_rate: float = 0.8,
+                 elitism_size: int = 5,
+                 batch_size: int = 2,
+                 max_in_flight: Optional[int] = None,
+                 executor: Optional['ParallelEvaluator'] = None,
+                 stopping_criteria: Optional[StoppingCriteria] = None,
+                 seed: Union[None, int, np.random.SeedSequence, np.random.Generator] = None):
+        """
+        Inicializa o GA steady-state.
+        
+        Args:
+            simulator: Instância do simulador de corrida
+            population_size: Tamanho da população
+            generations: Número de gerações equivalentes (orçamento de filhos)
+            mutation_rate: Taxa de mutação
+            crossover_rate: Taxa de crossover
+            elitism_size: Define o tamanho da geração equivalente
+                (population_size - elitism_size filhos)
+            batch_size: Filhos gerados e avaliados por lote
+            max_in_flight: Lotes em avaliação simultânea com executor
+                (padrão: 2 por processo; faz parte da configuração reproduzível)
+            executor: Avaliador paralelo opcional (ParallelEvaluator), usado de
+                forma assíncrona
+            stopping_criteria: Critérios de parada antecipada, verificados a
+                cada geração equivalente
+            seed: Semente, SeedSequence ou np.random.Generator do fluxo
+                aleatório próprio da execução
+        """
+        super().__init__(simulator, population_size, generations, mutation_rate,
+                         crossover_rate, elitism_size, executor, stopping_criteria, seed=seed)
+        self.batch_size = max(1, batch_size)
+        self.max_in_flight = max_in_flight
+        
+        # Heap de mínimo (fitness, ordem de inserção, indivíduo) e contagem de cromossomos
+        self._heap = []
+        self._members = {}
+        self._counter = itertools.count()
+        
+        # Cromossomos enviados para avaliação cujo lote ainda não foi inserido
+        self._in_flight = set()
+        
+        # Contadores da geração equivalente em andamento
+        self._generation_stats = {'individuals': 0, 'unique': 0, 'evaluated': 0}
+    
+    def _push(self, individual: Individual):
+        """
+        Insere um indivíduo no heap sem substituir ninguém.
+        """
+        heapq.heappush(self._heap, (individual.fitness, next(self._counter), individual))
+        self._members[individual.chromosome] = self._members.get(individual.chromosome, 0) + 1
+    
+    def insert(self, individual: Individual) -> bool:
+        """
+        Insere um filho avaliado, substituindo o pior indivíduo se for melhor.
+        
+        Args:
+            individual: Filho com fitness calculado
+        
+        Returns:
+            True se o filho entrou na população
+        """
+        if individual.chromosome in self._members:
+            return False
+        
+        if len(self._heap) < self.population_size:
+            self._push(individual)
+        elif individual.fitness > self._heap[0][0]:
+            _, _, worst = heapq.heapreplace(
+                self._heap, (individual.fitness, next(self._counter), individual)
+            )
+            self._members[worst.chromosome] -= 1
+            if not self._members[worst.chromosome]:
+                del self._members[worst.chromosome]
+            self._members[individual.chromosome] = 1
+        else:
+            return False
+        
+        if self.best_individual is None or individual.fitness > self.best_individual.fitness:
+            self.best_individual = individual
+        return True
+    
+    def _select(self, n_parents: int, tournament_size: int = 3) -> List[Individual]:
+        """
+        Seleção por torneio diretamente sobre o heap (torneios sorteados em lote).
+        """
+        fitness = np.array([entry[0] for entry in self._heap])
+        indices = self._tournament_indices(len(self._heap), n_parents, tournament_size)
+        winners = indices[np.arange(n_parents), np.argmax(fitness[indices], axis=1)]
+        return [self._heap[i][2] for i in winners.tolist()]
+    
+    def breed(self, n_children: int) -> List[Individual]:
+        """
+        Gera filhos a partir da população corrente (seleção, crossover e mutação).
+        
+        Args:
+            n_children: Número de filhos
+        
+        Returns:
+            Lista de filhos ainda não avaliados
+        """
+        n_pairs = -(-n_children // 2)
+        parents = self._select(2 * n_pairs)
+        crossover_draws = self.rng.random((n_pairs, 2))
+        mutation_draws = self.rng.random((2 * n_pairs, 5))
+        
+        children = []
+        for pair in range(n_pairs):
+            child1, child2 = self.crossover(parents[2 * pair], parents[2 * pair + 1], crossover_draws[pair])
+            children.extend([self.mutate(child1, mutation_draws[2 * pair]),
+                             self.mutate(child2, mutation_draws[2 * pair + 1])])
+        return children[:n_children]
+    
+    def _pending(self, children: List[Individual]) -> List:
+        """
+        Cromossomos únicos dos filhos que ainda não estão no cache de fitness
+        nem em avaliação em um lote anterior (marcados como em avaliação).
+        
+        Um filho cujo cromossomo está em um lote anterior recebe o fitness do
+        cache ao ser inserido: os lotes são concluídos na ordem de envio.
+        """
+        pending = list({child.chromosome for child in children
+                        if child.chromosome not in self._fitness_cache and child.chromosome not in self._in_flight})
+        self._in_flight.update(pending)
+        return pending
+    
+    def _complete(self, children: List[Individual], pending: List, total_times: Optional[np.ndarray]) -> int:
+        """
+        Registra os tempos avaliados no cache e insere os filhos na população.
+        
+        Returns:
+            Número de filhos concluídos
+        """
+        if pending:
+            for chromosome, total_time in zip(pending, total_times.tolist()):
+                self._fitness_cache[chromosome] = self._fitness_from_time(chromosome, total_time)
+            self._in_flight.difference_update(pending)
+        
+        for child in children:
+            child.fitness = self._fitness_cache.get(child.chromosome, 0.0)
+            self.insert(child)
+        
+        self._generation_stats['individuals'] += len(children)
+        self._generation_stats['unique'] += len({child.chromosome for child in children})
+        self._generation_stats['evaluated'] += len(pending)
+        return len(children)
+    
+    def run(self) -> Individual:
+        """
+        Executa o GA steady-state.
+        
+        Returns:
+            Melhor indivíduo encontrado
+        """
+        if self.stopping_criteria is not None:
+            self.stopping_criteria.start()
+        self.initialize()
+        self.stop_reason = 'generations'
+        
+        self._heap = []
+        self._members = {}
+        for individual in self.population:
+            self._push(individual)
+        self.update_best()
+        
+        children_per_generation = max(1, self.population_size - self.elitism_size)
+        total_children = self.generations * children_per_generation
+        if self.executor is None:
+            max_in_flight = 1
+        else:
+            max_in_flight = self.max_in_flight or 2 * self.executor.max_workers
+        
+        produced = 0
+        completed = 0
+        generation = 0
+        in_flight = deque()
+        self._in_flight = set()
+        self._generation_stats = {'individuals': 0, 'unique': 0, 'evaluated': 0}
+        
+        while produced < total_children or in_flight:
+            # Gerar novos lotes enquanto houver orçamento e espaço na fila
+            while produced < total_children and self.stop_reason == 'generations' and \
+                    len(in_flight) < max_in_flight:
+                children = self.breed(min(self.batch_size, total_children - produced))
+                produced += len(children)
+                pending = self._pending(children)
+                
+                if self.executor is not None and pending:
+                    future = self.executor.submit_strategies(pending)
+                else:
+                    future = Future()
+                    future.set_result(self.simulator.evaluate_strategies(pending) if pending else None)
+                in_flight.append((future, children, pending))
+            
+            # Inserir o lote mais antigo (ordem de envio, independente de qual
+            # processo termina primeiro, para que a execução seja reproduzível)
+            if in_flight:
+                future, children, pending = in_flight.popleft()
+                completed += self._complete(children, pending, future.result())
+            
+            # Registrar cada geração equivalente concluída
+            while completed >= (generation + 1) * children_per_generation:
+                self._record_generation(generation)
+                generation += 1
+                
+                reason = self.check_stopping_criteria()
+                if reason is not None and self.stop_reason == 'generations':
+                    self.stop_reason = reason
+                    print(f"⏹️ Parada antecipada na geração {generation - 1} ({reason}): "
+                          f"{self.evaluations} avaliações")
+            
+            if self.stop_reason != 'generations' and not in_flight:
+                break
+        
+        self.population = self.get_population()
+        self._finish_parallel_stats()
+        return self.best_individual
+    
+    def _record_generation(self, generation: int):
+        """
+        Registra estatísticas e histórico de uma geração equivalente.
+        """
+        self._record_evaluations(generation, self._generation_stats)
+        self._generation_stats = {'individuals': 0, 'unique': 0, 'evaluated': 0}
+        
+        best_fitness = self.best_individual.fitness
+        self.fitness_history.append(best_fitness)
+        
+        if generation % 10 == 0:
+            print(f"Geração {generation}: Melhor fitness = {best_fitness:.6f}")
+    
+    def get_population(self) -> List[Individual]:
+        """
+        Retorna a população corrente em ordem decrescente de fitness.
+        
+        Returns:
+            Lista de indivíduos
+        """
+        return [entry[2] for entry in sorted(self._heap, key=lambda entry: entry[0], reverse=True)]
\ No newline at end of file
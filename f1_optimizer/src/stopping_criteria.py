@@ -0,0 +1,79 @@
+import time
+from typing import List, Optional
+
+
+class StoppingCriteria:
+    """
+    Critérios de parada antecipada compartilhados pelo GA e pelo ACO.
+    
+    Todos os critérios são opcionais e o primeiro satisfeito encerra a
+    execução:
+    - estagnação: o melhor fitness não melhorou mais que min_improvement
+      (relativo) nas últimas stagnation_window gerações/iterações;
+    - prazo: time_limit segundos de tempo de parede desde start();
+    - orçamento: max_evaluations estratégias avaliadas pelo simulador.
+    """
+    
+    def __init__(self, stagnation_window: Optional[int] = None,
+                 min_improvement: float = 0.0,
+                 time_limit: Optional[float] = None,
+                 max_evaluations: Optional[int] = None):
+        """
+        Inicializa os critérios de parada.
+        
+        Args:
+            stagnation_window: Gerações/iterações sem melhora para encerrar
+                (None desativa)
+            min_improvement: Melhora relativa mínima do melhor fitness na
+                janela para não ser considerada estagnação
+            time_limit: Tempo de parede máximo em segundos (None desativa)
+            max_evaluations: Número máximo de avaliações (None desativa)
+        """
+        self.stagnation_window = stagnation_window
+        self.min_improvement = min_improvement
+        self.time_limit = time_limit
+        self.max_evaluations = max_evaluations
+        self._start_time = None
+    
+    def start(self):
+        """
+        Marca o início de uma execução (referência para time_limit).
+        """
+        self._start_time = time.perf_counter()
+    
+    def elapsed(self) -> float:
+        """
+        Segundos desde start().
+        """
+        return time.perf_counter() - self._start_time if self._start_time is not None else 0.0
+    
+    def check(self, fitness_history: List[float], evaluations: int) -> Optional[str]:
+        """
+        Verifica se a execução deve ser encerrada.
+        
+        Args:
+            fitness_history: Melhor fitness de cada geração/iteração até agora
+            evaluations: Avaliações consumidas até agora
+        
+        Returns:
+            Motivo da parada ('stagnation', 'time_limit' ou 'max_evaluations')
+            ou None para continuar
+        """
+        if self.max_evaluations is not None and evaluations >= self.max_evaluations:
+            return 'max_evaluations'
+        
+        if self.time_limit is not None and self.elapsed() >= self.time_limit:
+            return 'time_limit'
+        
+        if self.stagnation_window and len(fitness_history) > self.stagnation_window:
+            best_before = max(fitness_history[:-self.stagnation_window])
+            best_now = max(best_before, max(fitness_history[-self.stagnation_window:]))
+            if best_now - best_before <= self.min_improvement * abs(best_before):
+                return 'stagnation'
+        
+        return None
+    
+    def __repr__(self):
+        return (f"StoppingCriteria(stagnation_window={self.stagnation_window}, "
+                f"min_improvement={self.min_improvement}, time_limit={self.time_limit}, "
+                f"max_evaluations={self.max_evaluations})")
\ No newline at end of file
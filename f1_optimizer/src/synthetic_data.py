@@ -0,0 +1,194 @@
+import zlib
+import numpy as np
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, TYPE_CHECKING
+from .model_fitting import FUEL_EFFECT_COEFF
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Delta de ritmo (s) e degradação (s/volta) padrão de cada composto
+DEFAULT_PACE_OFFSETS = {'SOFT': -0.8, 'MEDIUM': -0.3, 'HARD': 0.0}
+DEFAULT_DEGRADATION = {'SOFT': 0.09, 'MEDIUM': 0.05, 'HARD': 0.03}
+
+# Códigos de piloto usados quando apenas o número de pilotos é informado
+DEFAULT_DRIVERS = [
+    'VER', 'PER', 'HAM', 'RUS', 'LEC', 'SAI', 'NOR', 'PIA', 'ALO', 'STR',
+    'GAS', 'OCO', 'ALB', 'SAR', 'TSU', 'RIC', 'BOT', 'ZHO', 'HUL', 'MAG'
+]
+
+
+class SyntheticRaceSource:
+    """
+    Fonte de dados sintética, usada no lugar do FastF1 sem acesso à rede.
+    
+    Gera as voltas de uma sessão com as mesmas colunas das voltas do FastF1
+    usadas pelo pré-processamento e pelo simulador (Driver, LapNumber, Stint,
+    TyreLife, Compound, LapTime e IsAccurate). O tempo de volta segue o
+    modelo do simulador (ritmo do composto, degradação linear e efeito do
+    combustível) com ruído gaussiano; voltas de safety car, de entrada e de
+    saída dos boxes e a primeira volta são marcadas como imprecisas.
+    
+    Cada corrida é determinística para (seed, ano, nome da corrida).
+    """
+    
+    def __init__(self, total_laps: int = 66,
+                 drivers: Optional[Sequence[str]] = None,
+                 n_drivers: int = 20,
+                 compounds: Optional[Sequence[str]] = None,
+                 degradation: Optional[Dict[str, float]] = None,
+                 pace_offsets: Optional[Dict[str, float]] = None,
+                 base_lap_time: float = 80.0,
+                 driver_pace_std: float = 0.3,
+                 noise_std: float = 0.25,
+                 fuel_effect_coeff: float = FUEL_EFFECT_COEFF,
+                 sc_laps: Optional[Sequence[int]] = None,
+                 sc_slowdown: float = 1.4,
+                 max_stops: int = 2,
+                 seed: int = 42):
+        """
+        Inicializa a fonte sintética.
+        
+        Args:
+            total_laps: Número de voltas da corrida
+            drivers: Códigos dos pilotos (padrão: os n_drivers primeiros de DEFAULT_DRIVERS)
+            n_drivers: Número de pilotos quando drivers não é informado
+            compounds: Compostos disponíveis (padrão: SOFT, MEDIUM e HARD)
+            degradation: Degradação de cada composto em s/volta
+            pace_offsets: Delta de ritmo de cada composto em segundos
+            base_lap_time: Tempo de volta de referência (HARD, pneu novo, sem combustível)
+            driver_pace_std: Desvio padrão do ritmo entre pilotos (s)
+            noise_std: Desvio padrão do ruído de cada volta (s)
+            fuel_effect_coeff: Efeito do combustível em segundos por volta
+            sc_laps: Voltas sob safety car (imprecisas e mais lentas)
+            sc_slowdown: Fator aplicado ao tempo de volta sob safety car
+            max_stops: Número máximo de paradas de cada piloto (mínimo 1)
+            seed: Semente base do gerador
+        """
+        self.total_laps = total_laps
+        self.drivers = list(drivers) if drivers is not None else DEFAULT_DRIVERS[:n_drivers]
+        self.compounds = list(compounds) if compounds is not None else list(DEFAULT_PACE_OFFSETS)
+        
+        if len(self.compounds) < 2:
+            raise ValueError("São necessários pelo menos dois compostos")
+        
+        degradation = {**DEFAULT_DEGRADATION, **(degradation or {})}
+        pace_offsets = {**DEFAULT_PACE_OFFSETS, **(pace_offsets or {})}
+        self.degradation = np.array([degradation.get(c, 0.05) for c in self.compounds])
+        self.pace_offsets = np.array([pace_offsets.get(c, 0.0) for c in self.compounds])
+        
+        self.base_lap_time = base_lap_time
+        self.driver_pace_std = driver_pace_std
+        self.noise_std = noise_std
+        self.fuel_effect_coeff = fuel_effect_coeff
+        self.sc_laps = np.asarray(sorted(sc_laps or []), dtype=np.int64)
+        self.sc_slowdown = sc_slowdown
+        self.max_stops = max(1, max_stops)
+        self.seed = seed
+    
+    def _rng(self, year: int, race_name: str) -> np.random.Generator:
+        """
+        Gerador determinístico de uma corrida (independente da ordem das chamadas).
+        """
+        return np.random.default_rng([self.seed, year, zlib.crc32(race_name.encode('utf-8'))])
+    
+    def _stint_plans(self, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sorteia a estratégia de cada piloto.
+        
+        Returns:
+            Tupla (voltas de parada, compostos de cada stint), ambos com
+            max_stops (+1) colunas; paradas não usadas valem total_laps
+        """
+        n_drivers = len(self.drivers)
+        T = self.total_laps
+        
+        n_stops = rng.integers(1, self.max_stops + 1, size=n_drivers)
+        pit_laps = np.sort(rng.integers(min(8, T - 1), max(T - 8, 9), size=(n_drivers, self.max_stops)), axis=1)
+        pit_laps = np.minimum(pit_laps, T - 1)
+        unused = np.arange(self.max_stops)[None, :] >= n_stops[:, None]
+        pit_laps[unused] = T
+        
+        # Compostos de cada stint, com pelo menos dois compostos diferentes por piloto
+        stint_compounds = rng.integers(0, len(self.compounds), size=(n_drivers, self.max_stops + 1))
+        first = stint_compounds[:, 0]
+        used = np.arange(self.max_stops + 1)[None, :] <= n_stops[:, None]
+        all_same = np.flatnonzero(np.all((stint_compounds == first[:, None]) | ~used, axis=1))
+        shift = rng.integers(1, len(self.compounds), size=len(all_same))
+        stint_compounds[all_same, n_stops[all_same]] = (first[all_same] + shift) % len(self.compounds)
+        
+        return pit_laps, stint_compounds
+    
+    def get_session_laps(self, year: int, race_name: str) -> 'pd.DataFrame':
+        """
+        Gera as voltas brutas de todos os pilotos de uma corrida.
+        
+        Args:
+            year: Ano da corrida
+            race_name: Nome da corrida
+        
+        Returns:
+            DataFrame no formato de session.laps do FastF1 (uma linha por volta e piloto)
+        """
+        import pandas as pd
+        
+        rng = self._rng(year, race_name)
+        n_drivers = len(self.drivers)
+        T = self.total_laps
+        
+        pit_laps, stint_compounds = self._stint_plans(rng)
+        laps = np.arange(1, T + 1)
+        
+        # Stint de cada volta: o pit na volta p encerra o stint (a volta p+1 é a de saída)
+        stint_index = (laps[None, :, None] > pit_laps[:, None, :]).sum(axis=2)
+        stint_starts = np.concatenate([np.ones((n_drivers, 1), dtype=np.int64), pit_laps + 1], axis=1)
+        rows = np.arange(n_drivers)[:, None]
+        tyre_life = laps[None, :] - stint_starts[rows, stint_index] + 1
+        compound_codes = stint_compounds[rows, stint_index]
+        
+        driver_pace = rng.normal(0.0, self.driver_pace_std, size=(n_drivers, 1))
+        lap_times = (
+            self.base_lap_time + driver_pace +
+            self.pace_offsets[compound_codes] +
+            self.degradation[compound_codes] * tyre_life -
+            self.fuel_effect_coeff * laps[None, :] +
+            rng.normal(0.0, self.noise_std, size=(n_drivers, T))
+        )
+        
+        # Voltas imprecisas: largada, entrada/saída dos boxes e safety car
+        in_lap = ((laps[None, :, None] == pit_laps[:, None, :]) & (pit_laps[:, None, :] < T)).any(axis=2)
+        out_lap = (tyre_life == 1) & (laps[None, :] > 1)
+        sc_lap = np.isin(laps, self.sc_laps)[None, :]
+        lap_times = np.where(sc_lap, lap_times * self.sc_slowdown, lap_times)
+        lap_times = lap_times + np.where(in_lap | out_lap, 10.0, 0.0)
+        is_accurate = ~(in_lap | out_lap | sc_lap | (laps[None, :] == 1))
+        
+        compounds = np.array(self.compounds, dtype=object)
+        return pd.DataFrame({
+            'Driver': np.repeat(np.array(self.drivers, dtype=object), T),
+            'LapNumber': np.tile(laps, n_drivers).astype(float),
+            'Stint': (stint_index + 1).ravel().astype(float),
+            'TyreLife': tyre_life.ravel().astype(float),
+            'Compound': compounds[compound_codes.ravel()],
+            'LapTime': pd.to_timedelta(lap_times.ravel(), unit='s'),
+            'IsAccurate': is_accurate.ravel()
+        })
+    
+    def iter_races(self, n_races: int, year: int = 2024) -> Iterator[Tuple[str, 'pd.DataFrame']]:
+        """
+        Gera várias corridas sintéticas.
+        
+        Args:
+            n_races: Número de corridas
+            year: Ano atribuído às corridas
+        
+        Yields:
+            Tuplas (nome da corrida, voltas brutas da sessão)
+        """
+        for race_name in self.race_names(n_races):
+            yield race_name, self.get_session_laps(year, race_name)
+    
+    def race_names(self, n_races: int) -> List[str]:
+        """
+        Nomes das corridas geradas por iter_races.
+        """
+        return [f"Synthetic Grand Prix {index + 1}" for index in range(n_races)]
\ No newline at end of file
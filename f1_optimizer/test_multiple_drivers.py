@@ -18,7 +18,8 @@ from src.genetic_algorithm import GeneticAlgorithm
 from src.ant_colony import AntColonyOptimizer
 
 
-def test_driver(year: int, race_name: str, driver_code: str, n_executions: int = 10):
+def test_driver(year: int, race_name: str, driver_code: str, n_executions: int = 10,
+                data_handler: DataHandler = None, simulator: RaceSimulator = None):
     """
     Testa um piloto específico com ambos os algoritmos.
     
@@ -27,6 +28,8 @@ def test_driver(year: int, race_name: str, driver_code: str, n_executions: int =
         race_name: Nome da corrida
         driver_code: Código do piloto
         n_executions: Número de execuções por algoritmo
+        data_handler: DataHandler compartilhado (reutiliza a sessão já carregada)
+        simulator: Simulador já criado para o piloto (ex.: via get_grid_simulators)
         
     Returns:
         Dicionário com resultados
@@ -37,8 +40,12 @@ def test_driver(year: int, race_name: str, driver_code: str, n_executions: int =
     
     # Carregar dados
     print(f"📊 Carregando dados para {driver_code}...")
-    data_handler = DataHandler()
-    race_data = data_handler.get_race_data(year, race_name, driver_code)
+    if data_handler is None:
+        data_handler = DataHandler()
+    if simulator is not None:
+        race_data = simulator.race_data
+    else:
+        race_data = data_handler.get_race_data(year, race_name, driver_code)
     
     if race_data.empty:
         print(f"❌ Erro: Não foi possível carregar dados para {driver_code}")
@@ -55,7 +62,8 @@ def test_driver(year: int, race_name: str, driver_code: str, n_executions: int =
     print(f"   Tempo médio de volta: {race_info['avg_lap_time']:.2f}s")
     
     # Criar simulador
-    simulator = RaceSimulator(race_data)
+    if simulator is None:
+        simulator = RaceSimulator(race_data)
     
     # Parâmetros otimizados (usando os encontrados para HAM)
     ga_params = {
@@ -183,12 +191,17 @@ def main():
     # Criar diretório de resultados
     os.makedirs('results', exist_ok=True)
     
+    # Carregar a sessão uma única vez e criar os simuladores de todos os pilotos
+    data_handler = DataHandler()
+    simulators = data_handler.get_grid_simulators(year, race_name, drivers)
+    
     # Testar cada piloto
     all_results = {}
     
     for driver in drivers:
         try:
-            results = test_driver(year, race_name, driver, n_executions)
+            results = test_driver(year, race_name, driver, n_executions,
+                                  data_handler=data_handler, simulator=simulators.get(driver))
             if results:
                 all_results[driver] = results
         except Exception as e:
@@ -0,0 +1,66 @@
+import contextlib
+import io
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Testes executados a partir de f1_optimizer (pytest tests/)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.race_simulator import RaceSimulator
+
+
+def make_race_data(total_laps: int = 66, seed: int = 0) -> pd.DataFrame:
+    """
+    Voltas de uma corrida fictícia com duas paradas (MEDIUM → HARD → SOFT).
+    
+    Args:
+        total_laps: Número de voltas
+        seed: Semente do ruído dos tempos de volta
+    
+    Returns:
+        DataFrame no formato usado pelo RaceSimulator
+    """
+    rng = np.random.default_rng(seed)
+    base_times = {'SOFT': 79.0, 'MEDIUM': 79.6, 'HARD': 80.2}
+    degradation = {'SOFT': 0.12, 'MEDIUM': 0.07, 'HARD': 0.03}
+    next_compound = {'MEDIUM': 'HARD', 'HARD': 'SOFT'}
+    
+    rows = []
+    compound = 'MEDIUM'
+    tyre_age = 0
+    for lap in range(1, total_laps + 1):
+        if lap in (22, 45):
+            compound = next_compound[compound]
+            tyre_age = 0
+        lap_time = base_times[compound] + degradation[compound] * tyre_age - 0.035 * lap + rng.normal(0, 0.2)
+        rows.append({
+            'LapNumber': lap,
+            'TyreLife': tyre_age + 1,
+            'Compound': compound,
+            'LapTimeSeconds': lap_time,
+            'LapTime': pd.to_timedelta(lap_time, unit='s')
+        })
+        tyre_age += 1
+    
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture(scope='session')
+def race_data():
+    """
+    Voltas da corrida fictícia (sem acesso à rede nem cache em disco).
+    """
+    return make_race_data()
+
+
+@pytest.fixture(scope='session')
+def simulator(race_data):
+    """
+    Simulador da corrida fictícia no modo de avaliação padrão.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        return RaceSimulator(race_data)
\ No newline at end of file
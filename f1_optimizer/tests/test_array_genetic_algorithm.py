@@ -0,0 +1,15 @@
+import numpy as np
+
+from src.array_genetic_algorithm import ArrayGeneticAlgorithm
+
+
+def test_tournaments_have_no_repeated_candidates(simulator):
+    """
+    Os torneios do motor em arrays não repetem participantes (como o motor de objetos).
+    """
+    ga = ArrayGeneticAlgorithm(simulator, population_size=6, seed=2)
+    fitness = np.arange(6, dtype=float)
+    
+    # Com repetição, o pior indivíduo venceria os torneios em que enfrenta só a si mesmo
+    selected = ga._select(fitness, 5000)
+    assert selected.min() >= ga.tournament_size - 1
\ No newline at end of file
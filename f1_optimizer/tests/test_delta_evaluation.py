@@ -0,0 +1,80 @@
+import contextlib
+import io
+
+import numpy as np
+import pytest
+
+from src.race_simulator import RaceSimulator
+
+
+COMPOUNDS = ('SOFT', 'MEDIUM', 'HARD')
+EDIT_KINDS = ('move', 'compound', 'add', 'remove')
+
+# Pares estratégia/edição sorteados por modo
+N_PAIRS = 1676
+
+
+def _random_strategy(rng: np.random.Generator, total_laps: int):
+    """
+    Estratégia aleatória com 1 a 4 paradas em voltas distintas.
+    """
+    n_stops = int(rng.integers(1, 5))
+    laps = np.sort(rng.choice(np.arange(1, total_laps), size=n_stops, replace=False))
+    return [(int(lap), str(rng.choice(COMPOUNDS))) for lap in laps]
+
+
+def _random_edit(rng: np.random.Generator, strategy, total_laps: int, kind: str):
+    """
+    Edição aleatória do tipo pedido sobre a estratégia canônica.
+    """
+    index = int(rng.integers(len(strategy)))
+    if kind == 'move':
+        return ('move', index, int(rng.integers(1, total_laps)))
+    if kind == 'compound':
+        return ('compound', index, str(rng.choice(COMPOUNDS)))
+    if kind == 'add':
+        return ('add', int(rng.integers(1, total_laps)), str(rng.choice(COMPOUNDS)))
+    return ('remove', index)
+
+
+def _assert_same_time(actual: float, expected: float, evaluation_mode: str):
+    """
+    Tempos idênticos nos modos por stint; no 'exact' os stints são somados
+    separadamente e podem diferir apenas no arredondamento.
+    """
+    if evaluation_mode == 'exact' and np.isfinite(expected):
+        assert actual == pytest.approx(expected, rel=0, abs=1e-9)
+    else:
+        assert actual == expected
+
+
+@pytest.mark.parametrize('evaluation_mode', ['table', 'closed_form', 'exact'])
+def test_edit_matches_full_evaluation(race_data, evaluation_mode):
+    """
+    evaluate_edit dá o mesmo tempo que a avaliação completa da estratégia
+    editada, para edições de todos os tipos.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        model = RaceSimulator(race_data, evaluation_mode=evaluation_mode).compile()
+    rng = np.random.default_rng(6)
+    total_laps = model.total_laps
+    covered = set()
+    
+    for pair in range(N_PAIRS):
+        strategy = _random_strategy(rng, total_laps)
+        breakdown = model.stint_breakdown(strategy)
+        _assert_same_time(breakdown.total_time, model.evaluate_strategy(strategy), evaluation_mode)
+        
+        kind = EDIT_KINDS[pair % len(EDIT_KINDS)]
+        if kind == 'remove' and len(breakdown.strategy) == 1:
+            kind = 'add'
+        edit = _random_edit(rng, breakdown.strategy, total_laps, kind)
+        covered.add(kind)
+        
+        edited = model.evaluate_edit(breakdown, edit)
+        expected = model.evaluate_strategy(list(model.apply_edit(breakdown.strategy, edit)))
+        
+        assert edited.strategy == model.apply_edit(breakdown.strategy, edit)
+        _assert_same_time(edited.total_time, expected, evaluation_mode)
+    
+    assert covered == set(EDIT_KINDS)
\ No newline at end of file
@@ -0,0 +1,9 @@
+import benchmark
+
+
+def test_core_import_budget():
+    """
+    O núcleo importa dentro do orçamento de tempo e sem dependências pesadas
+    (mesma verificação de `python benchmark.py imports`).
+    """
+    assert benchmark.benchmark_imports()
\ No newline at end of file
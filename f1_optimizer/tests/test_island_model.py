@@ -0,0 +1,44 @@
+import contextlib
+import io
+import pickle
+
+from src.island_model import IslandGeneticAlgorithm
+
+
+def _run(simulator, use_processes: bool):
+    """
+    Executa o modelo de ilhas com uma semente fixa.
+    """
+    ga = IslandGeneticAlgorithm(simulator, population_size=24, generations=10, n_islands=3,
+                                use_processes=use_processes, seed=5)
+    with contextlib.redirect_stdout(io.StringIO()):
+        best = ga.run()
+    return best.chromosome, best.fitness, ga.get_fitness_history()
+
+
+def test_islands_receive_only_the_compiled_model(simulator):
+    """
+    O que é enviado às ilhas não carrega o DataFrame da corrida.
+    """
+    payload = pickle.dumps(simulator.compile())
+    assert b'pandas' not in payload
+
+
+def test_processes_match_local_run(simulator):
+    """
+    Ilhas em processos e no processo principal dão o mesmo resultado.
+    """
+    assert _run(simulator, True) == _run(simulator, False)
+
+
+def test_split_keeps_single_population_budget(simulator):
+    """
+    População e elitismo das ilhas somam os totais do GA com população única.
+    """
+    for n_islands in (1, 3, 4, 7, 12):
+        ga = IslandGeneticAlgorithm(simulator, population_size=50, elitism_size=5, n_islands=n_islands)
+        populations = [params['population_size'] for params in ga.island_params]
+        elitism = [params['elitism_size'] for params in ga.island_params]
+        assert sum(populations) == 50
+        assert sum(elitism) == 5
+        assert max(populations) - min(populations) <= 1
\ No newline at end of file
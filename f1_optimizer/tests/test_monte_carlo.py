@@ -0,0 +1,55 @@
+import numpy as np
+
+from src.monte_carlo import MonteCarloSimulator
+
+
+STRATEGIES = [
+    [(20, 'HARD')],
+    [(15, 'MEDIUM'), (40, 'HARD')],
+    [(10, 'SOFT'), (30, 'MEDIUM'), (50, 'HARD')],
+    [(8, 'SOFT'), (25, 'SOFT'), (45, 'MEDIUM')]
+]
+
+
+def test_samples_do_not_depend_on_batch(simulator):
+    """
+    As corridas amostradas de uma estratégia são as mesmas sozinha ou em
+    qualquer lote (números aleatórios comuns entre estratégias).
+    
+    A tolerância cobre apenas o arredondamento do produto de matrizes, que
+    depende do número de linhas do lote.
+    """
+    monte_carlo = MonteCarloSimulator(simulator, n_samples=500, chunk_size=128, seed=7)
+    batch = monte_carlo.evaluate(STRATEGIES)
+    
+    for index, strategy in enumerate(STRATEGIES):
+        alone = monte_carlo.evaluate([strategy])
+        np.testing.assert_allclose(alone.samples[0], batch.samples[index], rtol=1e-12)
+        for name, values in alone.statistics.items():
+            np.testing.assert_allclose(values[0], batch.statistics[name][index], rtol=1e-9)
+    
+    reordered = monte_carlo.evaluate(STRATEGIES[::-1])
+    np.testing.assert_allclose(reordered.samples[::-1], batch.samples, rtol=1e-12)
+
+
+def test_samples_do_not_depend_on_chunk_size(simulator):
+    """
+    O tamanho do bloco não altera as corridas amostradas.
+    """
+    small = MonteCarloSimulator(simulator, n_samples=300, chunk_size=64, seed=3).evaluate(STRATEGIES)
+    large = MonteCarloSimulator(simulator, n_samples=300, chunk_size=1000, seed=3).evaluate(STRATEGIES)
+    np.testing.assert_allclose(small.samples, large.samples, rtol=0, atol=1e-9)
+
+
+def test_pit_noise_variance(simulator):
+    """
+    Sem neutralizações, a variância de cada estratégia é a do ruído das
+    paradas pagas (pit_time_std ** 2 por parada).
+    """
+    _, paid_counts = simulator.compile().lap_time_profiles(STRATEGIES)
+    monte_carlo = MonteCarloSimulator(simulator, n_samples=20000, sc_probability=0.0,
+                                      vsc_probability=0.0, pit_time_std=1.5, seed=1)
+    result = monte_carlo.evaluate(STRATEGIES)
+    
+    expected = 1.5 * np.sqrt(paid_counts.sum(axis=1))
+    np.testing.assert_allclose(result.statistics['std'], expected, rtol=0.05)
\ No newline at end of file
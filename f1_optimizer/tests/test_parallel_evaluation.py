@@ -0,0 +1,42 @@
+import numpy as np
+
+from src.parallel_evaluation import ParallelEvaluator
+
+
+STRATEGIES = [
+    [(20, 'HARD')],
+    [(15, 'MEDIUM'), (40, 'HARD')],
+    [(10, 'SOFT'), (30, 'MEDIUM'), (50, 'HARD')]
+]
+
+
+def test_small_submitted_batch_is_evaluated_locally(simulator):
+    """
+    Lotes assíncronos menores que min_batch_size não vão para o pool.
+    """
+    evaluator = ParallelEvaluator(simulator, max_workers=2, min_batch_size=10)
+    try:
+        future = evaluator.submit_strategies(STRATEGIES)
+        assert future.done()
+        np.testing.assert_array_equal(future.result(), simulator.evaluate_strategies(STRATEGIES))
+        
+        stats = evaluator.get_stats()
+        assert stats['local_batches'] == 1
+        assert stats['local_strategies'] == len(STRATEGIES)
+        assert stats['parallel_batches'] == 0
+        assert evaluator._executor is None
+    finally:
+        evaluator.close()
+
+
+def test_large_submitted_batch_uses_pool(simulator):
+    """
+    Lotes assíncronos a partir de min_batch_size são avaliados nos processos.
+    """
+    evaluator = ParallelEvaluator(simulator, max_workers=2, min_batch_size=3)
+    try:
+        future = evaluator.submit_strategies(STRATEGIES)
+        np.testing.assert_array_equal(future.result(), simulator.evaluate_strategies(STRATEGIES))
+        assert evaluator.get_stats()['parallel_batches'] == 1
+    finally:
+        evaluator.close()
\ No newline at end of file
@@ -0,0 +1,43 @@
+import contextlib
+import io
+
+from src.ant_colony import AntColonyOptimizer
+from src.dynamic_programming import DynamicProgrammingSolver
+from src.genetic_algorithm import GeneticAlgorithm
+
+
+def _laps(strategies):
+    """
+    Voltas de todas as paradas de um conjunto de estratégias.
+    """
+    return [lap for strategy in strategies for lap, _ in strategy]
+
+
+def test_optimizers_stay_in_pit_window(simulator):
+    """
+    GA (população inicial e mutação) e ACO só param dentro da janela do modelo.
+    """
+    min_pit_lap, max_pit_lap = simulator.compile().pit_window()
+    
+    ga = GeneticAlgorithm(simulator, population_size=200, mutation_rate=1.0, seed=1)
+    population = ga.create_initial_population()
+    mutated = [ga.mutate(individual) for individual in population]
+    laps = _laps(individual.chromosome for individual in population + mutated)
+    
+    aco = AntColonyOptimizer(simulator, seed=1)
+    laps += _laps(ant.strategy for ant in aco.construct_colony(200))
+    
+    assert laps
+    assert min(laps) >= min_pit_lap
+    assert max(laps) <= max_pit_lap
+
+
+def test_dp_in_window_is_reachable(simulator):
+    """
+    O ótimo do DP na janela de paradas é uma estratégia que o GA pode gerar.
+    """
+    min_pit_lap, max_pit_lap = simulator.compile().pit_window()
+    with contextlib.redirect_stdout(io.StringIO()):
+        solution = DynamicProgrammingSolver(simulator, min_pit_lap=min_pit_lap, max_pit_lap=max_pit_lap).run()
+    
+    assert all(min_pit_lap <= lap <= max_pit_lap for lap, _ in solution.strategy)
\ No newline at end of file
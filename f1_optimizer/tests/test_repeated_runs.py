@@ -0,0 +1,38 @@
+import contextlib
+import io
+
+import pytest
+
+from src.ant_colony import AntColonyOptimizer
+from src.genetic_algorithm import create_genetic_algorithm
+
+
+@pytest.mark.parametrize('engine', ['object', 'array', 'steady_state'])
+def test_ga_second_run_starts_fresh(simulator, engine):
+    """
+    Um segundo run() na mesma instância reinicia todos os históricos juntos.
+    """
+    ga = create_genetic_algorithm(simulator, engine, population_size=12, generations=6, seed=4)
+    with contextlib.redirect_stdout(io.StringIO()):
+        ga.run()
+        first_length = len(ga.fitness_history)
+        best = ga.run()
+    
+    assert len(ga.fitness_history) == first_length
+    assert len(ga.fitness_history) == len(ga.evaluation_history)
+    assert best.fitness == max(ga.fitness_history)
+
+
+def test_aco_second_run_starts_fresh(simulator):
+    """
+    Um segundo run() do ACO reinicia feromônios, melhor formiga e históricos.
+    """
+    aco = AntColonyOptimizer(simulator, num_ants=10, iterations=5, seed=4)
+    with contextlib.redirect_stdout(io.StringIO()):
+        aco.run()
+        first_length = len(aco.fitness_history)
+        best = aco.run()
+    
+    assert len(aco.fitness_history) == first_length
+    assert len(aco.fitness_history) == len(aco.evaluation_history)
+    assert 1.0 / best.total_time == aco.fitness_history[-1]
\ No newline at end of file
@@ -0,0 +1,56 @@
+import contextlib
+import io
+
+from src.parallel_evaluation import ParallelEvaluator
+from src.steady_state_genetic_algorithm import SteadyStateGeneticAlgorithm
+
+
+def _run(simulator, workers):
+    """
+    Executa o GA steady-state com um pool de `workers` processos.
+    """
+    executor = ParallelEvaluator(simulator, max_workers=workers, min_batch_size=1)
+    try:
+        ga = SteadyStateGeneticAlgorithm(simulator, population_size=20, generations=15,
+                                         batch_size=3, max_in_flight=4, executor=executor, seed=11)
+        with contextlib.redirect_stdout(io.StringIO()):
+            best = ga.run()
+    finally:
+        executor.close()
+    return best.chromosome, best.fitness, ga.fitness_history
+
+
+def test_result_does_not_depend_on_worker_count(simulator):
+    """
+    Com a mesma semente e o mesmo max_in_flight, os lotes são inseridos na
+    ordem de envio e o resultado não depende do número de processos.
+    """
+    reference = _run(simulator, 1)
+    assert _run(simulator, 2) == reference
+    assert _run(simulator, 3) == reference
+
+def test_in_flight_chromosomes_are_evaluated_once(simulator):
+    """
+    Um cromossomo já em avaliação em um lote anterior não é reenviado: cada
+    cromossomo do cache é avaliado e contado uma única vez.
+    """
+    executor = ParallelEvaluator(simulator, max_workers=2, min_batch_size=1)
+    submitted = []
+    submit_strategies = executor.submit_strategies
+    
+    def recording_submit(batch):
+        submitted.extend(batch)
+        return submit_strategies(batch)
+    
+    executor.submit_strategies = recording_submit
+    try:
+        ga = SteadyStateGeneticAlgorithm(simulator, population_size=10, generations=30,
+                                         batch_size=4, max_in_flight=8, executor=executor, seed=3)
+        with contextlib.redirect_stdout(io.StringIO()):
+            ga.run()
+    finally:
+        executor.close()
+    
+    assert len(submitted) == len(set(submitted))
+    assert ga.evaluations == len(ga._fitness_cache)
+    assert not ga._in_flight